@@ -9,6 +9,7 @@ Validates smart router load balancing and cache efficiency.
 
 import asyncio
 import hashlib
+import itertools
 import random
 import time
 from dataclasses import dataclass, field
@@ -364,13 +365,18 @@ class KVCacheBenchmark:
             "You are a creative writer.",
         ]
 
+        # Cycle prefixes (creates natural grouping) with their worker IDs
+        # resolved once. Note: worker IDs are simulated since FakeAI doesn't
+        # expose them
+        prefix_cycle = itertools.cycle(
+            [(prefix, f"worker-{hash(prefix) % 4}") for prefix in prefixes]
+        )
+
         worker_stats = {}
         start_time = time.perf_counter()
 
         async with httpx.AsyncClient() as client:
-            for i in range(num_requests):
-                # Select prefix (creates natural grouping)
-                prefix = prefixes[i % len(prefixes)]
+            for i, (prefix, worker_id) in zip(range(num_requests), prefix_cycle):
                 messages = [
                     {"role": "system", "content": prefix},
                     {"role": "user", "content": f"Request {i}"},
@@ -378,9 +384,7 @@ class KVCacheBenchmark:
 
                 _, response = await self._make_chat_request(client, messages)
 
-                # Track worker distribution (if exposed in response)
-                # Note: This is simulated since FakeAI doesn't expose worker IDs
-                worker_id = f"worker-{hash(prefix) % 4}"
+                # Track worker distribution
                 worker_stats[worker_id] = worker_stats.get(worker_id, 0) + 1
 
         total_time = time.perf_counter() - start_time
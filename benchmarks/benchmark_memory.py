@@ -25,7 +25,7 @@ except ImportError:
     print("Warning: psutil not available. Install with: pip install psutil")
 
 
-@dataclass
+@dataclass(slots=True)
 class MemorySnapshot:
     """Memory usage snapshot at a point in time."""
 
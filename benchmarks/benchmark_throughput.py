@@ -8,6 +8,7 @@ Compares streaming vs non-streaming performance.
 #  SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import json
 import time
 from dataclasses import dataclass, field
 from typing import Any
@@ -44,16 +45,20 @@ class ThroughputBenchmark:
     def __init__(self, base_url: str = "http://localhost:8000", api_key: str = "test"):
         self.base_url = base_url
         self.api_key = api_key
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
         self.results: list[ThroughputResult] = []
 
     async def _make_request(
         self,
         client: httpx.AsyncClient,
-        payload: dict[str, Any],
+        body: bytes,
         streaming: bool = False,
     ) -> tuple[float, int]:
         """
-        Make a single request and measure latency.
+        Make a single request with a pre-serialized JSON body and measure latency.
 
         Returns:
             (latency_seconds, token_count)
@@ -66,20 +71,28 @@ class ThroughputBenchmark:
                 async with client.stream(
                     "POST",
                     f"{self.base_url}/v1/chat/completions",
-                    json=payload,
-                    headers={"Authorization": f"Bearer {self.api_key}"},
+                    content=body,
+                    headers=self.headers,
                     timeout=60.0,
                 ) as response:
                     response.raise_for_status()
-                    async for line in response.aiter_lines():
-                        if line.startswith("data: ") and not line.endswith("[DONE]"):
-                            # Count tokens in streaming response
-                            tokens += 1
+                    # Count SSE events on the raw bytes rather than decoding and
+                    # splitting every line. Event JSON never contains a raw
+                    # newline, so "\ndata: " only matches at an event start; the
+                    # carried tail catches markers split across reads.
+                    tail = end = b"\n"
+                    async for chunk in response.aiter_bytes():
+                        buf = tail + chunk
+                        tokens += buf.count(b"\ndata: ")
+                        tail = buf[-6:]
+                        end = (end + chunk)[-16:]
+                    if end.rstrip().endswith(b"data: [DONE]"):
+                        tokens -= 1
             else:
                 response = await client.post(
                     f"{self.base_url}/v1/chat/completions",
-                    json=payload,
-                    headers={"Authorization": f"Bearer {self.api_key}"},
+                    content=body,
+                    headers=self.headers,
                     timeout=60.0,
                 )
                 response.raise_for_status()
@@ -130,11 +143,13 @@ class ThroughputBenchmark:
         failed = 0
 
         semaphore = asyncio.Semaphore(concurrent_limit)
+        # Every request sends the same payload, so serialize it once
+        body = json.dumps(payload).encode("utf-8")
 
         async def bounded_request(client: httpx.AsyncClient):
             """Make a request with concurrency limit."""
             async with semaphore:
-                latency, tokens = await self._make_request(client, payload, streaming)
+                latency, tokens = await self._make_request(client, body, streaming)
                 return latency, tokens
 
         start_time = time.perf_counter()
@@ -392,10 +392,16 @@ class ProgressTracker:
         self.current = 0
         self.description = description
         self.start_time = time.perf_counter()
+        self._last_percent = -1
 
     def update(self, increment: int = 1):
-        """Update progress."""
+        """Update progress, redrawing at most once per whole percent."""
         self.current += increment
+        if self.total and self.current < self.total:
+            percent = self.current * 100 // self.total
+            if percent == self._last_percent:
+                return
+            self._last_percent = percent
         self._print_progress()
 
     def _print_progress(self):
@@ -120,7 +120,8 @@ wait_for_redis() {
         RETRY_COUNT=0
 
         while [ $RETRY_COUNT -lt $MAX_RETRIES ]; do
-            if timeout 1 bash -c "cat < /dev/null > /dev/tcp/$REDIS_HOST/$REDIS_PORT" 2>/dev/null; then
+            # The no-op builtin just opens (and closes) the TCP connection
+            if timeout 1 bash -c ": > /dev/tcp/$REDIS_HOST/$REDIS_PORT" 2>/dev/null; then
                 log_info "Redis is ready!"
                 return 0
             fi
@@ -135,23 +136,6 @@ wait_for_redis() {
     fi
 }
 
-# Function to handle graceful shutdown
-graceful_shutdown() {
-    log_info "Received shutdown signal, stopping server gracefully..."
-
-    # Send SIGTERM to all child processes
-    if [ -n "$SERVER_PID" ]; then
-        kill -TERM "$SERVER_PID" 2>/dev/null || true
-        wait "$SERVER_PID" 2>/dev/null || true
-    fi
-
-    log_info "Server stopped"
-    exit 0
-}
-
-# Set up signal handlers
-trap graceful_shutdown SIGTERM SIGINT SIGQUIT
-
 # Main execution
 main() {
     # Validate configuration
@@ -168,12 +152,9 @@ main() {
     echo "========================================="
     echo ""
 
-    # Execute the command passed to the container
-    exec "$@" &
-    SERVER_PID=$!
-
-    # Wait for the server process
-    wait "$SERVER_PID"
+    # Replace this shell with the command passed to the container so the
+    # server receives SIGTERM/SIGINT directly and handles its own shutdown
+    exec "$@"
 }
 
 # Run main function
@@ -15,6 +15,16 @@ from typing import Any, Dict
 
 import aiohttp
 
+# Endpoints whose rates feed the AIPerf metrics, in order of preference
+_AIPERF_ENDPOINTS = ("/v1/chat/completions", "/v1/completions")
+
+# (metrics section, AIPerf field) pairs summed over _AIPERF_ENDPOINTS
+_RATE_SECTIONS = (
+    ("requests", "requests_per_second"),
+    ("responses", "responses_per_second"),
+    ("tokens", "tokens_per_second"),
+)
+
 
 async def get_metrics(url="http://localhost:8000") -> Dict[str, Any]:
     """Get metrics from the FakeAI server."""
@@ -44,33 +54,23 @@ def format_aiperf_metrics(metrics: Dict[str, Any]) -> Dict[str, Any]:
         "average_response_time": 0.0,
     }
 
-    # Extract requests per second
-    if "requests" in metrics:
-        for endpoint, stats in metrics["requests"].items():
-            if endpoint == "/v1/chat/completions" and "rate" in stats:
-                result["requests_per_second"] += stats["rate"]
-            if endpoint == "/v1/completions" and "rate" in stats:
-                result["requests_per_second"] += stats["rate"]
-
-    # Extract responses per second
-    if "responses" in metrics:
-        for endpoint, stats in metrics["responses"].items():
-            if endpoint == "/v1/chat/completions" and "rate" in stats:
-                result["responses_per_second"] += stats["rate"]
-                if "avg" in stats:
-                    result["average_response_time"] = stats["avg"]
-            if endpoint == "/v1/completions" and "rate" in stats:
-                result["responses_per_second"] += stats["rate"]
-                if "avg" in stats and result["average_response_time"] == 0.0:
-                    result["average_response_time"] = stats["avg"]
-
-    # Extract tokens per second
-    if "tokens" in metrics:
-        for endpoint, stats in metrics["tokens"].items():
-            if endpoint == "/v1/chat/completions" and "rate" in stats:
-                result["tokens_per_second"] += stats["rate"]
-            if endpoint == "/v1/completions" and "rate" in stats:
-                result["tokens_per_second"] += stats["rate"]
+    # Requests, responses and tokens are all summed over the same two
+    # endpoints, so drive them from one table instead of three copies
+    for section, key in _RATE_SECTIONS:
+        stats_by_endpoint = metrics.get(section, {})
+        for endpoint in _AIPERF_ENDPOINTS:
+            stats = stats_by_endpoint.get(endpoint, {})
+            if "rate" in stats:
+                result[key] += stats["rate"]
+
+    # Average response time comes from chat completions, falling back to
+    # completions when chat has no latency
+    responses = metrics.get("responses", {})
+    for endpoint in _AIPERF_ENDPOINTS:
+        stats = responses.get(endpoint, {})
+        if "rate" in stats and "avg" in stats:
+            result["average_response_time"] = stats["avg"]
+            break
 
     # AIPerf specific metrics - use approximate values
     if "tokens_per_second" in result and result["tokens_per_second"] > 0:
@@ -85,7 +85,7 @@ async def make_single_request(
     Returns:
         (success, latency_ms, error_message)
     """
-    start = time.time()
+    start = time.perf_counter()
 
     try:
         response = await client.chat.completions.create(
@@ -93,11 +93,11 @@ async def make_single_request(
             messages=[{"role": "user", "content": message}],
         )
 
-        latency = (time.time() - start) * 1000
+        latency = (time.perf_counter() - start) * 1000
         return True, latency, ""
 
     except Exception as e:
-        latency = (time.time() - start) * 1000
+        latency = (time.perf_counter() - start) * 1000
         return False, latency, str(e)
 
 
@@ -151,7 +151,7 @@ async def load_test_concurrent(
             latencies.append(latency)
 
     # Start timer
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # Create all tasks
     tasks = [make_request_with_semaphore(i) for i in range(num_requests)]
@@ -160,7 +160,7 @@ async def load_test_concurrent(
     await asyncio.gather(*tasks)
 
     # Calculate metrics
-    total_time = time.time() - start_time
+    total_time = time.perf_counter() - start_time
     rps = num_requests / total_time if total_time > 0 else 0
 
     return LoadTestResult(
@@ -257,7 +257,7 @@ async def demonstrate_streaming_vs_nonstreaming():
 
     # Test non-streaming
     print("Non-streaming (20 requests)...")
-    start = time.time()
+    start = time.perf_counter()
 
     for i in range(num_requests):
         await client.chat.completions.create(
@@ -266,11 +266,11 @@ async def demonstrate_streaming_vs_nonstreaming():
             stream=False,
         )
 
-    non_streaming_time = time.time() - start
+    non_streaming_time = time.perf_counter() - start
 
     # Test streaming
     print("Streaming (20 requests)...")
-    start = time.time()
+    start = time.perf_counter()
 
     for i in range(num_requests):
         stream = await client.chat.completions.create(
@@ -283,7 +283,7 @@ async def demonstrate_streaming_vs_nonstreaming():
         async for _ in stream:
             pass
 
-    streaming_time = time.time() - start
+    streaming_time = time.perf_counter() - start
 
     print()
     print("Results:")
@@ -320,7 +320,7 @@ async def demonstrate_cache_performance():
     tasks = []
     client = AsyncOpenAI(api_key="test-key", base_url=BASE_URL)
 
-    start = time.time()
+    start = time.perf_counter()
     for i in range(50):
         task = client.chat.completions.create(
             model="openai/gpt-oss-120b",
@@ -332,7 +332,7 @@ async def demonstrate_cache_performance():
         tasks.append(task)
 
     responses = await asyncio.gather(*tasks)
-    no_cache_time = time.time() - start
+    no_cache_time = time.perf_counter() - start
 
     # Calculate cache stats
     cached_tokens_sum = sum(
@@ -350,7 +350,7 @@ async def demonstrate_cache_performance():
     print("-" * 80)
 
     tasks = []
-    start = time.time()
+    start = time.perf_counter()
 
     for i in range(50):
         task = client.chat.completions.create(
@@ -363,7 +363,7 @@ async def demonstrate_cache_performance():
         tasks.append(task)
 
     responses = await asyncio.gather(*tasks)
-    cache_time = time.time() - start
+    cache_time = time.perf_counter() - start
 
     # Calculate cache stats
     cached_tokens_sum = sum(
@@ -400,7 +400,7 @@ async def demonstrate_rate_limiting():
     )
 
     # Send burst
-    start = time.time()
+    start = time.perf_counter()
     tasks = []
 
     for i in range(100):
@@ -412,7 +412,7 @@ async def demonstrate_rate_limiting():
 
     try:
         await asyncio.gather(*tasks)
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
         print(f"✓ All 100 requests completed in {elapsed:.2f}s")
         print(f"  Throughput: {100/elapsed:.2f} requests/second")
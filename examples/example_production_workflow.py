@@ -39,7 +39,7 @@ class MessageType(Enum):
     TOOL = "tool"
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestMetrics:
     """Metrics for a single request."""
 
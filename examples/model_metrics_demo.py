@@ -13,21 +13,26 @@ Usage:
 """
 
 import json
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
+from requests.adapters import HTTPAdapter
 
 BASE_URL = "http://localhost:8000"
 API_KEY = "test-key"
 
 headers = {"Authorization": f"Bearer {API_KEY}", "Content-Type": "application/json"}
 
+# One pooled session so every call reuses keep-alive connections
+session = requests.Session()
+session.headers.update(headers)
+session.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
 
 def make_chat_request(model: str, prompt: str):
     """Make a chat completion request."""
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/v1/chat/completions",
-        headers=headers,
         json={
             "model": model,
             "messages": [{"role": "user", "content": prompt}],
@@ -39,9 +44,8 @@ def make_chat_request(model: str, prompt: str):
 
 def make_embedding_request(model: str, text: str):
     """Make an embedding request."""
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/v1/embeddings",
-        headers=headers,
         json={"model": model, "input": text},
     )
     return response.json()
@@ -49,19 +53,19 @@ def make_embedding_request(model: str, text: str):
 
 def get_model_metrics(model: str):
     """Get metrics for a specific model."""
-    response = requests.get(f"{BASE_URL}/metrics/by-model/{model}")
+    response = session.get(f"{BASE_URL}/metrics/by-model/{model}")
     return response.json()
 
 
 def get_all_model_metrics():
     """Get metrics for all models."""
-    response = requests.get(f"{BASE_URL}/metrics/by-model")
+    response = session.get(f"{BASE_URL}/metrics/by-model")
     return response.json()
 
 
 def compare_models(model1: str, model2: str):
     """Compare two models."""
-    response = requests.get(
+    response = session.get(
         f"{BASE_URL}/metrics/compare", params={"model1": model1, "model2": model2}
     )
     return response.json()
@@ -69,7 +73,7 @@ def compare_models(model1: str, model2: str):
 
 def get_model_ranking(metric: str = "request_count"):
     """Get model ranking by metric."""
-    response = requests.get(
+    response = session.get(
         f"{BASE_URL}/metrics/ranking", params={"metric": metric, "limit": 10}
     )
     return response.json()
@@ -77,13 +81,13 @@ def get_model_ranking(metric: str = "request_count"):
 
 def get_costs():
     """Get cost breakdown by model."""
-    response = requests.get(f"{BASE_URL}/metrics/costs")
+    response = session.get(f"{BASE_URL}/metrics/costs")
     return response.json()
 
 
 def get_prometheus_metrics():
     """Get Prometheus metrics."""
-    response = requests.get(f"{BASE_URL}/metrics/by-model/prometheus")
+    response = session.get(f"{BASE_URL}/metrics/by-model/prometheus")
     return response.text
 
 
@@ -98,11 +102,18 @@ def main():
     print("-" * 80)
 
     models = ["gpt-4", "gpt-3.5-turbo", "openai/gpt-oss-120b"]
-    for model in models:
-        print(f"   Requesting {model}...")
-        for i in range(3):
-            make_chat_request(model, f"Hello! This is test {i+1}")
-            time.sleep(0.1)
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = []
+        for model in models:
+            print(f"   Requesting {model}...")
+            for i in range(3):
+                futures.append(
+                    executor.submit(
+                        make_chat_request, model, f"Hello! This is test {i+1}"
+                    )
+                )
+        for future in as_completed(futures):
+            future.result()
 
     print("   Done!")
     print()
@@ -110,16 +121,32 @@ def main():
     # 2. Make embedding requests
     print("2. Making embedding requests...")
     print("-" * 80)
-    for i in range(2):
-        make_embedding_request("text-embedding-ada-002", "Test embedding text")
-        time.sleep(0.1)
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = [
+            executor.submit(
+                make_embedding_request, "text-embedding-ada-002", "Test embedding text"
+            )
+            for _ in range(2)
+        ]
+        for future in as_completed(futures):
+            future.result()
     print("   Done!")
     print()
 
+    # Fetch every metrics view concurrently; the sections below print them in order
+    executor = ThreadPoolExecutor(max_workers=6)
+    gpt4_future = executor.submit(get_model_metrics, "gpt-4")
+    all_metrics_future = executor.submit(get_all_model_metrics)
+    comparison_future = executor.submit(compare_models, "gpt-4", "gpt-3.5-turbo")
+    ranking_future = executor.submit(get_model_ranking, "request_count")
+    costs_future = executor.submit(get_costs)
+    prometheus_future = executor.submit(get_prometheus_metrics)
+    executor.shutdown(wait=False)
+
     # 3. Get metrics for a specific model
     print("3. Metrics for gpt-4:")
     print("-" * 80)
-    gpt4_metrics = get_model_metrics("gpt-4")
+    gpt4_metrics = gpt4_future.result()
     print(f"   Request count: {gpt4_metrics['request_count']}")
     print(f"   Total tokens: {gpt4_metrics['tokens']['total']}")
     print(f"   Average latency: {gpt4_metrics['latency']['avg_ms']:.2f}ms")
@@ -130,7 +157,7 @@ def main():
     # 4. Get all model metrics
     print("4. Metrics for all models:")
     print("-" * 80)
-    all_metrics = get_all_model_metrics()
+    all_metrics = all_metrics_future.result()
     for model_id, metrics in all_metrics.items():
         print(f"   {model_id}:")
         print(f"      Requests: {metrics['request_count']}")
@@ -141,7 +168,7 @@ def main():
     # 5. Compare two models
     print("5. Compare gpt-4 vs gpt-3.5-turbo:")
     print("-" * 80)
-    comparison = compare_models("gpt-4", "gpt-3.5-turbo")
+    comparison = comparison_future.result()
     print(f"   Request count:")
     print(f"      gpt-4: {comparison['comparison']['request_count']['model1']}")
     print(f"      gpt-3.5-turbo: {comparison['comparison']['request_count']['model2']}")
@@ -165,7 +192,7 @@ def main():
     # 6. Get model ranking
     print("6. Model ranking by request count:")
     print("-" * 80)
-    ranking = get_model_ranking("request_count")
+    ranking = ranking_future.result()
     for i, model_stats in enumerate(ranking[:5], 1):
         print(
             f"   {i}. {model_stats['model']}: {model_stats['request_count']} requests"
@@ -175,7 +202,7 @@ def main():
     # 7. Get cost breakdown
     print("7. Cost breakdown by model:")
     print("-" * 80)
-    costs = get_costs()
+    costs = costs_future.result()
     print(f"   Total cost: ${costs['total_cost_usd']:.6f}")
     print("   By model:")
     for model_id, cost in sorted(
@@ -187,7 +214,7 @@ def main():
     # 8. Show Prometheus metrics sample
     print("8. Prometheus metrics (sample):")
     print("-" * 80)
-    prometheus = get_prometheus_metrics()
+    prometheus = prometheus_future.result()
     lines = prometheus.split("\n")
     for line in lines[:20]:  # Show first 20 lines
         if line and not line.startswith("#"):
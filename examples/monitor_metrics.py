@@ -7,12 +7,20 @@ This script demonstrates how to monitor FakeAI server metrics in real-time.
 #  SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import json
 import sys
 import time
 from datetime import datetime
 
 import aiohttp
 
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 
 def print_header():
     """Print header for metrics display."""
@@ -57,7 +65,7 @@ async def monitor_basic(base_url="http://localhost:8000", interval=5):
                         f"{base_url}/health/detailed",
                         timeout=aiohttp.ClientTimeout(total=5),
                     ) as response:
-                        health = await response.json()
+                        health = json_loads(await response.read())
 
                     # Clear line
                     print("\r" + " " * 80 + "\r", end="")
@@ -114,7 +122,7 @@ async def monitor_detailed(base_url="http://localhost:8000", interval=5):
                         f"{base_url}/health/detailed",
                         timeout=aiohttp.ClientTimeout(total=5),
                     ) as response:
-                        health = await response.json()
+                        health = json_loads(await response.read())
 
                     # Print timestamp
                     print(
@@ -195,7 +203,7 @@ async def monitor_streaming(base_url="http://localhost:8000", interval=5):
                     async with session.get(
                         f"{base_url}/metrics", timeout=aiohttp.ClientTimeout(total=5)
                     ) as response:
-                        data = await response.json()
+                        data = json_loads(await response.read())
 
                     streaming = data.get("streaming_stats", {})
 
@@ -11,12 +11,18 @@ import time
 
 import aiohttp
 
+try:
+    import orjson
 
-async def get_metrics(url="http://localhost:8000"):
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+
+async def get_metrics(session, url="http://localhost:8000"):
     """Get metrics from the FakeAI server."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get(f"{url}/metrics") as response:
-            return await response.json()
+    async with session.get(f"{url}/metrics") as response:
+        return json_loads(await response.read())
 
 
 def print_metrics(metrics):
@@ -68,10 +74,10 @@ async def test_metrics():
             json=data,
         ) as response:
             print(f"Chat completions streaming response status: {response.status}")
-            # Consume the stream
-            async for line in response.content:
-                if line and line.strip():
-                    pass
+            # Drain the stream in raw chunks; nothing here inspects the
+            # events, so there is no point splitting and stripping lines
+            async for _ in response.content.iter_any():
+                pass
 
         # Make a request to the completions endpoint
         print("Testing completions endpoint...")
@@ -102,13 +108,10 @@ async def test_metrics():
         ) as response:
             print(f"Embeddings response status: {response.status}")
 
-    # Wait a moment for metrics to be updated
-    print("Waiting for metrics to be updated...")
-    await asyncio.sleep(2)
-
-    # Get and print metrics
-    metrics = await get_metrics()
-    print_metrics(metrics)
+        # No settle delay needed: the server middleware records each response
+        # before it is sent, so every request above is already counted
+        metrics = await get_metrics(session, base_url)
+        print_metrics(metrics)
 
 
 if __name__ == "__main__":
@@ -11,6 +11,7 @@ This script shows how to:
 import asyncio
 import time
 
+import httpx
 from openai import OpenAI
 
 
@@ -79,13 +80,26 @@ async def main():
     print("=" * 70)
     print()
 
+    # The usage and cost queries are independent, so issue them together and
+    # print the results in order once they are all back
+    query = f"start_time={start_time}&end_time={end_time}&bucket_width=1h"
+    async with httpx.AsyncClient(
+        base_url="http://localhost:8000/v1/organization",
+        headers={"Authorization": "Bearer test-key"},
+        timeout=10.0,
+    ) as http:
+        completions_response, embeddings_response, costs_response = (
+            await asyncio.gather(
+                http.get(f"/usage/completions?{query}"),
+                http.get(f"/usage/embeddings?{query}"),
+                http.get(f"/costs?{query}"),
+            )
+        )
+
     # 4. Query completions usage
     print("4. Completions Usage:")
-    response = client.get(
-        f"http://localhost:8000/v1/organization/usage/completions?start_time={start_time}&end_time={end_time}&bucket_width=1h"
-    )
-    if response.status_code == 200:
-        usage_data = response.json()
+    if completions_response.status_code == 200:
+        usage_data = completions_response.json()
         for bucket in usage_data.get("data", []):
             for result in bucket.get("results", []):
                 print(f"   - Input tokens: {result['input_tokens']}")
@@ -95,11 +109,8 @@ async def main():
 
     # 5. Query embeddings usage
     print("5. Embeddings Usage:")
-    response = client.get(
-        f"http://localhost:8000/v1/organization/usage/embeddings?start_time={start_time}&end_time={end_time}&bucket_width=1h"
-    )
-    if response.status_code == 200:
-        usage_data = response.json()
+    if embeddings_response.status_code == 200:
+        usage_data = embeddings_response.json()
         for bucket in usage_data.get("data", []):
             for result in bucket.get("results", []):
                 print(f"   - Input tokens: {result['input_tokens']}")
@@ -108,11 +119,8 @@ async def main():
 
     # 6. Query costs
     print("6. Cost Breakdown:")
-    response = client.get(
-        f"http://localhost:8000/v1/organization/costs?start_time={start_time}&end_time={end_time}&bucket_width=1h"
-    )
-    if response.status_code == 200:
-        cost_data = response.json()
+    if costs_response.status_code == 200:
+        cost_data = costs_response.json()
         total_cost = 0.0
         for bucket in cost_data.get("data", []):
             print(f"   Time bucket: {bucket['start_time']} - {bucket['end_time']}")
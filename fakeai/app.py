@@ -272,7 +272,7 @@ async def log_requests(request: Request, call_next):
     logger.debug(
         "Request %s: %s %s from %s", request_id, request.method, endpoint, client_ip
     )
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # Track the request in the metrics
     metrics_tracker.track_request(endpoint)
@@ -402,7 +402,7 @@ async def log_requests(request: Request, call_next):
     # Process the request
     try:
         response = await call_next(request)
-        process_time = time.time() - start_time
+        process_time = time.perf_counter() - start_time
         process_time_ms = process_time * 1000
 
         # Track the response in the metrics
@@ -530,7 +530,7 @@ async def create_chat_completion(
     authorization: Annotated[str | None, Header(alias="Authorization")] = None,
 ):
     """Create a chat completion"""
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # Extract user from API key
     user = None
@@ -552,7 +552,7 @@ async def create_chat_completion(
         response = await fakeai_service.create_chat_completion(request)
 
         # Track per-model metrics
-        latency_ms = (time.time() - start_time) * 1000
+        latency_ms = (time.perf_counter() - start_time) * 1000
         model_metrics_tracker.track_request(
             model=request.model,
             endpoint="/v1/chat/completions",
@@ -575,7 +575,7 @@ async def create_completion(
     authorization: Annotated[str | None, Header(alias="Authorization")] = None,
 ):
     """Create a completion"""
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # Extract user from API key
     user = None
@@ -597,7 +597,7 @@ async def create_completion(
         response = await fakeai_service.create_completion(request)
 
         # Track per-model metrics
-        latency_ms = (time.time() - start_time) * 1000
+        latency_ms = (time.perf_counter() - start_time) * 1000
         model_metrics_tracker.track_request(
             model=request.model,
             endpoint="/v1/completions",
@@ -618,7 +618,7 @@ async def create_embedding(
     authorization: Annotated[str | None, Header(alias="Authorization")] = None,
 ) -> EmbeddingResponse:
     """Create embeddings"""
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # Extract user from API key
     user = None
@@ -628,7 +628,7 @@ async def create_embedding(
     response = await fakeai_service.create_embedding(request)
 
     # Track per-model metrics
-    latency_ms = (time.time() - start_time) * 1000
+    latency_ms = (time.perf_counter() - start_time) * 1000
     model_metrics_tracker.track_request(
         model=request.model,
         endpoint="/v1/embeddings",
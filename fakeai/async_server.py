@@ -241,26 +241,28 @@ class AsyncCache:
 
 async def async_batch_processor(items: list, process_func, batch_size: int = 10):
     """
-    Process items in batches asynchronously.
+    Process items concurrently with at most batch_size in flight.
+
+    A new item starts as soon as any running one finishes, so a slow item
+    never holds back the rest of its batch.
 
     Args:
         items: Items to process
         process_func: Async function to process each item
-        batch_size: Items per batch
+        batch_size: Maximum number of items processed at once
 
     Returns:
-        List of results
+        List of results, in the same order as items
     """
-    results = []
+    semaphore = asyncio.Semaphore(batch_size)
 
-    for i in range(0, len(items), batch_size):
-        batch = items[i : i + batch_size]
-        batch_results = await asyncio.gather(
-            *[process_func(item) for item in batch], return_exceptions=True
-        )
-        results.extend(batch_results)
+    async def bounded(item):
+        async with semaphore:
+            return await process_func(item)
 
-    return results
+    return await asyncio.gather(
+        *[bounded(item) for item in items], return_exceptions=True
+    )
 
 
 def get_event_loop_type():
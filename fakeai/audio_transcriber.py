@@ -98,6 +98,7 @@ SUPPORTED_LANGUAGES = {
     "ms": "malay",
     "tl": "tagalog",
 }
+_LANGUAGE_CODES = tuple(SUPPORTED_LANGUAGES)
 
 
 class AudioTranscriber:
@@ -332,10 +333,9 @@ class AudioTranscriber:
         hash_int = int(audio_hash[:8], 16)
 
         # Use hash to pick a language consistently
-        language_codes = list(SUPPORTED_LANGUAGES.keys())
-        selected_idx = hash_int % len(language_codes)
+        selected_idx = hash_int % len(_LANGUAGE_CODES)
 
-        return language_codes[selected_idx]
+        return _LANGUAGE_CODES[selected_idx]
 
     def _generate_transcript(
         self,
@@ -124,14 +124,15 @@ class BatchLifecycleMetrics:
             }
 
         latencies = np.array(self.request_latencies)
+        p50, p90, p95, p99 = np.percentile(latencies, (50, 90, 95, 99))
         return {
             "min": float(np.min(latencies)),
             "max": float(np.max(latencies)),
             "avg": float(np.mean(latencies)),
-            "p50": float(np.percentile(latencies, 50)),
-            "p90": float(np.percentile(latencies, 90)),
-            "p95": float(np.percentile(latencies, 95)),
-            "p99": float(np.percentile(latencies, 99)),
+            "p50": float(p50),
+            "p90": float(p90),
+            "p95": float(p95),
+            "p99": float(p99),
         }
 
     def get_token_statistics(self) -> dict[str, float]:
@@ -147,13 +148,14 @@ class BatchLifecycleMetrics:
             }
 
         tokens = np.array(self.request_token_counts)
+        p50, p90 = np.percentile(tokens, (50, 90))
         return {
             "total": int(np.sum(tokens)),
             "min": int(np.min(tokens)),
             "max": int(np.max(tokens)),
             "avg": float(np.mean(tokens)),
-            "p50": float(np.percentile(tokens, 50)),
-            "p90": float(np.percentile(tokens, 90)),
+            "p50": float(p50),
+            "p90": float(p90),
         }
 
     def calculate_batch_efficiency(self) -> float:
@@ -553,15 +555,16 @@ class BatchMetricsTracker:
             }
 
         arr = np.array(values)
+        p50, p90, p95, p99 = np.percentile(arr, (50, 90, 95, 99))
         return {
             "count": len(values),
             "min": float(np.min(arr)),
             "max": float(np.max(arr)),
             "avg": float(np.mean(arr)),
-            "p50": float(np.percentile(arr, 50)),
-            "p90": float(np.percentile(arr, 90)),
-            "p95": float(np.percentile(arr, 95)),
-            "p99": float(np.percentile(arr, 99)),
+            "p50": float(p50),
+            "p90": float(p90),
+            "p95": float(p95),
+            "p99": float(p99),
         }
 
     def _simulate_memory_usage(self, num_requests: int) -> float:
@@ -15,6 +15,16 @@ from pydantic import Field
 
 from fakeai.config import AppConfig
 
+# Server responses are decoded from the raw body bytes (both parsers accept
+# bytes, so there is no intermediate str), with orjson when it is installed;
+# it is not a dependency, so fall back to the standard library otherwise
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 
 def parse_latency_spec(spec: str) -> tuple[float, float]:
     """
@@ -672,7 +682,7 @@ def status(
                     f"{base_url}/health", timeout=aiohttp.ClientTimeout(total=5)
                 ) as response:
                     response.raise_for_status()
-                    health_data = await response.json()
+                    health_data = json_loads(await response.read())
 
                     print("=" * 70)
                     print("FakeAI Server Status")
@@ -768,122 +778,112 @@ def metrics(
         $ fakeai metrics --watch
     """
     import asyncio
-    import time as time_module
 
     import aiohttp
 
     base_url = f"http://{host}:{port}"
+    export_formats = {"prometheus": "Prometheus", "csv": "CSV"}
 
-    async def fetch_and_display():
+    async def fetch_and_display(session):
         try:
-            async with aiohttp.ClientSession() as session:
+            if format in export_formats:
+                # Exported formats come straight from the server; the JSON
+                # snapshot is not used for them, so don't fetch it first
                 async with session.get(
-                    f"{base_url}/metrics", timeout=aiohttp.ClientTimeout(total=5)
-                ) as response:
-                    response.raise_for_status()
-                    metrics_data = await response.json()
-
-                    if format == "json":
-                        print(json.dumps(metrics_data, indent=2))
-                    elif format == "prometheus":
-                        # Fetch Prometheus format
-                        async with session.get(
-                            f"{base_url}/metrics?format=prometheus",
-                            timeout=aiohttp.ClientTimeout(total=5),
-                        ) as prom_response:
-                            if prom_response.status == 200:
-                                print(await prom_response.text())
-                            else:
-                                print(
-                                    "ERROR: Prometheus format not supported by this server version",
-                                    file=sys.stderr,
-                                )
-                                sys.exit(1)
-                    elif format == "csv":
-                        # Fetch CSV format
-                        async with session.get(
-                            f"{base_url}/metrics?format=csv",
-                            timeout=aiohttp.ClientTimeout(total=5),
-                        ) as csv_response:
-                            if csv_response.status == 200:
-                                print(await csv_response.text())
-                            else:
-                                print(
-                                    "ERROR: CSV format not supported by this server version",
-                                    file=sys.stderr,
-                                )
-                                sys.exit(1)
-                    else:  # pretty format
-                        print("=" * 70)
-                        print("FakeAI Server Metrics")
-                        print("=" * 70)
+                    f"{base_url}/metrics?format={format}",
+                    timeout=aiohttp.ClientTimeout(total=5),
+                ) as export_response:
+                    if export_response.status == 200:
+                        print(await export_response.text())
+                    else:
+                        print(
+                            f"ERROR: {export_formats[format]} format not supported by this server version",
+                            file=sys.stderr,
+                        )
+                        sys.exit(1)
+                return
 
-                        # Requests
-                        if "requests" in metrics_data and metrics_data["requests"]:
-                            print("\nRequests per second:")
-                            for endpoint, stats in metrics_data["requests"].items():
-                                if stats["rate"] > 0:
-                                    print(f"  {endpoint}: {stats['rate']:.2f}")
+            async with session.get(
+                f"{base_url}/metrics", timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                response.raise_for_status()
+                metrics_data = json_loads(await response.read())
 
-                        # Responses
-                        if "responses" in metrics_data and metrics_data["responses"]:
-                            print("\nResponses per second (with latency):")
-                            for endpoint, stats in metrics_data["responses"].items():
-                                if stats["rate"] > 0:
-                                    print(
-                                        f"  {endpoint}: {stats['rate']:.2f} (avg: {stats['avg']*1000:.2f}ms, p99: {stats['p99']*1000:.2f}ms)"
-                                    )
-
-                        # Tokens
-                        if "tokens" in metrics_data and metrics_data["tokens"]:
-                            print("\nTokens per second:")
-                            for endpoint, stats in metrics_data["tokens"].items():
-                                if stats["rate"] > 0:
-                                    print(f"  {endpoint}: {stats['rate']:.2f}")
+                if format == "json":
+                    print(json.dumps(metrics_data, indent=2))
+                else:  # pretty format
+                    # Collect the report and write it in one go, so a --watch
+                    # refresh draws the whole screen at once
+                    lines = ["=" * 70, "FakeAI Server Metrics", "=" * 70]
+
+                    # Requests
+                    requests = metrics_data.get("requests")
+                    if requests:
+                        lines.append("\nRequests per second:")
+                        for endpoint, stats in requests.items():
+                            if stats["rate"] > 0:
+                                lines.append(f"  {endpoint}: {stats['rate']:.2f}")
+
+                    # Responses
+                    responses = metrics_data.get("responses")
+                    if responses:
+                        lines.append("\nResponses per second (with latency):")
+                        for endpoint, stats in responses.items():
+                            if stats["rate"] > 0:
+                                lines.append(
+                                    f"  {endpoint}: {stats['rate']:.2f} (avg: {stats['avg']*1000:.2f}ms, p99: {stats['p99']*1000:.2f}ms)"
+                                )
 
-                        # Errors
-                        if "errors" in metrics_data and metrics_data["errors"]:
-                            has_errors = any(
-                                stats["rate"] > 0
-                                for stats in metrics_data["errors"].values()
+                    # Tokens
+                    tokens = metrics_data.get("tokens")
+                    if tokens:
+                        lines.append("\nTokens per second:")
+                        for endpoint, stats in tokens.items():
+                            if stats["rate"] > 0:
+                                lines.append(f"  {endpoint}: {stats['rate']:.2f}")
+
+                    # Errors
+                    errors = metrics_data.get("errors")
+                    if errors:
+                        has_errors = any(stats["rate"] > 0 for stats in errors.values())
+                        if has_errors:
+                            lines.append("\nErrors per second:")
+                            for endpoint, stats in errors.items():
+                                if stats["rate"] > 0:
+                                    lines.append(f"  {endpoint}: {stats['rate']:.2f}")
+
+                    # Streaming stats
+                    stream_stats = metrics_data.get("streaming_stats")
+                    if stream_stats:
+                        if (
+                            stream_stats.get("active_streams", 0) > 0
+                            or stream_stats.get("completed_streams", 0) > 0
+                        ):
+                            lines.append("\nStreaming Statistics:")
+                            lines.append(
+                                f"  Active streams: {stream_stats.get('active_streams', 0)}"
+                            )
+                            lines.append(
+                                f"  Completed streams: {stream_stats.get('completed_streams', 0)}"
+                            )
+                            lines.append(
+                                f"  Failed streams: {stream_stats.get('failed_streams', 0)}"
                             )
-                            if has_errors:
-                                print("\nErrors per second:")
-                                for endpoint, stats in metrics_data["errors"].items():
-                                    if stats["rate"] > 0:
-                                        print(f"  {endpoint}: {stats['rate']:.2f}")
-
-                        # Streaming stats
-                        if "streaming_stats" in metrics_data:
-                            stream_stats = metrics_data["streaming_stats"]
-                            if (
-                                stream_stats.get("active_streams", 0) > 0
-                                or stream_stats.get("completed_streams", 0) > 0
-                            ):
-                                print("\nStreaming Statistics:")
-                                print(
-                                    f"  Active streams: {stream_stats.get('active_streams', 0)}"
-                                )
-                                print(
-                                    f"  Completed streams: {stream_stats.get('completed_streams', 0)}"
-                                )
-                                print(
-                                    f"  Failed streams: {stream_stats.get('failed_streams', 0)}"
-                                )
 
-                                if stream_stats.get("ttft"):
-                                    ttft = stream_stats["ttft"]
-                                    print(
-                                        f"  TTFT: avg={ttft['avg']*1000:.2f}ms, p50={ttft['p50']*1000:.2f}ms, p99={ttft['p99']*1000:.2f}ms"
-                                    )
+                            if stream_stats.get("ttft"):
+                                ttft = stream_stats["ttft"]
+                                lines.append(
+                                    f"  TTFT: avg={ttft['avg']*1000:.2f}ms, p50={ttft['p50']*1000:.2f}ms, p99={ttft['p99']*1000:.2f}ms"
+                                )
 
-                                if stream_stats.get("tokens_per_second"):
-                                    tps = stream_stats["tokens_per_second"]
-                                    print(
-                                        f"  Tokens/sec: avg={tps['avg']:.2f}, p50={tps['p50']:.2f}, p99={tps['p99']:.2f}"
-                                    )
+                            if stream_stats.get("tokens_per_second"):
+                                tps = stream_stats["tokens_per_second"]
+                                lines.append(
+                                    f"  Tokens/sec: avg={tps['avg']:.2f}, p50={tps['p50']:.2f}, p99={tps['p99']:.2f}"
+                                )
 
-                        print("=" * 70)
+                    lines.append("=" * 70)
+                    print("\n".join(lines))
 
         except aiohttp.ClientConnectorError:
             print(
@@ -898,18 +898,28 @@ def metrics(
             print(f"ERROR: {e}", file=sys.stderr)
             sys.exit(1)
 
-    if watch:
-        try:
+    async def run():
+        # One session for the whole run, so --watch refreshes reuse the pooled
+        # connection instead of reconnecting (and starting a new event loop)
+        # every five seconds
+        async with aiohttp.ClientSession() as session:
+            if not watch:
+                await fetch_and_display(session)
+                return
             while True:
                 # Clear screen (cross-platform)
                 print("\033[2J\033[H", end="")
-                asyncio.run(fetch_and_display())
+                await fetch_and_display(session)
                 print("\n(Press Ctrl+C to stop)")
-                time_module.sleep(5)
+                await asyncio.sleep(5)
+
+    if watch:
+        try:
+            asyncio.run(run())
         except KeyboardInterrupt:
             print("\n\nStopped watching metrics")
     else:
-        asyncio.run(fetch_and_display())
+        asyncio.run(run())
 
 
 @app.command(name="cache-stats")
@@ -951,7 +961,7 @@ def cache_stats(
                     f"{base_url}/cache-stats", timeout=aiohttp.ClientTimeout(total=5)
                 ) as response:
                     response.raise_for_status()
-                    cache_data = await response.json()
+                    cache_data = json_loads(await response.read())
 
                     print("=" * 70)
                     print("FakeAI KV Cache Statistics")
@@ -1111,7 +1121,7 @@ def interactive(
                     timeout=aiohttp.ClientTimeout(total=5),
                 ) as response:
                     response.raise_for_status()
-                    models_data = await response.json()
+                    models_data = json_loads(await response.read())
                     print("\nAvailable models:")
                     for model in models_data.get("data", []):
                         print(f"  - {model['id']}")
@@ -1126,7 +1136,7 @@ def interactive(
                     f"{base_url}/metrics", timeout=aiohttp.ClientTimeout(total=5)
                 ) as response:
                     response.raise_for_status()
-                    metrics_data = await response.json()
+                    metrics_data = json_loads(await response.read())
                     print(json.dumps(metrics_data, indent=2))
         except Exception as e:
             print(f"ERROR: {e}")
@@ -1195,7 +1205,7 @@ def interactive(
                         timeout=aiohttp.ClientTimeout(total=30),
                     ) as response:
                         response.raise_for_status()
-                        result = await response.json()
+                        result = json_loads(await response.read())
 
                         assistant_message = result["choices"][0]["message"]["content"]
                         print(f"\nAssistant: {assistant_message}\n")
@@ -190,6 +190,10 @@ class CostTracker:
     _lock = threading.Lock()
 
     def __new__(cls):
+        # Lock-free fast path once the singleton exists.
+        instance = cls._instance
+        if instance is not None:
+            return instance
         with cls._lock:
             if cls._instance is None:
                 cls._instance = super(CostTracker, cls).__new__(cls)
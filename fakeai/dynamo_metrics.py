@@ -6,6 +6,7 @@ throughput measurements, queue statistics, batch metrics, and
 disaggregated serving metrics.
 """
 
+import sys
 import threading
 import time
 from collections import defaultdict, deque
@@ -159,6 +160,10 @@ class DynamoMetricsCollector:
         Returns:
             RequestMetrics object for this request
         """
+        # Few distinct models/endpoints; share one string across all requests
+        model = sys.intern(model)
+        endpoint = sys.intern(endpoint)
+
         with self._lock:
             request = RequestMetrics(
                 request_id=request_id,
@@ -253,9 +258,15 @@ class DynamoMetricsCollector:
         """Get requests completed in last N seconds."""
         cutoff_time = time.time() - seconds
         with self._lock:
-            return [
-                r for r in self._completed_requests if r.completion_time >= cutoff_time
-            ]
+            # Requests are appended in completion order, so walk back from the
+            # newest and stop at the first one outside the window
+            recent = []
+            for r in reversed(self._completed_requests):
+                if r.completion_time < cutoff_time:
+                    break
+                recent.append(r)
+        recent.reverse()
+        return recent
 
     def calculate_percentile(self, values: list[float], percentile: float) -> float:
         """Calculate percentile from sorted values."""
@@ -268,8 +279,10 @@ class DynamoMetricsCollector:
 
     def get_latency_stats(self, window_seconds: int = 60) -> dict[str, Any]:
         """Get latency statistics for recent window."""
-        recent = self.get_recent_requests(window_seconds)
+        return self._latency_stats(self.get_recent_requests(window_seconds))
 
+    def _latency_stats(self, recent: list[RequestMetrics]) -> dict[str, Any]:
+        """Compute latency statistics over a snapshot of recent requests."""
         if not recent:
             return {
                 "ttft": {"avg": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0},
@@ -334,8 +347,14 @@ class DynamoMetricsCollector:
 
     def get_throughput_stats(self, window_seconds: int = 60) -> dict[str, float]:
         """Get throughput statistics."""
-        recent = self.get_recent_requests(window_seconds)
+        return self._throughput_stats(
+            self.get_recent_requests(window_seconds), window_seconds
+        )
 
+    def _throughput_stats(
+        self, recent: list[RequestMetrics], window_seconds: int
+    ) -> dict[str, float]:
+        """Compute throughput statistics over a snapshot of recent requests."""
         if not recent:
             return {
                 "requests_per_second": 0.0,
@@ -400,8 +419,10 @@ class DynamoMetricsCollector:
 
     def get_cache_stats(self, window_seconds: int = 60) -> dict[str, Any]:
         """Get KV cache statistics."""
-        recent = self.get_recent_requests(window_seconds)
+        return self._cache_stats(self.get_recent_requests(window_seconds))
 
+    def _cache_stats(self, recent: list[RequestMetrics]) -> dict[str, Any]:
+        """Compute KV cache statistics over a snapshot of recent requests."""
         if not recent:
             return {
                 "hit_rate": 0.0,
@@ -446,12 +467,13 @@ class DynamoMetricsCollector:
         """Export metrics in Prometheus format."""
         lines = []
 
-        # Get recent stats
-        latency_stats = self.get_latency_stats(60)
-        throughput_stats = self.get_throughput_stats(60)
+        # Get recent stats, all from one snapshot of the window
+        recent = self.get_recent_requests(60)
+        latency_stats = self._latency_stats(recent)
+        throughput_stats = self._throughput_stats(recent, 60)
         queue_stats = self.get_queue_stats()
         batch_stats = self.get_batch_stats()
-        cache_stats = self.get_cache_stats(60)
+        cache_stats = self._cache_stats(recent)
 
         # Request counters
         lines.append("# TYPE fakeai_dynamo_requests_total counter")
@@ -510,6 +532,9 @@ class DynamoMetricsCollector:
 
     def get_stats_dict(self) -> dict[str, Any]:
         """Get all statistics as dictionary."""
+        # Take one snapshot of the window for all windowed sections
+        recent = self.get_recent_requests(60)
+
         return {
             "summary": {
                 "total_requests": self.total_requests,
@@ -517,11 +542,11 @@ class DynamoMetricsCollector:
                 "failed_requests": self.failed_requests,
                 "active_requests": len(self._active_requests),
             },
-            "latency": self.get_latency_stats(60),
-            "throughput": self.get_throughput_stats(60),
+            "latency": self._latency_stats(recent),
+            "throughput": self._throughput_stats(recent, 60),
             "queue": self.get_queue_stats(),
             "batch": self.get_batch_stats(),
-            "cache": self.get_cache_stats(60),
+            "cache": self._cache_stats(recent),
             "disaggregation": self.get_disaggregation_stats(),
             "per_model": self.get_model_stats(),
         }
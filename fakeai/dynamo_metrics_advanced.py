@@ -10,6 +10,7 @@ Extreme granularity metrics matching production NVIDIA Dynamo systems:
 - Advanced analytics with long-tail analysis
 """
 
+import sys
 import threading
 import time
 import uuid
@@ -286,7 +287,7 @@ class QueueManager:
             priority: QueueMetrics(priority=priority) for priority in RequestPriority
         }
 
-        self._lock = threading.RLock()  # Reentrant lock to allow nested locking
+        self._lock = threading.Lock()
 
     def enqueue(self, priority: RequestPriority) -> tuple[bool, str]:
         """
@@ -454,7 +455,7 @@ class BatchOptimizer:
         self.padding_waste_history: deque[float] = deque(maxlen=1000)
         self.efficiency_scores: deque[float] = deque(maxlen=1000)
 
-        self._lock = threading.RLock()  # Reentrant lock to allow nested locking
+        self._lock = threading.Lock()
 
     def start_batch(
         self,
@@ -628,7 +629,7 @@ class DisaggregationTracker:
             maxlen=1000
         )  # (time, bytes)
 
-        self._lock = threading.RLock()  # Reentrant lock to allow nested locking
+        self._lock = threading.Lock()
 
     def record_prefill_request(self, worker_id: str, kv_cache_size_bytes: int):
         """
@@ -724,19 +725,23 @@ class DisaggregationTracker:
             Average bandwidth in Mbps
         """
         with self._lock:
-            cutoff_time = time.time() - window_seconds
-            recent_transfers = [
-                (t, bytes_) for t, bytes_ in self.transfer_history if t >= cutoff_time
-            ]
+            return self._avg_transfer_bandwidth_mbps(window_seconds)
+
+    def _avg_transfer_bandwidth_mbps(self, window_seconds: int) -> float:
+        """Average transfer bandwidth; caller must hold the lock."""
+        cutoff_time = time.time() - window_seconds
+        recent_transfers = [
+            (t, bytes_) for t, bytes_ in self.transfer_history if t >= cutoff_time
+        ]
 
-            if not recent_transfers:
-                return 0.0
+        if not recent_transfers:
+            return 0.0
 
-            total_bytes = sum(bytes_ for _, bytes_ in recent_transfers)
-            total_bits = total_bytes * 8
-            mbps = (total_bits / window_seconds) / 1_000_000
+        total_bytes = sum(bytes_ for _, bytes_ in recent_transfers)
+        total_bits = total_bytes * 8
+        mbps = (total_bits / window_seconds) / 1_000_000
 
-            return mbps
+        return mbps
 
     def get_stats(self, window_seconds: int = 60) -> dict[str, Any]:
         """Get disaggregation statistics."""
@@ -766,7 +771,7 @@ class DisaggregationTracker:
                 "disaggregation_overhead_ms": self.metrics.disaggregation_overhead_us
                 / 1000,
                 "cross_worker_transfers": self.metrics.cross_worker_transfers,
-                "avg_transfer_bandwidth_mbps": self.get_avg_transfer_bandwidth_mbps(
+                "avg_transfer_bandwidth_mbps": self._avg_transfer_bandwidth_mbps(
                     window_seconds
                 ),
                 "avg_overhead_per_transfer_us": (
@@ -840,7 +845,7 @@ class AdvancedDynamoMetrics:
         self.successful_requests = 0
         self.failed_requests = 0
 
-        self._lock = threading.RLock()  # Reentrant lock to allow nested locking
+        self._lock = threading.Lock()
 
     def start_request(
         self,
@@ -856,6 +861,10 @@ class AdvancedDynamoMetrics:
         Returns:
             (metrics, reason) - metrics object if enqueued, reason if rejected
         """
+        # Few distinct models/endpoints; share one string across all requests
+        model = sys.intern(model)
+        endpoint = sys.intern(endpoint)
+
         with self._lock:
             # Enqueue in queue manager
             if self.queue_manager:
@@ -1032,9 +1041,15 @@ class AdvancedDynamoMetrics:
         """Get requests completed in last N seconds."""
         cutoff_time = time.time() - seconds
         with self._lock:
-            return [
-                r for r in self._completed_requests if r.completion_time >= cutoff_time
-            ]
+            # Requests are appended in completion order, so walk back from the
+            # newest and stop at the first one outside the window
+            recent = []
+            for r in reversed(self._completed_requests):
+                if r.completion_time < cutoff_time:
+                    break
+                recent.append(r)
+        recent.reverse()
+        return recent
 
     def calculate_percentile(self, values: list[float], percentile: float) -> float:
         """Calculate percentile from values."""
@@ -1047,8 +1062,10 @@ class AdvancedDynamoMetrics:
 
     def get_latency_stats(self, window_seconds: int = 60) -> dict[str, Any]:
         """Get comprehensive latency statistics."""
-        recent = self.get_recent_requests(window_seconds)
+        return self._latency_stats(self.get_recent_requests(window_seconds))
 
+    def _latency_stats(self, recent: list[AdvancedRequestMetrics]) -> dict[str, Any]:
+        """Compute latency statistics over a snapshot of recent requests."""
         if not recent:
             return self._empty_latency_stats()
 
@@ -1160,8 +1177,12 @@ class AdvancedDynamoMetrics:
 
         Identifies outliers and their characteristics.
         """
-        recent = self.get_recent_requests(window_seconds)
+        return self._long_tail_analysis(self.get_recent_requests(window_seconds))
 
+    def _long_tail_analysis(
+        self, recent: list[AdvancedRequestMetrics]
+    ) -> dict[str, Any]:
+        """Analyze long-tail requests over a snapshot of recent requests."""
         if not recent:
             return {"long_tail_requests": 0, "analysis": {}}
 
@@ -1182,29 +1203,30 @@ class AdvancedDynamoMetrics:
                 "analysis": {},
             }
 
-        # Analyze characteristics
-        avg_input_tokens = sum(r.input_tokens for r in long_tail) / len(long_tail)
-        avg_output_tokens = sum(r.output_tokens for r in long_tail) / len(long_tail)
-        avg_queue_time = sum(r.total_queue_time_ms for r in long_tail) / len(long_tail)
-        avg_batch_size = sum(r.batch_size for r in long_tail) / len(long_tail)
-
-        # Models with long tail
+        # Analyze characteristics and models with long tail in one pass
+        input_tokens = output_tokens = batch_size = 0
+        queue_time = total_latency = 0
         model_counts = defaultdict(int)
         for r in long_tail:
+            input_tokens += r.input_tokens
+            output_tokens += r.output_tokens
+            queue_time += r.total_queue_time_ms
+            batch_size += r.batch_size
+            total_latency += r.total_time_ms
             model_counts[r.model] += 1
 
+        count = len(long_tail)
         return {
-            "long_tail_requests": len(long_tail),
-            "percentage": len(long_tail) / len(recent) * 100,
+            "long_tail_requests": count,
+            "percentage": count / len(recent) * 100,
             "p99_threshold_ms": p99_threshold,
             "analysis": {
-                "avg_input_tokens": avg_input_tokens,
-                "avg_output_tokens": avg_output_tokens,
-                "avg_queue_time_ms": avg_queue_time,
-                "avg_batch_size": avg_batch_size,
+                "avg_input_tokens": input_tokens / count,
+                "avg_output_tokens": output_tokens / count,
+                "avg_queue_time_ms": queue_time / count,
+                "avg_batch_size": batch_size / count,
                 "models": dict(model_counts),
-                "avg_total_latency_ms": sum(r.total_time_ms for r in long_tail)
-                / len(long_tail),
+                "avg_total_latency_ms": total_latency / count,
             },
         }
 
@@ -1262,8 +1284,12 @@ class AdvancedDynamoMetrics:
 
     def get_request_size_distribution(self, window_seconds: int = 60) -> dict[str, Any]:
         """Get distribution of request sizes (input/output tokens)."""
-        recent = self.get_recent_requests(window_seconds)
+        return self._request_size_distribution(self.get_recent_requests(window_seconds))
 
+    def _request_size_distribution(
+        self, recent: list[AdvancedRequestMetrics]
+    ) -> dict[str, Any]:
+        """Compute request size distribution over a snapshot of recent requests."""
         if not recent:
             return {"input_tokens": {}, "output_tokens": {}}
 
@@ -1274,8 +1300,12 @@ class AdvancedDynamoMetrics:
         # Count requests in each bucket
         input_dist = defaultdict(int)
         output_dist = defaultdict(int)
+        input_total = output_total = 0
 
         for request in recent:
+            input_total += request.input_tokens
+            output_total += request.output_tokens
+
             # Input tokens
             for i in range(len(input_buckets) - 1):
                 if input_buckets[i] <= request.input_tokens < input_buckets[i + 1]:
@@ -1299,12 +1329,15 @@ class AdvancedDynamoMetrics:
         return {
             "input_tokens": dict(input_dist),
             "output_tokens": dict(output_dist),
-            "avg_input_tokens": sum(r.input_tokens for r in recent) / len(recent),
-            "avg_output_tokens": sum(r.output_tokens for r in recent) / len(recent),
+            "avg_input_tokens": input_total / len(recent),
+            "avg_output_tokens": output_total / len(recent),
         }
 
     def get_stats_dict(self, window_seconds: int = 60) -> dict[str, Any]:
         """Get all statistics as dictionary."""
+        # Take one snapshot of the window for all windowed sections
+        recent = self.get_recent_requests(window_seconds)
+
         stats = {
             "summary": {
                 "total_requests": self.total_requests,
@@ -1317,10 +1350,10 @@ class AdvancedDynamoMetrics:
                     else 0.0
                 ),
             },
-            "latency": self.get_latency_stats(window_seconds),
-            "long_tail": self.get_long_tail_analysis(window_seconds),
+            "latency": self._latency_stats(recent),
+            "long_tail": self._long_tail_analysis(recent),
             "per_model": self.get_model_stats(window_seconds),
-            "request_distribution": self.get_request_size_distribution(window_seconds),
+            "request_distribution": self._request_size_distribution(recent),
         }
 
         # Add component stats if enabled
@@ -9,6 +9,7 @@ metrics, and SLO tracking.
 #  SPDX-License-Identifier: Apache-2.0
 
 import logging
+import re
 import threading
 import time
 from collections import defaultdict, deque
@@ -19,6 +20,9 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Digits and punctuation dropped from error signatures
+_SIGNATURE_STRIP_PATTERN = re.compile(r"[^a-z\s]+")
+
 
 @dataclass
 class ErrorEvent:
@@ -74,6 +78,10 @@ class ErrorMetricsTracker:
 
     def __new__(cls):
         """Ensure only one instance exists (singleton pattern)."""
+        # Lock-free fast path once the singleton exists.
+        instance = cls._instance
+        if instance is not None:
+            return instance
         with cls._lock:
             if cls._instance is None:
                 cls._instance = super(ErrorMetricsTracker, cls).__new__(cls)
@@ -503,13 +511,15 @@ class ErrorMetricsTracker:
             time_to_recovery_list = list(self._recovery_metrics.time_to_recovery)
 
             if time_to_recovery_list:
+                recovery = np.array(time_to_recovery_list)
+                p50, p90, p99 = np.percentile(recovery, (50, 90, 99))
                 recovery_stats = {
-                    "avg_seconds": float(np.mean(time_to_recovery_list)),
-                    "min_seconds": float(np.min(time_to_recovery_list)),
-                    "max_seconds": float(np.max(time_to_recovery_list)),
-                    "p50_seconds": float(np.percentile(time_to_recovery_list, 50)),
-                    "p90_seconds": float(np.percentile(time_to_recovery_list, 90)),
-                    "p99_seconds": float(np.percentile(time_to_recovery_list, 99)),
+                    "avg_seconds": float(np.mean(recovery)),
+                    "min_seconds": float(np.min(recovery)),
+                    "max_seconds": float(np.max(recovery)),
+                    "p50_seconds": float(p50),
+                    "p90_seconds": float(p90),
+                    "p99_seconds": float(p99),
                 }
             else:
                 recovery_stats = {
@@ -774,10 +784,7 @@ class ErrorMetricsTracker:
         # Simple signature: error_type + first 50 chars (normalized)
         normalized = error_message.lower().strip()[:50]
         # Remove numbers and special chars for better clustering
-        import re
-
-        normalized = re.sub(r"[0-9]+", "N", normalized)
-        normalized = re.sub(r"[^a-z\s]", "", normalized)
+        normalized = _SIGNATURE_STRIP_PATTERN.sub("", normalized)
         normalized = " ".join(normalized.split())  # Normalize whitespace
 
         return f"{error_type}:{normalized}"
@@ -11,6 +11,7 @@ with appropriate delays to mimic real-world workloads.
 import asyncio
 import base64
 import hashlib
+import itertools
 import json
 import logging
 import random
@@ -22,6 +23,7 @@ from collections.abc import AsyncGenerator
 from functools import lru_cache
 from typing import Any
 
+import numpy as np
 from faker import Faker
 
 from fakeai.audio import (
@@ -112,6 +114,7 @@ from fakeai.models import (
     FineTuningEvent,
     FineTuningEventList,
     FineTuningJob,
+    FineTuningJobError,
     FineTuningJobList,
     FineTuningJobRequest,
     GeneratedImage,
@@ -673,15 +676,26 @@ class FakeAIService:
         self.fine_tuning_jobs: dict[str, FineTuningJob] = (
             {}
         )  # job_id -> FineTuningJob object
+        # Jobs in creation (oldest-first) order plus job_id -> position, so list
+        # pagination slices instead of re-sorting and scanning for the cursor
+        self._fine_tuning_job_order: list[FineTuningJob] = []
+        self._fine_tuning_job_index: dict[str, int] = {}
         self.fine_tuning_events: dict[str, list[FineTuningEvent]] = defaultdict(
             list
         )  # job_id -> list of events
+        self.fine_tuning_events_sse: dict[str, list[str]] = defaultdict(
+            list
+        )  # job_id -> SSE lines, aligned with fine_tuning_events
         self.fine_tuning_checkpoints: dict[str, list[FineTuningCheckpoint]] = (
             defaultdict(list)
         )  # job_id -> list of checkpoints
         self.fine_tuning_tasks: dict[str, asyncio.Task] = (
             {}
         )  # job_id -> async task for background processing
+        # Simulated ids: a per-service random prefix plus a counter is unique
+        # without paying for a uuid4 per event
+        self._fine_tuning_id_prefix = uuid.uuid4().hex[:16]
+        self._fine_tuning_id_counter = itertools.count()
 
     def _init_simulated_models(self) -> None:
         """Initialize simulated model data with comprehensive metadata."""
@@ -1070,6 +1084,8 @@ class FakeAIService:
             )
             for i in range(3)
         ]
+        # Id index over self.files for O(1) lookups; kept in step on upload/delete
+        self.files_by_id: dict[str, FileObject] = {f.id: f for f in self.files}
 
     def _is_reasoning_model(self, model_id: str) -> bool:
         """Check if model supports reasoning content (gpt-oss and deepseek-ai/DeepSeek-R1 families)."""
@@ -2775,6 +2791,7 @@ class FakeAIService:
 
         # Add to our list
         self.files.append(new_file)
+        self.files_by_id[new_file.id] = new_file
 
         return new_file
 
@@ -2784,9 +2801,9 @@ class FakeAIService:
         await asyncio.sleep(random.uniform(0.05, 0.2))
 
         # Find the file
-        for file in self.files:
-            if file.id == file_id:
-                return file
+        file = self.files_by_id.get(file_id)
+        if file is not None:
+            return file
 
         raise ValueError(f"File with ID '{file_id}' not found")
 
@@ -2796,10 +2813,10 @@ class FakeAIService:
         await asyncio.sleep(random.uniform(0.05, 0.2))
 
         # Find and remove the file
-        for i, file in enumerate(self.files):
-            if file.id == file_id:
-                del self.files[i]
-                return {"id": file_id, "object": "file", "deleted": True}
+        file = self.files_by_id.pop(file_id, None)
+        if file is not None:
+            self.files.remove(file)
+            return {"id": file_id, "object": "file", "deleted": True}
 
         raise ValueError(f"File with ID '{file_id}' not found")
 
@@ -3331,35 +3348,42 @@ class FakeAIService:
 
         return response.model_dump()
 
+    # Solido documentation snippets, selected by query keywords
+    SOLIDO_PVTMC_DOCS = (
+        "PVTMC Verifier provides fast, accurate full coverage verification of worst case corners. It analyzes process, voltage, and temperature variations to identify critical operating conditions.",
+        "Corner analysis in Solido DE identifies worst-case operating conditions across PVT variations. The PVTMC Verifier tool automates this process with statistical methods.",
+        "Process-Voltage-Temperature Monte Carlo (PVTMC) verification ensures your design meets specifications across all operating corners by analyzing statistical distributions.",
+    )
+    SOLIDO_SWEEP_DOCS = (
+        "Sweep configuration allows you to sweep design variables with a simple setup. Select variables from the dropdown and configure sweep ranges manually or using automatic stepping.",
+        "Variable grouping in sweeps creates specific combinations rather than running all permutations. Linked variables must have the same number of points in each variable.",
+        "Sweep ranges can be specified as comma-separated values (-40, 25, 125) or using start:step:end notation (-40:10:125) for automatic population.",
+    )
+    SOLIDO_SIMULATION_DOCS = (
+        "Solido Design Environment supports multiple simulation types including transient analysis, AC analysis, and DC operating point calculations across process corners.",
+        "Test configuration allows selection of specific tests, corner groups, and cluster settings for distributed simulation runs.",
+        "Simulation results can be viewed across distributions with cross-selection support, enabling efficient debugging and design iteration.",
+    )
+    SOLIDO_GENERAL_DOCS = (
+        "Solido Design Environment (SDE) is a comprehensive variation-aware design platform for custom IC design workflows.",
+        "The Solido platform leverages AI-enabled technologies for library characterization, IP validation, and worst-case corner verification.",
+        "Solido tools integrate seamlessly with industry-standard EDA flows, providing automated analysis and optimization capabilities.",
+    )
+
     def _generate_solido_doc_content(self, query: str, index: int) -> str:
         """Generate Solido-specific documentation content."""
         query_lower = query.lower()
 
         # Context-aware content based on query keywords
         if "pvtmc" in query_lower or "corner" in query_lower:
-            templates = [
-                "PVTMC Verifier provides fast, accurate full coverage verification of worst case corners. It analyzes process, voltage, and temperature variations to identify critical operating conditions.",
-                "Corner analysis in Solido DE identifies worst-case operating conditions across PVT variations. The PVTMC Verifier tool automates this process with statistical methods.",
-                "Process-Voltage-Temperature Monte Carlo (PVTMC) verification ensures your design meets specifications across all operating corners by analyzing statistical distributions.",
-            ]
+            templates = self.SOLIDO_PVTMC_DOCS
         elif "sweep" in query_lower or "variable" in query_lower:
-            templates = [
-                "Sweep configuration allows you to sweep design variables with a simple setup. Select variables from the dropdown and configure sweep ranges manually or using automatic stepping.",
-                "Variable grouping in sweeps creates specific combinations rather than running all permutations. Linked variables must have the same number of points in each variable.",
-                "Sweep ranges can be specified as comma-separated values (-40, 25, 125) or using start:step:end notation (-40:10:125) for automatic population.",
-            ]
+            templates = self.SOLIDO_SWEEP_DOCS
         elif "simulation" in query_lower or "test" in query_lower:
-            templates = [
-                "Solido Design Environment supports multiple simulation types including transient analysis, AC analysis, and DC operating point calculations across process corners.",
-                "Test configuration allows selection of specific tests, corner groups, and cluster settings for distributed simulation runs.",
-                "Simulation results can be viewed across distributions with cross-selection support, enabling efficient debugging and design iteration.",
-            ]
+            templates = self.SOLIDO_SIMULATION_DOCS
         else:
-            templates = [
-                f"Solido Design Environment (SDE) is a comprehensive variation-aware design platform for custom IC design workflows. {fake.sentence()}",
-                f"The Solido platform leverages AI-enabled technologies for library characterization, IP validation, and worst-case corner verification. {fake.sentence()}",
-                f"Solido tools integrate seamlessly with industry-standard EDA flows, providing automated analysis and optimization capabilities. {fake.sentence()}",
-            ]
+            general = self.SOLIDO_GENERAL_DOCS[index % len(self.SOLIDO_GENERAL_DOCS)]
+            return f"{general} {fake.sentence()}"
 
         return templates[index % len(templates)]
 
@@ -4238,17 +4262,13 @@ class FakeAIService:
             ValueError: If training file not found or validation file not found
         """
         # Validate training file exists
-        training_file = next(
-            (f for f in self.files if f.id == request.training_file), None
-        )
+        training_file = self.files_by_id.get(request.training_file)
         if not training_file:
             raise ValueError(f"Training file {request.training_file} not found")
 
         # Validate validation file if provided
         if request.validation_file:
-            validation_file = next(
-                (f for f in self.files if f.id == request.validation_file), None
-            )
+            validation_file = self.files_by_id.get(request.validation_file)
             if not validation_file:
                 raise ValueError(f"Validation file {request.validation_file} not found")
 
@@ -4271,7 +4291,7 @@ class FakeAIService:
         )
 
         # Create job
-        job_id = f"ftjob-{uuid.uuid4().hex}"
+        job_id = self._fine_tuning_id("ftjob")
         created_at = int(time.time())
 
         job = FineTuningJob(
@@ -4290,27 +4310,29 @@ class FakeAIService:
 
         # Store job
         self.fine_tuning_jobs[job_id] = job
+        self._fine_tuning_job_index[job_id] = len(self._fine_tuning_job_order)
+        self._fine_tuning_job_order.append(job)
 
         # Add initial events
         initial_event = FineTuningEvent(
-            id=f"ftevent-{uuid.uuid4().hex}",
+            id=self._fine_tuning_id("ftevent"),
             created_at=created_at,
             level="info",
             message="Fine-tuning job created",
             type="message",
         )
-        self.fine_tuning_events[job_id].append(initial_event)
+        self._add_fine_tuning_event(job_id, initial_event)
 
         # Add an initial metrics event with sample data
         metrics_event = FineTuningEvent(
-            id=f"ftevent-{uuid.uuid4().hex}",
+            id=self._fine_tuning_id("ftevent"),
             created_at=created_at,
             level="info",
             message="Initial training metrics",
             data={"step": 0, "train_loss": 2.5, "learning_rate": 0.0001},
             type="metrics",
         )
-        self.fine_tuning_events[job_id].append(metrics_event)
+        self._add_fine_tuning_event(job_id, metrics_event)
 
         # Start background processing
         task = asyncio.create_task(
@@ -4334,23 +4356,16 @@ class FakeAIService:
         Returns:
             FineTuningJobList with paginated results
         """
-        # Get all jobs sorted by creation time (newest first)
-        all_jobs = sorted(
-            self.fine_tuning_jobs.values(), key=lambda j: j.created_at, reverse=True
-        )
-
-        # Apply pagination
+        # Jobs are appended in creation order, so newest-first pages are
+        # reversed slices ending just before the 'after' cursor
         if after:
-            # Find the index of the 'after' job
-            try:
-                after_idx = next(i for i, j in enumerate(all_jobs) if j.id == after)
-                all_jobs = all_jobs[after_idx + 1 :]
-            except StopIteration:
-                all_jobs = []
+            end = self._fine_tuning_job_index.get(after, 0)
+        else:
+            end = len(self._fine_tuning_job_order)
 
-        # Limit results
-        jobs = all_jobs[:limit]
-        has_more = len(all_jobs) > limit
+        start = max(0, end - limit)
+        jobs = self._fine_tuning_job_order[start:end][::-1]
+        has_more = start > 0
 
         return FineTuningJobList(
             data=jobs,
@@ -4409,17 +4424,32 @@ class FakeAIService:
 
         # Add cancellation event
         event = FineTuningEvent(
-            id=f"ftevent-{uuid.uuid4().hex}",
+            id=self._fine_tuning_id("ftevent"),
             created_at=int(time.time()),
             level="info",
             message="Fine-tuning job cancelled by user",
             type="message",
         )
-        self.fine_tuning_events[job_id].append(event)
+        self._add_fine_tuning_event(job_id, event)
 
         logger.info(f"Cancelled fine-tuning job {job_id}")
         return job
 
+    def _fine_tuning_id(self, kind: str) -> str:
+        """Return a unique id such as ``ftevent-<32 hex chars>``."""
+        return (
+            f"{kind}-{self._fine_tuning_id_prefix}"
+            f"{next(self._fine_tuning_id_counter):016x}"
+        )
+
+    def _add_fine_tuning_event(self, job_id: str, event: FineTuningEvent) -> None:
+        """Record an event and its SSE line, serialized once for all readers."""
+        self.fine_tuning_events[job_id].append(event)
+        event_data = event.model_dump(mode="json")
+        self.fine_tuning_events_sse[job_id].append(
+            f"data: {json.dumps(event_data)}\n\n"
+        )
+
     async def list_fine_tuning_events(
         self, job_id: str, limit: int = 20
     ) -> AsyncGenerator[str, None]:
@@ -4440,14 +4470,13 @@ class FakeAIService:
         if not job:
             raise ValueError(f"Fine-tuning job {job_id} not found")
 
-        # Get events for this job
-        events = self.fine_tuning_events.get(job_id, [])
+        # Get pre-serialized events for this job
+        events = self.fine_tuning_events_sse.get(job_id, [])
         events = events[-limit:] if limit else events
 
         # Stream events in SSE format
-        for event in events:
-            event_data = event.model_dump(mode="json")
-            yield f"data: {json.dumps(event_data)}\n\n"
+        for event_line in events:
+            yield event_line
 
     async def list_fine_tuning_checkpoints(
         self, job_id: str, limit: int = 10
@@ -4469,14 +4498,12 @@ class FakeAIService:
         if not job:
             raise ValueError(f"Fine-tuning job {job_id} not found")
 
-        # Get checkpoints for this job
+        # Get checkpoints for this job. They are appended in increasing
+        # step_number order, so newest first is just the reversed tail.
         checkpoints = self.fine_tuning_checkpoints.get(job_id, [])
-
-        # Sort by step number (newest first)
-        checkpoints = sorted(checkpoints, key=lambda c: c.step_number, reverse=True)
-
-        # Apply limit
-        checkpoints = checkpoints[:limit] if limit else checkpoints
+        if limit:
+            checkpoints = checkpoints[-limit:]
+        checkpoints = checkpoints[::-1]
 
         first_id = checkpoints[0].id if checkpoints else None
         last_id = checkpoints[-1].id if checkpoints else None
@@ -4504,67 +4531,81 @@ class FakeAIService:
         """
         try:
             job = self.fine_tuning_jobs[job_id]
+            # Per-job generator so a seeded job replays the same metrics.
+            # default_rng rejects negative seeds but the API accepts any int,
+            # so fold the seed into the unsigned 64-bit range first.
+            seed = None if job.seed is None else job.seed & 0xFFFFFFFFFFFFFFFF
+            rng = np.random.default_rng(seed)
 
             # Phase 1: Validating files (1 second)
             await asyncio.sleep(1.0)
             job.status = "queued"
             event = FineTuningEvent(
-                id=f"ftevent-{uuid.uuid4().hex}",
+                id=self._fine_tuning_id("ftevent"),
                 created_at=int(time.time()),
                 level="info",
                 message="Files validated successfully",
                 type="message",
             )
-            self.fine_tuning_events[job_id].append(event)
+            self._add_fine_tuning_event(job_id, event)
 
             # Phase 2: Queued (1 second)
             await asyncio.sleep(1.0)
             job.status = "running"
             event = FineTuningEvent(
-                id=f"ftevent-{uuid.uuid4().hex}",
+                id=self._fine_tuning_id("ftevent"),
                 created_at=int(time.time()),
                 level="info",
                 message="Training started",
                 type="message",
             )
-            self.fine_tuning_events[job_id].append(event)
+            self._add_fine_tuning_event(job_id, event)
 
             # Phase 3: Running with checkpoints (30 seconds total)
             total_steps = 100
             training_duration = 30.0
             checkpoint_steps = [25, 50, 75, 100]
 
-            for step in range(1, total_steps + 1):
-                await asyncio.sleep(training_duration / total_steps)
-
-                # Generate metrics periodically
-                if step % 10 == 0 or step in checkpoint_steps:
-                    train_loss = 2.5 * (1 - step / total_steps) + random.uniform(
-                        0.0, 0.2
-                    )
-                    valid_loss = train_loss + random.uniform(0.0, 0.3)
-                    train_accuracy = (
-                        0.3 + (0.65 * step / total_steps) + random.uniform(0.0, 0.05)
-                    )
+            # Only these steps emit metrics or checkpoints, so sleep straight to
+            # each one instead of waking the event loop for every step.
+            step_duration = training_duration / total_steps
+            work_steps = sorted(
+                set(range(10, total_steps + 1, 10)) | set(checkpoint_steps)
+            )
 
-                    metrics = {
-                        "step": step,
-                        "train_loss": round(train_loss, 4),
-                        "valid_loss": round(valid_loss, 4),
-                        "train_accuracy": round(train_accuracy, 4),
-                        "learning_rate": 0.0001
-                        * job.hyperparameters.learning_rate_multiplier,
-                    }
+            # Generate the whole metric curve up front
+            progress = np.array(work_steps) / total_steps
+            n_steps = len(work_steps)
+            train_losses = 2.5 * (1 - progress) + rng.uniform(0.0, 0.2, n_steps)
+            valid_losses = train_losses + rng.uniform(0.0, 0.3, n_steps)
+            train_accuracies = 0.3 + 0.65 * progress + rng.uniform(0.0, 0.05, n_steps)
+            train_losses = train_losses.round(4).tolist()
+            valid_losses = valid_losses.round(4).tolist()
+            train_accuracies = train_accuracies.round(4).tolist()
+
+            previous_step = 0
+            for i, step in enumerate(work_steps):
+                await asyncio.sleep((step - previous_step) * step_duration)
+                previous_step = step
+
+                metrics = {
+                    "step": step,
+                    "train_loss": train_losses[i],
+                    "valid_loss": valid_losses[i],
+                    "train_accuracy": train_accuracies[i],
+                    "learning_rate": 0.0001
+                    * job.hyperparameters.learning_rate_multiplier,
+                }
 
-                    event = FineTuningEvent(
-                        id=f"ftevent-{uuid.uuid4().hex}",
-                        created_at=int(time.time()),
-                        level="info",
-                        message=f"Step {step}/{total_steps} completed",
-                        data=metrics,
-                        type="metrics",
-                    )
-                    self.fine_tuning_events[job_id].append(event)
+                event = FineTuningEvent(
+                    id=self._fine_tuning_id("ftevent"),
+                    created_at=int(time.time()),
+                    level="info",
+                    message=f"Step {step}/{total_steps} completed",
+                    data=metrics,
+                    type="metrics",
+                )
+                self._add_fine_tuning_event(job_id, event)
 
                 # Create checkpoints at 25%, 50%, 75%, 100%
                 if step in checkpoint_steps:
@@ -4579,28 +4620,15 @@ class FakeAIService:
                         )
 
                     checkpoint = FineTuningCheckpoint(
-                        id=f"ftckpt-{uuid.uuid4().hex}",
+                        id=self._fine_tuning_id("ftckpt"),
                         created_at=int(time.time()),
                         fine_tuning_job_id=job_id,
                         fine_tuned_model_checkpoint=checkpoint_model_name,
                         step_number=step,
                         metrics={
-                            "train_loss": round(
-                                2.5 * (1 - step / total_steps)
-                                + random.uniform(0.0, 0.2),
-                                4,
-                            ),
-                            "valid_loss": round(
-                                2.5 * (1 - step / total_steps)
-                                + random.uniform(0.0, 0.3),
-                                4,
-                            ),
-                            "train_accuracy": round(
-                                0.3
-                                + (0.65 * step / total_steps)
-                                + random.uniform(0.0, 0.05),
-                                4,
-                            ),
+                            "train_loss": train_losses[i],
+                            "valid_loss": valid_losses[i],
+                            "train_accuracy": train_accuracies[i],
                         },
                     )
                     self.fine_tuning_checkpoints[job_id].append(checkpoint)
@@ -4619,9 +4647,7 @@ class FakeAIService:
                 job.fine_tuned_model = f"ft:{job.model}:org-fakeai::{timestamp}"
 
             # Calculate trained tokens (simulate based on training file size and epochs)
-            training_file = next(
-                (f for f in self.files if f.id == job.training_file), None
-            )
+            training_file = self.files_by_id.get(job.training_file)
             if training_file:
                 # Rough estimate: ~1 token per 4 bytes, multiplied by number of epochs
                 estimated_tokens = (
@@ -4629,16 +4655,16 @@ class FakeAIService:
                 ) * job.hyperparameters.n_epochs
                 job.trained_tokens = estimated_tokens
             else:
-                job.trained_tokens = random.randint(50000, 500000)
+                job.trained_tokens = int(rng.integers(50000, 500000, endpoint=True))
 
             event = FineTuningEvent(
-                id=f"ftevent-{uuid.uuid4().hex}",
+                id=self._fine_tuning_id("ftevent"),
                 created_at=int(time.time()),
                 level="info",
                 message=f"Training completed successfully. Fine-tuned model: {job.fine_tuned_model}",
                 type="message",
             )
-            self.fine_tuning_events[job_id].append(event)
+            self._add_fine_tuning_event(job_id, event)
 
             logger.info(f"Fine-tuning job {job_id} completed successfully")
 
@@ -4656,13 +4682,13 @@ class FakeAIService:
                     message=str(e),
                 )
                 event = FineTuningEvent(
-                    id=f"ftevent-{uuid.uuid4().hex}",
+                    id=self._fine_tuning_id("ftevent"),
                     created_at=int(time.time()),
                     level="error",
                     message=f"Training failed: {e}",
                     type="message",
                 )
-                self.fine_tuning_events[job_id].append(event)
+                self._add_fine_tuning_event(job_id, event)
         finally:
             # Clean up task reference
             if job_id in self.fine_tuning_tasks:
@@ -5312,7 +5338,7 @@ class RealtimeSessionHandler:
             for file_id in file_ids:
                 try:
                     # Validate file exists
-                    file_obj = next((f for f in self.files if f.id == file_id), None)
+                    file_obj = self.files_by_id.get(file_id)
                     if not file_obj:
                         logger.warning(
                             f"File {file_id} not found for vector store {vs_id}"
@@ -5380,7 +5406,7 @@ class RealtimeSessionHandler:
     ) -> list[dict[str, Any]]:
         """Simulate chunking a file into text segments."""
         # Find the file
-        file_obj = next((f for f in self.files if f.id == file_id), None)
+        file_obj = self.files_by_id.get(file_id)
         if not file_obj:
             return []
 
@@ -5611,7 +5637,7 @@ class RealtimeSessionHandler:
             raise ValueError(f"Vector store {vs_id} not found")
 
         # Validate file exists
-        file_obj = next((f for f in self.files if f.id == request.file_id), None)
+        file_obj = self.files_by_id.get(request.file_id)
         if not file_obj:
             raise ValueError(f"File {request.file_id} not found")
 
@@ -128,15 +128,19 @@ class DiskStorage(FileStorageBackend):
         """Get the metadata path for a file."""
         return self.base_dir / f"{file_id}.json"
 
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Write bytes to a sibling temp file and rename it over the target."""
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
     async def store(self, file_id: str, file: StoredFile) -> None:
         """Store a file on disk."""
         # Store file content
-        file_path = self._get_file_path(file_id)
-        with open(file_path, "wb") as f:
-            f.write(file.content)
+        self._write_atomic(self._get_file_path(file_id), file.content)
 
-        # Store metadata
-        metadata_path = self._get_metadata_path(file_id)
+        # Store metadata last so a file is only listed once it is complete
         metadata_dict = {
             "metadata": file.metadata.model_dump(),
             "checksum": file.checksum,
@@ -144,8 +148,9 @@ class DiskStorage(FileStorageBackend):
             "created_by": file.created_by,
             "expires_at": file.expires_at,
         }
-        with open(metadata_path, "w") as f:
-            json.dump(metadata_dict, f)
+        self._write_atomic(
+            self._get_metadata_path(file_id), json.dumps(metadata_dict).encode("utf-8")
+        )
 
     async def retrieve(self, file_id: str) -> StoredFile:
         """Retrieve a file from disk."""
@@ -331,31 +336,29 @@ class FileManager:
 
         return mime_type, detected_format
 
-    def _validate_jsonl(self, content: bytes) -> tuple[bool, str | None]:
+    def _parse_jsonl(self, content: bytes) -> tuple[list[tuple[int, Any]], str | None]:
         """
-        Validate JSONL format (newline-delimited JSON).
+        Decode and parse JSONL content (newline-delimited JSON) in one pass.
 
         Returns:
-            Tuple of (is_valid, error_message)
+            Tuple of (records, error_message), where records pairs each
+            1-based line number with its parsed JSON value
         """
         try:
             text = content.decode("utf-8")
-            lines = text.strip().split("\n")
-
-            if not lines:
-                return False, "JSONL file is empty"
+        except UnicodeDecodeError:
+            return [], "File is not valid UTF-8"
 
-            for i, line in enumerate(lines):
-                if not line.strip():
-                    continue  # Allow empty lines
-                try:
-                    json.loads(line)
-                except json.JSONDecodeError as e:
-                    return False, f"Invalid JSON on line {i + 1}: {str(e)}"
+        records = []
+        for i, line in enumerate(text.strip().split("\n")):
+            if not line.strip():
+                continue  # Allow empty lines
+            try:
+                records.append((i + 1, json.loads(line)))
+            except json.JSONDecodeError as e:
+                return [], f"Invalid JSON on line {i + 1}: {str(e)}"
 
-            return True, None
-        except UnicodeDecodeError:
-            return False, "File is not valid UTF-8"
+        return records, None
 
     def _validate_fine_tune_jsonl(self, content: bytes) -> tuple[bool, str | None]:
         """
@@ -364,32 +367,24 @@ class FileManager:
         Expected format:
         {"messages": [{"role": "system", "content": "..."}, {"role": "user", "content": "..."}, {"role": "assistant", "content": "..."}]}
         """
-        is_valid, error = self._validate_jsonl(content)
-        if not is_valid:
+        records, error = self._parse_jsonl(content)
+        if error is not None:
             return False, error
 
         try:
-            text = content.decode("utf-8")
-            lines = text.strip().split("\n")
-
-            for i, line in enumerate(lines):
-                if not line.strip():
-                    continue
-
-                data = json.loads(line)
-
+            for line_no, data in records:
                 # Check for required 'messages' field
                 if "messages" not in data:
                     return (
                         False,
-                        f"Line {i + 1}: Missing 'messages' field (required for fine-tuning)",
+                        f"Line {line_no}: Missing 'messages' field (required for fine-tuning)",
                     )
 
                 messages = data["messages"]
                 if not isinstance(messages, list) or len(messages) == 0:
                     return (
                         False,
-                        f"Line {i + 1}: 'messages' must be a non-empty list",
+                        f"Line {line_no}: 'messages' must be a non-empty list",
                     )
 
                 # Validate each message has role and content
@@ -397,17 +392,17 @@ class FileManager:
                     if not isinstance(msg, dict):
                         return (
                             False,
-                            f"Line {i + 1}, message {j + 1}: Message must be a dictionary",
+                            f"Line {line_no}, message {j + 1}: Message must be a dictionary",
                         )
                     if "role" not in msg:
                         return (
                             False,
-                            f"Line {i + 1}, message {j + 1}: Missing 'role' field",
+                            f"Line {line_no}, message {j + 1}: Missing 'role' field",
                         )
                     if "content" not in msg:
                         return (
                             False,
-                            f"Line {i + 1}, message {j + 1}: Missing 'content' field",
+                            f"Line {line_no}, message {j + 1}: Missing 'content' field",
                         )
 
             return True, None
@@ -421,39 +416,31 @@ class FileManager:
         Expected format:
         {"custom_id": "request-1", "method": "POST", "url": "/v1/chat/completions", "body": {...}}
         """
-        is_valid, error = self._validate_jsonl(content)
-        if not is_valid:
+        records, error = self._parse_jsonl(content)
+        if error is not None:
             return False, error
 
         try:
-            text = content.decode("utf-8")
-            lines = text.strip().split("\n")
-
-            for i, line in enumerate(lines):
-                if not line.strip():
-                    continue
-
-                data = json.loads(line)
-
+            for line_no, data in records:
                 # Check for required fields
                 required_fields = ["custom_id", "method", "url", "body"]
                 for field in required_fields:
                     if field not in data:
                         return (
                             False,
-                            f"Line {i + 1}: Missing required field '{field}' (batch format)",
+                            f"Line {line_no}: Missing required field '{field}' (batch format)",
                         )
 
                 # Validate method
                 if data["method"] not in ["GET", "POST", "PUT", "DELETE", "PATCH"]:
                     return (
                         False,
-                        f"Line {i + 1}: Invalid HTTP method '{data['method']}'",
+                        f"Line {line_no}: Invalid HTTP method '{data['method']}'",
                     )
 
                 # Validate body is a dict
                 if not isinstance(data["body"], dict):
-                    return False, f"Line {i + 1}: 'body' must be a dictionary"
+                    return False, f"Line {line_no}: 'body' must be a dictionary"
 
             return True, None
         except Exception as e:
@@ -8,7 +8,7 @@ including radix tree prefix matching, overlap scoring, and multi-worker load bal
 import hashlib
 import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -120,7 +120,7 @@ class RadixTree:
             }
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerState:
     """State of a simulated inference worker."""
 
@@ -233,26 +233,28 @@ class SmartRouter:
     def start_request(self, worker_id: str):
         """Mark request as started on worker."""
         with self._lock:
-            self.workers[worker_id].active_requests += 1
-            self.workers[worker_id].total_requests += 1
+            worker = self.workers[worker_id]
+            worker.active_requests += 1
+            worker.total_requests += 1
 
     def complete_request(self, worker_id: str, tokens: list[int], output_tokens: int):
         """Mark request as completed and update cache."""
-        with self._lock:
-            self.workers[worker_id].active_requests -= 1
-            self.workers[worker_id].total_tokens_processed += (
-                len(tokens) + output_tokens
-            )
+        # Hash the prefix blocks before taking the lock; this is the expensive
+        # part and touches no shared state
+        block_ids = [
+            f"block_{hash(tuple(tokens[: i + self.block_size]))}"
+            for i in range(0, len(tokens), self.block_size)
+        ]
 
         # Update radix tree with this prefix
         self.radix_tree.insert(tokens, worker_id)
 
-        # Update worker's cached blocks
+        # Update worker counters and cached blocks in one critical section
         with self._lock:
-            for i in range(0, len(tokens), self.block_size):
-                block_tokens = tokens[: i + self.block_size]
-                block_id = f"block_{hash(tuple(block_tokens))}"
-                self.workers[worker_id].cached_blocks.add(block_id)
+            worker = self.workers[worker_id]
+            worker.active_requests -= 1
+            worker.total_tokens_processed += len(tokens) + output_tokens
+            worker.cached_blocks.update(block_ids)
 
     def get_stats(self) -> dict[str, Any]:
         """Get routing and cache statistics."""
@@ -284,14 +286,23 @@ class SmartRouter:
 class KVCacheMetrics:
     """Track KV cache performance metrics."""
 
+    _SPEEDUP_FIELDS = (
+        "baseline_ttft",
+        "actual_ttft",
+        "speedup_ratio",
+        "cache_hit_ratio",
+    )
+
     def __init__(self):
         self.cache_hits = 0
         self.cache_misses = 0
         self.total_tokens_processed = 0
         self.cached_tokens_reused = 0
-        self.prefix_lengths = []
+        self.prefix_lengths: deque[int] = deque(maxlen=1000)
         self.hit_rates_by_endpoint = defaultdict(lambda: {"hits": 0, "misses": 0})
-        self.speedup_records = []
+        self.speedup_records: deque[dict[str, Any]] = deque(maxlen=1000)
+        # Running sums over speedup_records, kept in step with its evictions
+        self._speedup_sums = dict.fromkeys(self._SPEEDUP_FIELDS, 0.0)
         self._lock = threading.Lock()
 
     def record_cache_lookup(
@@ -331,29 +342,30 @@ class KVCacheMetrics:
         cache_hit_ratio: float,
     ):
         """Record TTFT speedup from cache hit."""
+        record = {
+            "endpoint": endpoint,
+            "baseline_ttft": baseline_ttft,
+            "actual_ttft": actual_ttft,
+            "cache_hit_ratio": cache_hit_ratio,
+            "speedup_ratio": baseline_ttft / actual_ttft if actual_ttft > 0 else 1.0,
+        }
+        sums = self._speedup_sums
         with self._lock:
-            self.speedup_records.append(
-                {
-                    "endpoint": endpoint,
-                    "baseline_ttft": baseline_ttft,
-                    "actual_ttft": actual_ttft,
-                    "cache_hit_ratio": cache_hit_ratio,
-                    "speedup_ratio": (
-                        baseline_ttft / actual_ttft if actual_ttft > 0 else 1.0
-                    ),
-                }
-            )
-            # Keep only the last 1000 records
-            if len(self.speedup_records) > 1000:
-                self.speedup_records = self.speedup_records[-1000:]
+            # Keep only the last 1000 records; drop the evicted one from the sums
+            if len(self.speedup_records) == self.speedup_records.maxlen:
+                evicted = self.speedup_records[0]
+                for key in self._SPEEDUP_FIELDS:
+                    sums[key] -= evicted[key]
+            self.speedup_records.append(record)
+            for key in self._SPEEDUP_FIELDS:
+                sums[key] += record[key]
 
     def get_stats(self) -> dict[str, Any]:
         """Get comprehensive cache statistics."""
         with self._lock:
+            # Every hit adds its prefix length to cached_tokens_reused
             avg_prefix = (
-                sum(self.prefix_lengths) / len(self.prefix_lengths)
-                if self.prefix_lengths
-                else 0
+                self.cached_tokens_reused / self.cache_hits if self.cache_hits else 0
             )
 
             # Calculate rates directly to avoid deadlock from calling other locked methods
@@ -369,18 +381,12 @@ class KVCacheMetrics:
             # Calculate speedup statistics
             speedup_stats = {}
             if self.speedup_records:
-                avg_baseline = sum(
-                    r["baseline_ttft"] for r in self.speedup_records
-                ) / len(self.speedup_records)
-                avg_actual = sum(r["actual_ttft"] for r in self.speedup_records) / len(
-                    self.speedup_records
-                )
-                avg_speedup = sum(
-                    r["speedup_ratio"] for r in self.speedup_records
-                ) / len(self.speedup_records)
-                avg_cache_ratio = sum(
-                    r["cache_hit_ratio"] for r in self.speedup_records
-                ) / len(self.speedup_records)
+                count = len(self.speedup_records)
+                sums = self._speedup_sums
+                avg_baseline = sums["baseline_ttft"] / count
+                avg_actual = sums["actual_ttft"] / count
+                avg_speedup = sums["speedup_ratio"] / count
+                avg_cache_ratio = sums["cache_hit_ratio"] / count
 
                 speedup_stats = {
                     "avg_baseline_ttft_ms": round(avg_baseline * 1000, 2),
@@ -172,36 +172,6 @@ class AdvancedRadixTree:
 
         return node
 
-    def _split_compressed_node(self, node: AdvancedRadixNode, new_sequence: list[int]):
-        """Split a compressed node when sequences diverge."""
-        # Find common prefix
-        common_len = 0
-        for i in range(min(len(node.token_sequence), len(new_sequence))):
-            if node.token_sequence[i] == new_sequence[i]:
-                common_len += 1
-            else:
-                break
-
-        if common_len > 0:
-            # Split the node
-            old_suffix = node.token_sequence[common_len:]
-            new_suffix = new_sequence[common_len:]
-
-            # Update current node to common prefix
-            node.token_sequence = node.token_sequence[:common_len]
-
-            # Create child for old suffix if it exists
-            if old_suffix:
-                old_child = AdvancedRadixNode(token_sequence=old_suffix)
-                node.children[old_suffix[0]] = old_child
-                self.total_nodes += 1
-
-            # Create child for new suffix if it exists
-            if new_suffix:
-                new_child = AdvancedRadixNode(token_sequence=new_suffix)
-                node.children[new_suffix[0]] = new_child
-                self.total_nodes += 1
-
     def find_longest_prefix(
         self, tokens: list[int]
     ) -> tuple[int, list[str], set[str], int]:
@@ -629,7 +599,7 @@ class CacheMemoryManager:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerPerformance:
     """Track worker performance for adaptive routing."""
 
@@ -642,6 +612,37 @@ class WorkerPerformance:
     avg_prefill_time_ms: float = 0.0
     affinity_scores: dict[str, float] = field(default_factory=dict)  # user -> score
     load_factor: float = 1.0  # Dynamic load multiplier
+    _stats_cache: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def invalidate(self) -> None:
+        """Drop the memoised stats after the worker's counters change."""
+        self._stats_cache = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Rounded performance stats, rebuilt only after `invalidate()`.
+
+        Returns a copy, so callers may modify it without touching the cache.
+        """
+        if self._stats_cache is None:
+            total_requests = self.success_count + self.failure_count
+            success_rate = (
+                self.success_count / total_requests * 100 if total_requests > 0 else 0.0
+            )
+            avg_latency = (
+                self.total_latency_ms / self.request_count
+                if self.request_count > 0
+                else 0.0
+            )
+            self._stats_cache = {
+                "total_requests": self.request_count,
+                "success_rate": round(success_rate, 2),
+                "avg_latency_ms": round(avg_latency, 2),
+                "load_factor": round(self.load_factor, 2),
+                "affinity_count": len(self.affinity_scores),
+            }
+        return dict(self._stats_cache)
 
 
 class AdaptiveRouter:
@@ -832,6 +833,7 @@ class AdaptiveRouter:
             avg_latency = worker.total_latency_ms / worker.request_count
             # Normalize to [0.5, 2.0] range
             worker.load_factor = 0.5 + min(1.5, avg_latency / 1000.0)
+            worker.invalidate()
 
         # Update caches
         if success:
@@ -856,6 +858,7 @@ class AdaptiveRouter:
         worker.affinity_scores[user_id] = (
             0.9 * worker.affinity_scores[user_id] + 0.1 * 1.0
         )
+        worker.invalidate()
 
     def _check_scaling(self):
         """Check if worker pool should scale up or down."""
@@ -891,28 +894,13 @@ class AdaptiveRouter:
     def get_stats(self) -> dict[str, Any]:
         """Get comprehensive routing statistics."""
         with self._lock:
-            worker_stats = {}
-            for worker_id, worker in self.workers.items():
-                total_requests = worker.success_count + worker.failure_count
-                success_rate = (
-                    worker.success_count / total_requests * 100
-                    if total_requests > 0
-                    else 0.0
-                )
-                avg_latency = (
-                    worker.total_latency_ms / worker.request_count
-                    if worker.request_count > 0
-                    else 0.0
-                )
-
-                worker_stats[worker_id] = {
+            worker_stats = {
+                worker_id: {
                     "active_requests": self.active_requests[worker_id],
-                    "total_requests": worker.request_count,
-                    "success_rate": round(success_rate, 2),
-                    "avg_latency_ms": round(avg_latency, 2),
-                    "load_factor": round(worker.load_factor, 2),
-                    "affinity_count": len(worker.affinity_scores),
+                    **worker.to_dict(),
                 }
+                for worker_id, worker in self.workers.items()
+            }
 
             # Recent request distribution
             recent_distribution = defaultdict(int)
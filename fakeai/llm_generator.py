@@ -494,6 +494,11 @@ def get_generator(
     """
     global _default_generator
 
+    # Lock-free fast path once the generator exists.
+    generator = _default_generator
+    if generator is not None:
+        return generator
+
     with _generator_lock:
         if _default_generator is None:
             _default_generator = LightweightLLMGenerator(
@@ -37,7 +37,7 @@ class StreamingMetrics:
     """Metrics for a single stream."""
 
     stream_id: str
-    start_time: float
+    start_time: float  # time.monotonic() seconds; only used for durations
     first_token_time: float | None = None
     last_token_time: float | None = None
     token_count: int = 0
@@ -196,13 +196,14 @@ class MetricsWindow:
                 }
 
             # Use numpy for efficient percentile calculations
+            p50, p90, p99 = np.percentile(valid_latencies, (50, 90, 99))
             return {
                 "avg": float(np.mean(valid_latencies)),
                 "min": float(np.min(valid_latencies)),
                 "max": float(np.max(valid_latencies)),
-                "p50": float(np.percentile(valid_latencies, 50)),
-                "p90": float(np.percentile(valid_latencies, 90)),
-                "p99": float(np.percentile(valid_latencies, 99)),
+                "p50": float(p50),
+                "p90": float(p90),
+                "p99": float(p99),
             }
 
     def get_stats(self) -> Dict[str, float]:
@@ -220,6 +221,10 @@ class MetricsTracker:
     _lock = threading.Lock()
 
     def __new__(cls):
+        # Lock-free fast path once the singleton exists.
+        instance = cls._instance
+        if instance is not None:
+            return instance
         with cls._lock:
             if cls._instance is None:
                 cls._instance = super(MetricsTracker, cls).__new__(cls)
@@ -324,14 +329,14 @@ class MetricsTracker:
     def start_request_timer(self, endpoint: str) -> int:
         """Start timing a request and return a request ID."""
         request_id = hash(f"{endpoint}_{time.time()}_{random.random()}")
-        self._response_times[endpoint].append((request_id, time.time()))
+        self._response_times[endpoint].append((request_id, time.monotonic()))
         return request_id
 
     def end_request_timer(self, endpoint: str, request_id: int) -> float:
         """End timing a request and return the latency."""
         for i, (rid, start_time) in enumerate(self._response_times[endpoint]):
             if rid == request_id:
-                latency = time.time() - start_time
+                latency = time.monotonic() - start_time
                 self.track_response(endpoint, latency)
                 return latency
 
@@ -344,7 +349,7 @@ class MetricsTracker:
         with self._streaming_lock:
             self._streaming_metrics[stream_id] = StreamingMetrics(
                 stream_id=stream_id,
-                start_time=time.time(),
+                start_time=time.monotonic(),
             )
             self._metrics[MetricType.STREAMING][endpoint].add()
 
@@ -352,7 +357,7 @@ class MetricsTracker:
         """Track the first token in a stream (TTFT)."""
         with self._streaming_lock:
             if stream_id in self._streaming_metrics:
-                self._streaming_metrics[stream_id].first_token_time = time.time()
+                self._streaming_metrics[stream_id].first_token_time = time.monotonic()
 
     def track_stream_token(self, stream_id: str) -> None:
         """Track a token in a stream."""
@@ -360,7 +365,7 @@ class MetricsTracker:
             if stream_id in self._streaming_metrics:
                 metrics = self._streaming_metrics[stream_id]
                 metrics.token_count += 1
-                metrics.last_token_time = time.time()
+                metrics.last_token_time = time.monotonic()
 
     def complete_stream(self, stream_id: str, endpoint: str) -> None:
         """Mark a stream as completed successfully."""
@@ -368,7 +373,7 @@ class MetricsTracker:
             if stream_id in self._streaming_metrics:
                 metrics = self._streaming_metrics[stream_id]
                 metrics.completed = True
-                metrics.total_duration = time.time() - metrics.start_time
+                metrics.total_duration = time.monotonic() - metrics.start_time
 
                 # Move to completed streams
                 self._completed_streams.append(metrics)
@@ -389,7 +394,7 @@ class MetricsTracker:
                 metrics = self._streaming_metrics[stream_id]
                 metrics.failed = True
                 metrics.error_message = error_message
-                metrics.total_duration = time.time() - metrics.start_time
+                metrics.total_duration = time.monotonic() - metrics.start_time
 
                 # Move to failed streams
                 self._failed_streams.append(metrics)
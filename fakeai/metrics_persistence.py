@@ -22,6 +22,10 @@ from typing import Any, Literal
 
 logger = logging.getLogger(__name__)
 
+# Types stored as metric values; a module constant so the per-value isinstance
+# checks in save_snapshot don't rebuild the tuple each time
+_NUMERIC = (int, float)
+
 
 class ExportFormat(Enum):
     """Supported export formats."""
@@ -199,7 +203,9 @@ class MetricsPersistence:
             metrics: Metrics dictionary from MetricsTracker.get_metrics()
         """
         timestamp = time.time()
-        snapshots: list[MetricSnapshot] = []
+        # Rows go straight into executemany, so build the insert tuples here
+        # rather than a MetricSnapshot per value that is only flattened again
+        rows: list[tuple[float, str, str | None, str, float]] = []
 
         # Extract metrics from the nested structure
         # Format: {metric_type: {endpoint: {metric_name: value}}}
@@ -207,71 +213,82 @@ class MetricsPersistence:
             if metric_type == "streaming_stats":
                 # Handle streaming stats separately
                 for key, value in endpoints.items():
-                    if isinstance(value, (int, float)):
-                        snapshots.append(
-                            MetricSnapshot(
-                                timestamp=timestamp,
-                                endpoint="/streaming",
-                                model=None,
-                                metric_name=f"streaming_{key}",
-                                metric_value=float(value),
+                    if isinstance(value, _NUMERIC):
+                        rows.append(
+                            (
+                                timestamp,
+                                "/streaming",
+                                None,
+                                f"streaming_{key}",
+                                float(value),
                             )
                         )
                     elif isinstance(value, dict):
                         for sub_key, sub_value in value.items():
-                            if isinstance(sub_value, (int, float)):
-                                snapshots.append(
-                                    MetricSnapshot(
-                                        timestamp=timestamp,
-                                        endpoint="/streaming",
-                                        model=None,
-                                        metric_name=f"streaming_{key}_{sub_key}",
-                                        metric_value=float(sub_value),
+                            if isinstance(sub_value, _NUMERIC):
+                                rows.append(
+                                    (
+                                        timestamp,
+                                        "/streaming",
+                                        None,
+                                        f"streaming_{key}_{sub_key}",
+                                        float(sub_value),
                                     )
                                 )
             elif isinstance(endpoints, dict):
                 for endpoint, stats in endpoints.items():
                     if isinstance(stats, dict):
                         for stat_name, stat_value in stats.items():
-                            if isinstance(stat_value, (int, float)):
-                                snapshots.append(
-                                    MetricSnapshot(
-                                        timestamp=timestamp,
-                                        endpoint=endpoint,
-                                        model=None,
-                                        metric_name=f"{metric_type}_{stat_name}",
-                                        metric_value=float(stat_value),
+                            if isinstance(stat_value, _NUMERIC):
+                                rows.append(
+                                    (
+                                        timestamp,
+                                        endpoint,
+                                        None,
+                                        f"{metric_type}_{stat_name}",
+                                        float(stat_value),
                                     )
                                 )
 
         # Batch insert for efficiency
-        if snapshots:
-            self._batch_insert(snapshots)
-            logger.debug(f"Saved {len(snapshots)} metric snapshots")
+        if rows:
+            self._insert_rows(rows)
+            logger.debug(f"Saved {len(rows)} metric snapshots")
 
     def _batch_insert(self, snapshots: list[MetricSnapshot]) -> None:
         """Batch insert snapshots into database."""
+        self._insert_rows(
+            [
+                (
+                    s.timestamp,
+                    s.endpoint,
+                    s.model,
+                    s.metric_name,
+                    s.metric_value,
+                )
+                for s in snapshots
+            ]
+        )
+
+    def _insert_rows(
+        self, rows: list[tuple[float, str, str | None, str, float]]
+    ) -> None:
+        """
+        Batch insert metric rows into database.
+
+        Args:
+            rows: (timestamp, endpoint, model, metric_name, metric_value) tuples
+        """
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        data = [
-            (
-                s.timestamp,
-                s.endpoint,
-                s.model,
-                s.metric_name,
-                s.metric_value,
-            )
-            for s in snapshots
-        ]
-
         cursor.executemany(
             """
             INSERT INTO metrics_timeseries
             (timestamp, endpoint, model, metric_name, metric_value)
             VALUES (?, ?, ?, ?, ?)
         """,
-            data,
+            rows,
         )
 
         conn.commit()
@@ -601,7 +618,7 @@ class MetricsPersistence:
             Number of metrics imported
         """
         input_path = Path(input_path)
-        snapshots: list[MetricSnapshot] = []
+        rows: list[tuple[float, str, str | None, str, float]] = []
 
         with open(input_path, "rb") as f:
             # Read header
@@ -635,22 +652,14 @@ class MetricsPersistence:
                 # Metric value
                 metric_value = struct.unpack("d", f.read(8))[0]
 
-                snapshots.append(
-                    MetricSnapshot(
-                        timestamp=timestamp,
-                        endpoint=endpoint,
-                        model=model,
-                        metric_name=metric_name,
-                        metric_value=metric_value,
-                    )
-                )
+                rows.append((timestamp, endpoint, model, metric_name, metric_value))
 
         # Import into database
-        if snapshots:
-            self._batch_insert(snapshots)
-            logger.info(f"Imported {len(snapshots)} metrics from {input_path}")
+        if rows:
+            self._insert_rows(rows)
+            logger.info(f"Imported {len(rows)} metrics from {input_path}")
 
-        return len(snapshots)
+        return len(rows)
 
     def replay_metrics(
         self,
@@ -168,12 +168,13 @@ class ModelStats:
         if not self.latencies:
             return {"p50": 0.0, "p90": 0.0, "p95": 0.0, "p99": 0.0}
 
-        latencies_array = np.array(self.latencies)
+        # One percentile pass for all four cut points
+        p50, p90, p95, p99 = np.percentile(self.latencies, (50, 90, 95, 99))
         return {
-            "p50": float(np.percentile(latencies_array, 50)),
-            "p90": float(np.percentile(latencies_array, 90)),
-            "p95": float(np.percentile(latencies_array, 95)),
-            "p99": float(np.percentile(latencies_array, 99)),
+            "p50": float(p50),
+            "p90": float(p90),
+            "p95": float(p95),
+            "p99": float(p99),
         }
 
     def calculate_cost(self) -> float:
@@ -209,6 +210,10 @@ class ModelMetricsTracker:
     _lock = threading.Lock()
 
     def __new__(cls):
+        # Lock-free fast path once the singleton exists.
+        instance = cls._instance
+        if instance is not None:
+            return instance
         with cls._lock:
             if cls._instance is None:
                 cls._instance = super(ModelMetricsTracker, cls).__new__(cls)
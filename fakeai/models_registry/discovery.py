@@ -28,6 +28,37 @@ from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any
 
+# Patterns used by normalize_model_id / infer_model_characteristics, compiled
+# once at import instead of on every call
+_VERSION_SUFFIX_PATTERN = re.compile(r"-v\d+$")
+_SIZE_PATTERN = re.compile(r"(\d+)b\b")
+
+# Each table is fused into one alternation so a model id is scanned once per
+# characteristic; the provider regex dispatches on the matching group name
+# (alternatives are tried in order, so the first listed provider wins)
+_PROVIDER_PATTERN = re.compile(
+    "^(?:"
+    + "|".join(
+        f"(?P<{provider}>{alternatives})"
+        for provider, alternatives in {
+            "openai": r"openai/|gpt-",
+            "meta": r"meta/|meta-llama/|llama-",
+            "anthropic": r"anthropic/|claude-",
+            "google": r"google/|gemini-|palm-",
+            "mistral": r"mistral/|mixtral-",
+            "deepseek": r"deepseek-ai/|deepseek-",
+            "nvidia": r"nvidia/|cosmos-",
+            "cohere": r"cohere/|command-",
+        }.items()
+    )
+    + ")"
+)
+_REASONING_PATTERN = re.compile(r"gpt-oss|deepseek-r1|\bo1\b|\bo3\b|reasoning")
+_MOE_PATTERN = re.compile(r"mixtral|gpt-oss|deepseek-v\d+|moe")
+_VISION_PATTERN = re.compile(r"vision|gpt-4o|gpt-4-turbo|claude-3|gemini|llava")
+_AUDIO_PATTERN = re.compile(r"audio|whisper|speech")
+_VIDEO_PATTERN = re.compile(r"video|cosmos")
+
 
 @dataclass
 class ModelCharacteristics:
@@ -252,7 +283,7 @@ def normalize_model_id(model_id: str) -> str:
             break
 
     # Remove version suffixes like -v1, -v2, etc.
-    normalized = re.sub(r"-v\d+$", "", normalized)
+    normalized = _VERSION_SUFFIX_PATTERN.sub("", normalized)
 
     # Standardize separators: remove hyphens, underscores, and slashes
     normalized = normalized.replace("-", "").replace("_", "").replace("/", "")
@@ -390,61 +421,27 @@ def infer_model_characteristics(model_id: str) -> ModelCharacteristics:
             model_lower = parsed.base_model.lower()  # Analyze base model
 
     # Detect provider
-    provider_patterns = {
-        "openai": r"^(openai/|gpt-)",
-        "meta": r"^(meta/|meta-llama/|llama-)",
-        "anthropic": r"^(anthropic/|claude-)",
-        "google": r"^(google/|gemini-|palm-)",
-        "mistral": r"^(mistral/|mixtral-)",
-        "deepseek": r"^(deepseek-ai/|deepseek-)",
-        "nvidia": r"^(nvidia/|cosmos-)",
-        "cohere": r"^(cohere/|command-)",
-    }
-
-    for provider, pattern in provider_patterns.items():
-        if re.search(pattern, model_lower):
-            chars.provider = provider
-            break
+    provider_match = _PROVIDER_PATTERN.match(model_lower)
+    if provider_match:
+        chars.provider = provider_match.lastgroup
 
     # Detect reasoning models
-    reasoning_patterns = [
-        r"gpt-oss",
-        r"deepseek-r1",
-        r"\bo1\b",
-        r"\bo3\b",
-        r"reasoning",
-    ]
-    chars.is_reasoning = any(
-        re.search(pattern, model_lower) for pattern in reasoning_patterns
-    )
+    chars.is_reasoning = _REASONING_PATTERN.search(model_lower) is not None
 
     # Detect MoE models
-    moe_patterns = [r"mixtral", r"gpt-oss", r"deepseek-v\d+", r"moe"]
-    chars.is_moe = any(re.search(pattern, model_lower) for pattern in moe_patterns)
+    chars.is_moe = _MOE_PATTERN.search(model_lower) is not None
 
     # Detect vision models
-    vision_patterns = [
-        r"vision",
-        r"gpt-4o",
-        r"gpt-4-turbo",
-        r"claude-3",
-        r"gemini",
-        r"llava",
-    ]
-    chars.is_vision = any(
-        re.search(pattern, model_lower) for pattern in vision_patterns
-    )
+    chars.is_vision = _VISION_PATTERN.search(model_lower) is not None
 
     # Detect audio models
-    audio_patterns = [r"audio", r"whisper", r"speech"]
-    chars.is_audio = any(re.search(pattern, model_lower) for pattern in audio_patterns)
+    chars.is_audio = _AUDIO_PATTERN.search(model_lower) is not None
 
     # Detect video models
-    video_patterns = [r"video", r"cosmos"]
-    chars.is_video = any(re.search(pattern, model_lower) for pattern in video_patterns)
+    chars.is_video = _VIDEO_PATTERN.search(model_lower) is not None
 
     # Extract parameter size
-    size_match = re.search(r"(\d+)b\b", model_lower)
+    size_match = _SIZE_PATTERN.search(model_lower)
     if size_match:
         chars.estimated_size = f"{size_match.group(1)}b"
 
@@ -138,6 +138,10 @@ class RateLimiter:
 
     def __new__(cls):
         """Ensure only one instance exists (singleton pattern)."""
+        # Lock-free fast path once the singleton exists.
+        instance = cls._instance
+        if instance is not None:
+            return instance
         with cls._lock:
             if cls._instance is None:
                 cls._instance = super(RateLimiter, cls).__new__(cls)
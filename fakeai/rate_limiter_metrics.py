@@ -488,14 +488,15 @@ class RateLimiterMetrics:
             )
 
             # Retry-after percentiles
+            p90, p95, p99 = np.percentile(self._throttle_durations, (90, 95, 99))
             retry_after_distribution = {
                 "min": float(np.min(self._throttle_durations)),
                 "max": float(np.max(self._throttle_durations)),
                 "avg": float(np.mean(self._throttle_durations)),
                 "median": float(np.median(self._throttle_durations)),
-                "p90": float(np.percentile(self._throttle_durations, 90)),
-                "p95": float(np.percentile(self._throttle_durations, 95)),
-                "p99": float(np.percentile(self._throttle_durations, 99)),
+                "p90": float(p90),
+                "p95": float(p95),
+                "p99": float(p99),
             }
 
             # Analyze RPM vs TPM exceeded
@@ -17,6 +17,7 @@ import threading
 import time
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import Any
 
 from fakeai.kv_cache import RadixTree, WorkerState
@@ -70,7 +71,7 @@ class WorkerHealthMetrics:
         return self.timeout_count / total if total > 0 else 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class AdvancedWorkerState(WorkerState):
     """Extended worker state with advanced metrics."""
 
@@ -163,6 +164,10 @@ class AdvancedSmartRouter:
         self._round_robin_index = 0
         self._lock = threading.Lock()
 
+        # Healthy worker ids, rebuilt only after a health transition
+        self._health_version = 0
+        self._healthy_cache: tuple[tuple[int, int], tuple[str, ...]] | None = None
+
         # Affinity tracking
         self.conversation_affinity: dict[str, str] = {}  # conversation_id -> worker_id
         self.user_affinity: dict[str, list[str]] = defaultdict(
@@ -652,13 +657,22 @@ class AdvancedSmartRouter:
 
         return 1000.0  # Default 1s
 
-    def _get_healthy_workers(self) -> list[str]:
-        """Get list of healthy (non-failed) workers."""
-        return [
+    def _get_healthy_workers(self) -> tuple[str, ...]:
+        """Get healthy (non-failed) workers, cached between health transitions."""
+        # Workers may also be registered directly in worker_health, so the
+        # cache is keyed on its size as well as the transition counter
+        key = (self._health_version, len(self.worker_health))
+        cached = self._healthy_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        healthy = tuple(
             worker_id
             for worker_id, health in self.worker_health.items()
             if health.is_healthy
-        ]
+        )
+        self._healthy_cache = (key, healthy)
+        return healthy
 
     def _is_worker_available(self, worker_id: str) -> bool:
         """Check if worker is available (exists and healthy)."""
@@ -684,6 +698,8 @@ class AdvancedSmartRouter:
             logger.warning(f"Unknown worker {worker_id}")
             return
 
+        now = time.time()
+
         with self._lock:
             health = self.worker_health[worker_id]
             worker = self.workers[worker_id]
@@ -694,18 +710,18 @@ class AdvancedSmartRouter:
             if timeout:
                 health.timeout_count += 1
                 health.failure_count += 1
-                health.last_failure_time = time.time()
+                health.last_failure_time = now
             elif success:
                 health.success_count += 1
-                health.last_success_time = time.time()
+                health.last_success_time = now
             else:
                 health.failure_count += 1
-                health.last_failure_time = time.time()
+                health.last_failure_time = now
 
             # Add to worker history
             worker.request_history.append(
                 {
-                    "timestamp": time.time(),
+                    "timestamp": now,
                     "success": success,
                     "latency_ms": latency_ms,
                     "timeout": timeout,
@@ -713,9 +729,9 @@ class AdvancedSmartRouter:
             )
 
             # Update health status
-            self._update_health_status(worker_id)
+            self._update_health_status(worker_id, now)
 
-    def _update_health_status(self, worker_id: str):
+    def _update_health_status(self, worker_id: str, now: float):
         """Update worker health status based on thresholds."""
         health = self.worker_health[worker_id]
         thresholds = self.health_thresholds
@@ -743,7 +759,7 @@ class AdvancedSmartRouter:
             # Check if we have enough recent successes
             recent_successes = sum(
                 1
-                for req in list(self.workers[worker_id].request_history)[-10:]
+                for req in islice(reversed(self.workers[worker_id].request_history), 10)
                 if req.get("success", False)
             )
             can_recover = (
@@ -764,6 +780,7 @@ class AdvancedSmartRouter:
             # Recovery takes priority
             if not health.is_healthy:
                 logger.info(f"Worker {worker_id} recovered from UNHEALTHY")
+                self._health_version += 1
             elif health.is_degraded:
                 logger.info(f"Worker {worker_id} recovered from DEGRADED")
 
@@ -781,9 +798,10 @@ class AdvancedSmartRouter:
                     f"latency={avg_latency:.0f}ms, "
                     f"timeout_rate={timeout_rate:.2%}"
                 )
+                self._health_version += 1
             health.is_healthy = False
             if health.unhealthy_since is None:
-                health.unhealthy_since = time.time()
+                health.unhealthy_since = now
         elif is_degraded:
             # Mark as degraded (or keep degraded status)
             if health.is_healthy and not health.is_degraded:
@@ -795,7 +813,7 @@ class AdvancedSmartRouter:
                 )
             health.is_degraded = True
             if health.degraded_since is None:
-                health.degraded_since = time.time()
+                health.degraded_since = now
 
     def start_request(self, worker_id: str):
         """Mark request as started on worker."""
@@ -930,25 +948,42 @@ class AdvancedSmartRouter:
             Optimization suggestions and pool analysis
         """
         with self._lock:
-            total_requests = sum(w.total_requests for w in self.workers.values())
-            total_active = sum(w.active_requests for w in self.workers.values())
+            # Single pass over workers for request totals and peak load
+            total_requests = 0
+            total_active = 0
+            max_active = 0
+            for worker in self.workers.values():
+                total_requests += worker.total_requests
+                total_active += worker.active_requests
+                if worker.active_requests > max_active:
+                    max_active = worker.active_requests
+
+            worker_utilization = {
+                worker_id: (
+                    worker.total_requests / total_requests
+                    if total_requests > 0
+                    else 0.0
+                )
+                for worker_id, worker in self.workers.items()
+            }
 
-            worker_utilization = {}
-            for worker_id, worker in self.workers.items():
-                if total_requests > 0:
-                    utilization = worker.total_requests / total_requests
+            # Single pass over health records to bucket worker status
+            healthy_count = 0
+            unhealthy = []
+            degraded = []
+            for w_id, h in self.worker_health.items():
+                if not h.is_healthy:
+                    unhealthy.append(w_id)
                 else:
-                    utilization = 0.0
-                worker_utilization[worker_id] = utilization
+                    healthy_count += 1
+                    if h.is_degraded:
+                        degraded.append(w_id)
 
             # Identify issues
             suggestions = []
             warnings = []
 
             # Check for overloaded workers
-            max_active = max(
-                (w.active_requests for w in self.workers.values()), default=0
-            )
             if max_active > 10:
                 suggestions.append(
                     f"High load detected: {max_active} active requests on busiest worker. "
@@ -956,9 +991,6 @@ class AdvancedSmartRouter:
                 )
 
             # Check for unhealthy workers
-            unhealthy = [
-                w_id for w_id, h in self.worker_health.items() if not h.is_healthy
-            ]
             if unhealthy:
                 warnings.append(
                     f"{len(unhealthy)} unhealthy worker(s): {', '.join(unhealthy)}"
@@ -968,11 +1000,6 @@ class AdvancedSmartRouter:
                 )
 
             # Check for degraded workers
-            degraded = [
-                w_id
-                for w_id, h in self.worker_health.items()
-                if h.is_degraded and h.is_healthy
-            ]
             if degraded:
                 warnings.append(
                     f"{len(degraded)} degraded worker(s): {', '.join(degraded)}"
@@ -1003,9 +1030,7 @@ class AdvancedSmartRouter:
 
         return {
             "total_workers": len(self.workers),
-            "healthy_workers": len(
-                [h for h in self.worker_health.values() if h.is_healthy]
-            ),
+            "healthy_workers": healthy_count,
             "degraded_workers": len(degraded),
             "unhealthy_workers": len(unhealthy),
             "total_active_requests": total_active,
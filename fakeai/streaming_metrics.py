@@ -8,8 +8,10 @@ client behavior, and advanced analytics.
 
 #  SPDX-License-Identifier: Apache-2.0
 
+import copy
 import logging
 import statistics
+import sys
 import threading
 import time
 from collections import defaultdict, deque
@@ -20,8 +22,11 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Number of active-stream shards (must be a power of two)
+ACTIVE_STREAM_SHARDS = 16
 
-@dataclass
+
+@dataclass(slots=True)
 class TokenTiming:
     """Timing information for a single token."""
 
@@ -31,7 +36,7 @@ class TokenTiming:
     sequence_number: int  # Token position in stream
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamLifecycle:
     """Complete lifecycle tracking for a single stream."""
 
@@ -40,8 +45,11 @@ class StreamLifecycle:
     prompt_tokens: int
     start_time_ns: int
 
-    # Token tracking
-    tokens: List[TokenTiming] = field(default_factory=list)
+    # Token tracking (a bounded deque when token_window is set)
+    tokens: List[TokenTiming] | deque[TokenTiming] = field(default_factory=list)
+    token_window: Optional[int] = None  # Max token timings retained
+    dropped_tokens: int = 0  # Token timings evicted from the window
+    dropped_token_bytes: int = 0  # UTF-8 bytes of the evicted tokens
 
     # Timing milestones
     first_token_time_ns: Optional[int] = None
@@ -67,6 +75,75 @@ class StreamLifecycle:
     temperature: Optional[float] = None
     max_tokens: Optional[int] = None
 
+    # Derived stats, computed once after the stream finishes
+    finished_stats: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def reset(
+        self,
+        stream_id: str,
+        model: str,
+        prompt_tokens: int,
+        start_time_ns: int,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> None:
+        """Reinitialize this lifecycle in place so it can be reused for a new stream."""
+        self.stream_id = stream_id
+        self.model = model
+        self.prompt_tokens = prompt_tokens
+        self.start_time_ns = start_time_ns
+        self.tokens.clear()
+        self.dropped_tokens = 0
+        self.dropped_token_bytes = 0
+        self.first_token_time_ns = None
+        self.last_token_time_ns = None
+        self.completion_time_ns = None
+        self.finish_reason = None
+        self.cancelled = False
+        self.cancellation_point = None
+        self.error_message = None
+        self.chunks_sent = 0
+        self.total_bytes_sent = 0
+        self.chunk_sizes.clear()
+        self.backpressure_events = 0
+        self.stall_events = 0
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.finished_stats = None
+
+    def add_token(
+        self, token: str, timestamp_ns: int, chunk_size_bytes: Optional[int] = None
+    ) -> None:
+        """Append a token timing and update first/last token times and stalls."""
+        # Record first token time
+        if self.first_token_time_ns is None:
+            self.first_token_time_ns = timestamp_ns
+
+        # Check for stalls (ITL > 500ms)
+        if self.tokens:
+            itl_ms = (timestamp_ns - self.tokens[-1].timestamp_ns) / 1_000_000
+            if itl_ms > 500.0:
+                self.stall_events += 1
+
+        # Update last token time
+        self.last_token_time_ns = timestamp_ns
+
+        sequence_number = self.get_token_count()
+        if self.token_window is not None and len(self.tokens) == self.token_window:
+            self.dropped_tokens += 1
+            self.dropped_token_bytes += len(self.tokens[0].token.encode("utf-8"))
+
+        self.tokens.append(
+            TokenTiming(
+                token=token,
+                timestamp_ns=timestamp_ns,
+                chunk_size_bytes=chunk_size_bytes or len(token.encode("utf-8")),
+                sequence_number=sequence_number,
+            )
+        )
+
     def get_ttft_ms(self) -> Optional[float]:
         """Get time to first token in milliseconds."""
         if self.first_token_time_ns is None:
@@ -81,12 +158,13 @@ class StreamLifecycle:
 
     def get_token_count(self) -> int:
         """Get total number of tokens in stream."""
-        return len(self.tokens)
+        return len(self.tokens) + self.dropped_tokens
 
     def get_tokens_per_second(self) -> Optional[float]:
         """Get tokens per second (excluding TTFT)."""
+        token_count = self.get_token_count()
         if (
-            len(self.tokens) < 2
+            token_count < 2
             or self.last_token_time_ns is None
             or self.first_token_time_ns is None
         ):
@@ -96,17 +174,21 @@ class StreamLifecycle:
         ) / 1_000_000_000
         if duration_s <= 0:
             return None
-        return (len(self.tokens) - 1) / duration_s
+        return (token_count - 1) / duration_s
+
+    def get_token_timestamps_ns(self) -> np.ndarray:
+        """Get token timestamps as a contiguous int64 array."""
+        return np.fromiter(
+            (t.timestamp_ns for t in self.tokens),
+            dtype=np.int64,
+            count=len(self.tokens),
+        )
 
     def get_inter_token_latencies_ms(self) -> List[float]:
         """Get inter-token latencies in milliseconds."""
         if len(self.tokens) < 2:
             return []
-        itls = []
-        for i in range(1, len(self.tokens)):
-            itl_ns = self.tokens[i].timestamp_ns - self.tokens[i - 1].timestamp_ns
-            itls.append(itl_ns / 1_000_000)
-        return itls
+        return (np.diff(self.get_token_timestamps_ns()) / 1_000_000).tolist()
 
     def calculate_jitter_ms(self) -> Optional[float]:
         """Calculate jitter (standard deviation of ITL) in milliseconds."""
@@ -149,21 +231,16 @@ class StreamLifecycle:
 
         # Calculate tokens/sec in 5-token windows
         window_size = 5
-        throughputs = []
-
-        for i in range(0, len(self.tokens) - window_size):
-            window_start_ns = self.tokens[i].timestamp_ns
-            window_end_ns = self.tokens[i + window_size - 1].timestamp_ns
-            duration_s = (window_end_ns - window_start_ns) / 1_000_000_000
-
-            if duration_s > 0:
-                tps = window_size / duration_s
-                throughputs.append(tps)
+        timestamps_ns = self.get_token_timestamps_ns()
+        durations_s = (
+            timestamps_ns[window_size - 1 : -1] - timestamps_ns[:-window_size]
+        ) / 1_000_000_000
+        throughputs = window_size / durations_s[durations_s > 0]
 
         if len(throughputs) < 2:
             return None
 
-        return statistics.variance(throughputs)
+        return statistics.variance(throughputs.tolist())
 
     def get_token_size_distribution(self) -> Dict[str, float]:
         """Get statistics on token sizes (characters per token)."""
@@ -217,7 +294,9 @@ class StreamLifecycle:
             return None
 
         # Calculate actual content bytes
-        actual_bytes = sum(len(t.token.encode("utf-8")) for t in self.tokens)
+        actual_bytes = self.dropped_token_bytes + sum(
+            len(t.token.encode("utf-8")) for t in self.tokens
+        )
         overhead_bytes = self.total_bytes_sent - actual_bytes
 
         if overhead_bytes < 0:
@@ -260,7 +339,11 @@ class StreamingMetricsTracker:
     """
 
     def __init__(
-        self, max_active_streams: int = 10000, max_completed_streams: int = 1000
+        self,
+        max_active_streams: int = 10000,
+        max_completed_streams: int = 1000,
+        enabled: bool = True,
+        max_tokens_per_stream: Optional[int] = None,
     ):
         """
         Initialize the streaming metrics tracker.
@@ -268,12 +351,35 @@ class StreamingMetricsTracker:
         Args:
             max_active_streams: Maximum number of active streams to track
             max_completed_streams: Maximum number of completed streams to keep in history
+            enabled: Whether recording calls do any work; when False they return
+                immediately without taking locks
+            max_tokens_per_stream: Keep only the most recent N token timings per
+                stream (None keeps all). Token counts, TTFT and throughput stay
+                exact; timing-distribution metrics use the retained tokens.
+
+        Raises:
+            ValueError: If max_tokens_per_stream is less than 1
         """
+        if max_tokens_per_stream is not None and max_tokens_per_stream < 1:
+            raise ValueError(
+                f"max_tokens_per_stream must be at least 1, got {max_tokens_per_stream}"
+            )
+
         self.max_active_streams = max_active_streams
         self.max_completed_streams = max_completed_streams
+        self.max_tokens_per_stream = max_tokens_per_stream
 
-        # Active streams (currently streaming)
-        self._active_streams: Dict[str, StreamLifecycle] = {}
+        # Plain attribute (not a property) so the disabled check is one load
+        self.enabled = enabled
+
+        # Active streams (currently streaming), sharded by stream_id hash so
+        # per-token updates on different streams don't contend on one lock
+        self._active_shards: List[tuple[dict, threading.Lock]] = [
+            ({}, threading.Lock()) for _ in range(ACTIVE_STREAM_SHARDS)
+        ]
+
+        # Start order of active streams across shards (guarded by _lock)
+        self._active_order: Dict[str, None] = {}
 
         # Completed streams (for historical analysis)
         self._completed_streams: deque[StreamLifecycle] = deque(
@@ -285,10 +391,21 @@ class StreamingMetricsTracker:
             maxlen=max_completed_streams
         )
 
+        # Completed/failed streams by stream_id -> (stream, status)
+        self._history_index: Dict[str, tuple[StreamLifecycle, str]] = {}
+
+        # Lifecycles evicted from history, reused by start_stream
+        self._free_streams: deque[StreamLifecycle] = deque()
+
         # Client behavior tracking
         self._clients: Dict[str, ClientBehavior] = {}
 
-        # Thread safety
+        # Bumped whenever history or client state changes (guarded by _lock)
+        self._version = 0
+        self._report_cache: Optional[tuple[int, Dict[str, Any]]] = None
+
+        # Thread safety (history, clients and correlations; lock order is
+        # always _lock before a shard lock)
         self._lock = threading.Lock()
 
         # Correlation tracking (for analytics)
@@ -300,6 +417,46 @@ class StreamingMetricsTracker:
 
         logger.info("StreamingMetricsTracker initialized")
 
+    def _get_shard(
+        self, stream_id: str
+    ) -> tuple[Dict[str, StreamLifecycle], threading.Lock]:
+        """Get the (active streams, lock) shard owning a stream."""
+        return self._active_shards[hash(stream_id) & (ACTIVE_STREAM_SHARDS - 1)]
+
+    def _count_active_streams(self) -> int:
+        """Count active streams across all shards."""
+        return sum(len(active) for active, _ in self._active_shards)
+
+    def _drop_oldest_active_stream(self) -> None:
+        """Drop the oldest active stream across all shards (caller holds _lock)."""
+        oldest_id = next(iter(self._active_order), None)
+        if oldest_id is not None:
+            del self._active_order[oldest_id]
+            self._pop_active_stream(oldest_id)
+
+    def _append_to_history(
+        self, history: deque[StreamLifecycle], stream: StreamLifecycle, status: str
+    ) -> None:
+        """Append a finished stream to history, recycling the one it evicts."""
+        if history.maxlen == 0:
+            return
+
+        if len(history) == history.maxlen:
+            evicted = history.popleft()
+            entry = self._history_index.get(evicted.stream_id)
+            if entry is not None and entry[0] is evicted:
+                del self._history_index[evicted.stream_id]
+            self._free_streams.append(evicted)
+
+        history.append(stream)
+        self._history_index[stream.stream_id] = (stream, status)
+
+    def _pop_active_stream(self, stream_id: str) -> Optional[StreamLifecycle]:
+        """Remove and return an active stream, or None if not found."""
+        active, shard_lock = self._get_shard(stream_id)
+        with shard_lock:
+            return active.pop(stream_id, None)
+
     def start_stream(
         self,
         stream_id: str,
@@ -320,33 +477,55 @@ class StreamingMetricsTracker:
             max_tokens: Max tokens parameter (optional)
             client_id: Client identifier (optional)
         """
+        if not self.enabled:
+            return
+
+        # Few distinct model names; share one string across all lifecycles
+        model = sys.intern(model)
+
         with self._lock:
             # Check if we're at capacity
-            if len(self._active_streams) >= self.max_active_streams:
+            if self._count_active_streams() >= self.max_active_streams:
                 logger.warning(
                     f"Max active streams ({self.max_active_streams}) reached. "
                     f"Dropping oldest active stream."
                 )
-                # Drop oldest active stream
-                oldest_id = next(iter(self._active_streams))
-                del self._active_streams[oldest_id]
-
-            # Create new stream lifecycle
-            stream = StreamLifecycle(
-                stream_id=stream_id,
-                model=model,
-                prompt_tokens=prompt_tokens,
-                start_time_ns=time.time_ns(),
-                temperature=temperature,
-                max_tokens=max_tokens,
-            )
+                self._drop_oldest_active_stream()
+
+            # Create new stream lifecycle, reusing one evicted from history
+            if self._free_streams:
+                stream = self._free_streams.pop()
+                stream.reset(
+                    stream_id=stream_id,
+                    model=model,
+                    prompt_tokens=prompt_tokens,
+                    start_time_ns=time.time_ns(),
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+            else:
+                stream = StreamLifecycle(
+                    stream_id=stream_id,
+                    model=model,
+                    prompt_tokens=prompt_tokens,
+                    start_time_ns=time.time_ns(),
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+                if self.max_tokens_per_stream is not None:
+                    stream.tokens = deque(maxlen=self.max_tokens_per_stream)
+                    stream.token_window = self.max_tokens_per_stream
 
-            self._active_streams[stream_id] = stream
+            active, shard_lock = self._get_shard(stream_id)
+            with shard_lock:
+                active[stream_id] = stream
+            self._active_order[stream_id] = None
 
             # Track client
             if client_id:
                 if client_id not in self._clients:
                     self._clients[client_id] = ClientBehavior(client_id=client_id)
+                    self._version += 1
                 self._clients[client_id].streams.append(stream_id)
 
     def record_token(
@@ -365,40 +544,52 @@ class StreamingMetricsTracker:
             timestamp_ns: Token timestamp in nanoseconds (defaults to current time)
             chunk_size_bytes: Size of network chunk in bytes (optional)
         """
-        with self._lock:
-            if stream_id not in self._active_streams:
+        if not self.enabled:
+            return
+
+        active, shard_lock = self._get_shard(stream_id)
+        with shard_lock:
+            stream = active.get(stream_id)
+            if stream is None:
                 logger.warning(f"Stream {stream_id} not found in active streams")
                 return
 
-            stream = self._active_streams[stream_id]
-
             # Use current time if not provided
             if timestamp_ns is None:
                 timestamp_ns = time.time_ns()
 
-            # Record first token time
-            if stream.first_token_time_ns is None:
-                stream.first_token_time_ns = timestamp_ns
+            stream.add_token(token, timestamp_ns, chunk_size_bytes)
 
-            # Update last token time
-            stream.last_token_time_ns = timestamp_ns
+    def record_tokens(
+        self,
+        stream_id: str,
+        tokens: List[tuple[str, Optional[int]]],
+    ) -> None:
+        """
+        Record a batch of streamed tokens under a single lock acquisition.
 
-            # Create token timing
-            timing = TokenTiming(
-                token=token,
-                timestamp_ns=timestamp_ns,
-                chunk_size_bytes=chunk_size_bytes or len(token.encode("utf-8")),
-                sequence_number=len(stream.tokens),
-            )
+        Args:
+            stream_id: Stream identifier
+            tokens: (token text, timestamp in nanoseconds or None for now) pairs,
+                in stream order
+        """
+        if not self.enabled or not tokens:
+            return
 
-            stream.tokens.append(timing)
+        active, shard_lock = self._get_shard(stream_id)
+        with shard_lock:
+            stream = active.get(stream_id)
+            if stream is None:
+                logger.warning(f"Stream {stream_id} not found in active streams")
+                return
 
-            # Check for stalls (ITL > 500ms)
-            if len(stream.tokens) > 1:
-                itl_ns = timestamp_ns - stream.tokens[-2].timestamp_ns
-                itl_ms = itl_ns / 1_000_000
-                if itl_ms > 500.0:
-                    stream.stall_events += 1
+            now_ns = None
+            for token, timestamp_ns in tokens:
+                if timestamp_ns is None:
+                    if now_ns is None:
+                        now_ns = time.time_ns()
+                    timestamp_ns = now_ns
+                stream.add_token(token, timestamp_ns)
 
     def record_chunk_sent(self, stream_id: str, chunk_size_bytes: int) -> None:
         """
@@ -408,11 +599,15 @@ class StreamingMetricsTracker:
             stream_id: Stream identifier
             chunk_size_bytes: Size of the chunk in bytes
         """
-        with self._lock:
-            if stream_id not in self._active_streams:
+        if not self.enabled:
+            return
+
+        active, shard_lock = self._get_shard(stream_id)
+        with shard_lock:
+            stream = active.get(stream_id)
+            if stream is None:
                 return
 
-            stream = self._active_streams[stream_id]
             stream.chunks_sent += 1
             stream.total_bytes_sent += chunk_size_bytes
             stream.chunk_sizes.append(chunk_size_bytes)
@@ -424,11 +619,15 @@ class StreamingMetricsTracker:
         Args:
             stream_id: Stream identifier
         """
-        with self._lock:
-            if stream_id not in self._active_streams:
+        if not self.enabled:
+            return
+
+        active, shard_lock = self._get_shard(stream_id)
+        with shard_lock:
+            stream = active.get(stream_id)
+            if stream is None:
                 return
 
-            stream = self._active_streams[stream_id]
             stream.backpressure_events += 1
 
     def complete_stream(
@@ -445,14 +644,19 @@ class StreamingMetricsTracker:
             finish_reason: Reason for completion (stop, length, etc.)
             client_id: Client identifier (optional)
         """
-        with self._lock:
-            if stream_id not in self._active_streams:
-                logger.warning(f"Stream {stream_id} not found in active streams")
-                return
+        if not self.enabled:
+            return
+
+        stream = self._pop_active_stream(stream_id)
+        if stream is None:
+            logger.warning(f"Stream {stream_id} not found in active streams")
+            return
 
-            stream = self._active_streams[stream_id]
-            stream.completion_time_ns = time.time_ns()
-            stream.finish_reason = finish_reason
+        stream.completion_time_ns = time.time_ns()
+        stream.finish_reason = finish_reason
+
+        with self._lock:
+            self._active_order.pop(stream_id, None)
 
             # Record correlation data
             ttft = stream.get_ttft_ms()
@@ -490,8 +694,8 @@ class StreamingMetricsTracker:
                     client.slow_stream_count += 1
 
             # Move to completed streams
-            self._completed_streams.append(stream)
-            del self._active_streams[stream_id]
+            self._append_to_history(self._completed_streams, stream, "completed")
+            self._version += 1
 
     def cancel_stream(
         self,
@@ -507,15 +711,20 @@ class StreamingMetricsTracker:
             error_message: Optional error message
             client_id: Client identifier (optional)
         """
-        with self._lock:
-            if stream_id not in self._active_streams:
-                return
+        if not self.enabled:
+            return
+
+        stream = self._pop_active_stream(stream_id)
+        if stream is None:
+            return
 
-            stream = self._active_streams[stream_id]
-            stream.completion_time_ns = time.time_ns()
-            stream.cancelled = True
-            stream.cancellation_point = len(stream.tokens)
-            stream.error_message = error_message
+        stream.completion_time_ns = time.time_ns()
+        stream.cancelled = True
+        stream.cancellation_point = stream.get_token_count()
+        stream.error_message = error_message
+
+        with self._lock:
+            self._active_order.pop(stream_id, None)
 
             # Update client behavior
             if client_id:
@@ -525,8 +734,8 @@ class StreamingMetricsTracker:
                 client.cancellation_count += 1
 
             # Move to failed streams
-            self._failed_streams.append(stream)
-            del self._active_streams[stream_id]
+            self._append_to_history(self._failed_streams, stream, "failed")
+            self._version += 1
 
     def record_timeout(self, client_id: str) -> None:
         """Record a timeout event for a client."""
@@ -534,6 +743,7 @@ class StreamingMetricsTracker:
             if client_id not in self._clients:
                 self._clients[client_id] = ClientBehavior(client_id=client_id)
             self._clients[client_id].timeout_count += 1
+            self._version += 1
 
     def record_reconnection(self, client_id: str) -> None:
         """Record a reconnection event for a client."""
@@ -541,6 +751,7 @@ class StreamingMetricsTracker:
             if client_id not in self._clients:
                 self._clients[client_id] = ClientBehavior(client_id=client_id)
             self._clients[client_id].reconnection_count += 1
+            self._version += 1
 
     def get_stream_stats(self, stream_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -552,24 +763,30 @@ class StreamingMetricsTracker:
         Returns:
             Dictionary of stream statistics or None if not found
         """
-        with self._lock:
-            # Check active streams
-            if stream_id in self._active_streams:
-                stream = self._active_streams[stream_id]
+        # Check active streams
+        active, shard_lock = self._get_shard(stream_id)
+        with shard_lock:
+            stream = active.get(stream_id)
+            if stream is not None:
                 return self._stream_to_dict(stream, status="active")
 
-            # Check completed streams
-            for stream in self._completed_streams:
-                if stream.stream_id == stream_id:
-                    return self._stream_to_dict(stream, status="completed")
-
-            # Check failed streams
-            for stream in self._failed_streams:
-                if stream.stream_id == stream_id:
-                    return self._stream_to_dict(stream, status="failed")
+        with self._lock:
+            # Check completed and failed streams
+            entry = self._history_index.get(stream_id)
+            if entry is not None:
+                stream, status = entry
+                return dict(self._finished_stream_stats(stream, status))
 
             return None
 
+    def _finished_stream_stats(
+        self, stream: StreamLifecycle, status: str
+    ) -> Dict[str, Any]:
+        """Get the stats dict of a finished stream, computing it only once."""
+        if stream.finished_stats is None:
+            stream.finished_stats = self._stream_to_dict(stream, status=status)
+        return stream.finished_stats
+
     def _stream_to_dict(self, stream: StreamLifecycle, status: str) -> Dict[str, Any]:
         """Convert a StreamLifecycle to a dictionary."""
         itls = stream.get_inter_token_latencies_ms()
@@ -613,133 +830,139 @@ class StreamingMetricsTracker:
         """
         Get comprehensive streaming quality report across all streams.
 
+        The report is cached until stream history or client state changes, so
+        repeated polling between completions does not recompute it.
+
         Returns:
             Dictionary containing quality metrics and analytics
         """
         with self._lock:
-            # Collect all completed streams
-            all_streams = list(self._completed_streams) + list(self._failed_streams)
-
-            if not all_streams:
-                return {
-                    "total_streams": 0,
-                    "active_streams": len(self._active_streams),
-                    "message": "No completed streams yet",
-                }
-
-            # Calculate aggregate metrics
-            ttfts = [
-                s.get_ttft_ms() for s in all_streams if s.get_ttft_ms() is not None
-            ]
-            tpss = [
-                s.get_tokens_per_second()
-                for s in all_streams
-                if s.get_tokens_per_second() is not None
-            ]
-            jitters = [
-                s.calculate_jitter_ms()
-                for s in all_streams
-                if s.calculate_jitter_ms() is not None
-            ]
-            smoothness = [
-                s.calculate_smoothness_score()
-                for s in all_streams
-                if s.calculate_smoothness_score() is not None
-            ]
-            stalls = [s.count_stalls() for s in all_streams]
-
-            # Quality metrics
-            quality_metrics = {
-                "ttft_ms": self._calculate_percentiles(ttfts) if ttfts else {},
-                "tokens_per_second": self._calculate_percentiles(tpss) if tpss else {},
-                "jitter_ms": self._calculate_percentiles(jitters) if jitters else {},
-                "smoothness_score": (
-                    self._calculate_percentiles(smoothness) if smoothness else {}
-                ),
-                "stall_count": {
-                    "mean": statistics.mean(stalls) if stalls else 0,
-                    "median": statistics.median(stalls) if stalls else 0,
-                    "max": max(stalls) if stalls else 0,
-                    "streams_with_stalls": sum(1 for s in stalls if s > 0),
-                },
+            if self._report_cache is None or self._report_cache[0] != self._version:
+                self._report_cache = (self._version, self._build_quality_report())
+            report = self._report_cache[1]
+            active_streams = self._count_active_streams()
+
+        # Deep copy so callers can't mutate the nested metric blocks in the cache
+        report = copy.deepcopy(report)
+        if "summary" in report:
+            report["summary"]["active_streams"] = active_streams
+        else:
+            report["active_streams"] = active_streams
+        return report
+
+    def _build_quality_report(self) -> Dict[str, Any]:
+        """Build the streaming quality report (caller holds _lock)."""
+        # Collect all completed streams
+        all_streams = list(self._completed_streams) + list(self._failed_streams)
+
+        if not all_streams:
+            return {
+                "total_streams": 0,
+                "active_streams": self._count_active_streams(),
+                "message": "No completed streams yet",
             }
 
-            # Token-level metrics
-            all_tokens = []
-            for stream in all_streams:
-                all_tokens.extend(stream.tokens)
-
-            token_sizes = [len(t.token) for t in all_tokens]
-
-            token_metrics = {
-                "total_tokens": len(all_tokens),
-                "token_size_distribution": (
-                    self._calculate_percentiles(token_sizes) if token_sizes else {}
-                ),
-                "punctuation_ratio": {
-                    "mean": (
-                        statistics.mean(
-                            [s.get_punctuation_ratio() for s in all_streams]
-                        )
-                        if all_streams
-                        else 0
-                    ),
-                },
-            }
+        # Per-stream derived metrics are computed once and reused across reports
+        all_stats = [
+            self._finished_stream_stats(s, "completed") for s in self._completed_streams
+        ] + [self._finished_stream_stats(s, "failed") for s in self._failed_streams]
+
+        def collect(key: str) -> List[float]:
+            return [d[key] for d in all_stats if d[key] is not None]
+
+        # Calculate aggregate metrics
+        ttfts = collect("ttft_ms")
+        tpss = collect("tokens_per_second")
+        jitters = collect("jitter_ms")
+        smoothness = collect("smoothness_score")
+        stalls = [s.count_stalls() for s in all_streams]
+
+        # Quality metrics
+        quality_metrics = {
+            "ttft_ms": self._calculate_percentiles(ttfts) if ttfts else {},
+            "tokens_per_second": self._calculate_percentiles(tpss) if tpss else {},
+            "jitter_ms": self._calculate_percentiles(jitters) if jitters else {},
+            "smoothness_score": (
+                self._calculate_percentiles(smoothness) if smoothness else {}
+            ),
+            "stall_count": {
+                "mean": statistics.mean(stalls) if stalls else 0,
+                "median": statistics.median(stalls) if stalls else 0,
+                "max": max(stalls) if stalls else 0,
+                "streams_with_stalls": sum(1 for s in stalls if s > 0),
+            },
+        }
 
-            # Network metrics
-            network_overheads = [
-                s.calculate_network_overhead_percent()
-                for s in all_streams
-                if s.calculate_network_overhead_percent() is not None
-            ]
-
-            network_metrics = {
-                "total_bytes_sent": sum(s.total_bytes_sent for s in all_streams),
-                "total_chunks_sent": sum(s.chunks_sent for s in all_streams),
-                "network_overhead_percent": (
-                    self._calculate_percentiles(network_overheads)
-                    if network_overheads
-                    else {}
+        # Token-level metrics
+        all_tokens = []
+        for stream in all_streams:
+            all_tokens.extend(stream.tokens)
+
+        token_sizes = [len(t.token) for t in all_tokens]
+
+        token_metrics = {
+            "total_tokens": sum(s.get_token_count() for s in all_streams),
+            "token_size_distribution": (
+                self._calculate_percentiles(token_sizes) if token_sizes else {}
+            ),
+            "punctuation_ratio": {
+                "mean": (
+                    statistics.mean([d["punctuation_ratio"] for d in all_stats])
+                    if all_streams
+                    else 0
                 ),
-            }
+            },
+        }
 
-            # Client behavior summary
-            slow_clients = [c for c in self._clients.values() if c.is_slow_client()]
+        # Network metrics
+        network_overheads = collect("network_overhead_percent")
+
+        network_metrics = {
+            "total_bytes_sent": sum(s.total_bytes_sent for s in all_streams),
+            "total_chunks_sent": sum(s.chunks_sent for s in all_streams),
+            "network_overhead_percent": (
+                self._calculate_percentiles(network_overheads)
+                if network_overheads
+                else {}
+            ),
+        }
 
-            client_metrics = {
-                "total_clients": len(self._clients),
-                "slow_clients": len(slow_clients),
-                "total_timeouts": sum(c.timeout_count for c in self._clients.values()),
-                "total_cancellations": sum(
-                    c.cancellation_count for c in self._clients.values()
-                ),
-                "total_reconnections": sum(
-                    c.reconnection_count for c in self._clients.values()
-                ),
-            }
+        # Client behavior summary
+        slow_clients = [c for c in self._clients.values() if c.is_slow_client()]
+
+        client_metrics = {
+            "total_clients": len(self._clients),
+            "slow_clients": len(slow_clients),
+            "total_timeouts": sum(c.timeout_count for c in self._clients.values()),
+            "total_cancellations": sum(
+                c.cancellation_count for c in self._clients.values()
+            ),
+            "total_reconnections": sum(
+                c.reconnection_count for c in self._clients.values()
+            ),
+        }
 
-            # Correlation analytics
-            correlations = self._calculate_correlations()
+        # Correlation analytics
+        correlations = self._calculate_correlations()
 
-            return {
-                "summary": {
-                    "total_streams": len(all_streams),
-                    "completed_streams": len(self._completed_streams),
-                    "failed_streams": len(self._failed_streams),
-                    "active_streams": len(self._active_streams),
-                    "success_rate": (
-                        len(self._completed_streams) / len(all_streams) * 100
-                        if all_streams
-                        else 0
-                    ),
-                },
-                "quality_metrics": quality_metrics,
-                "token_metrics": token_metrics,
-                "network_metrics": network_metrics,
-                "client_metrics": client_metrics,
-                "correlations": correlations,
-            }
+        return {
+            "summary": {
+                "total_streams": len(all_streams),
+                "completed_streams": len(self._completed_streams),
+                "failed_streams": len(self._failed_streams),
+                "active_streams": self._count_active_streams(),
+                "success_rate": (
+                    len(self._completed_streams) / len(all_streams) * 100
+                    if all_streams
+                    else 0
+                ),
+            },
+            "quality_metrics": quality_metrics,
+            "token_metrics": token_metrics,
+            "network_metrics": network_metrics,
+            "client_metrics": client_metrics,
+            "correlations": correlations,
+        }
 
     def _calculate_percentiles(self, values: List[float]) -> Dict[str, float]:
         """Calculate percentiles for a list of values."""
@@ -747,15 +970,16 @@ class StreamingMetricsTracker:
             return {}
 
         values_array = np.array(values)
+        p50, p90, p95, p99 = np.percentile(values_array, (50, 90, 95, 99))
         return {
             "mean": float(np.mean(values_array)),
             "median": float(np.median(values_array)),
             "min": float(np.min(values_array)),
             "max": float(np.max(values_array)),
-            "p50": float(np.percentile(values_array, 50)),
-            "p90": float(np.percentile(values_array, 90)),
-            "p95": float(np.percentile(values_array, 95)),
-            "p99": float(np.percentile(values_array, 99)),
+            "p50": float(p50),
+            "p90": float(p90),
+            "p95": float(p95),
+            "p99": float(p99),
             "stdev": float(np.std(values_array)),
         }
 
@@ -849,8 +1073,7 @@ class StreamingMetricsTracker:
 
     def get_active_stream_count(self) -> int:
         """Get count of currently active streams."""
-        with self._lock:
-            return len(self._active_streams)
+        return self._count_active_streams()
 
     def get_completed_stream_count(self) -> int:
         """Get count of completed streams in history."""
@@ -867,6 +1090,8 @@ class StreamingMetricsTracker:
         with self._lock:
             self._completed_streams.clear()
             self._failed_streams.clear()
+            self._history_index.clear()
+            self._version += 1
             self._correlation_data = {
                 "prompt_length_vs_ttft": [],
                 "temperature_vs_variance": [],
@@ -877,9 +1102,15 @@ class StreamingMetricsTracker:
     def reset(self) -> None:
         """Reset all metrics (including active streams)."""
         with self._lock:
-            self._active_streams.clear()
+            for active, shard_lock in self._active_shards:
+                with shard_lock:
+                    active.clear()
+            self._active_order.clear()
             self._completed_streams.clear()
             self._failed_streams.clear()
+            self._history_index.clear()
+            self._version += 1
+            self._free_streams.clear()
             self._clients.clear()
             self._correlation_data = {
                 "prompt_length_vs_ttft": [],
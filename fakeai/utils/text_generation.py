@@ -15,6 +15,63 @@ from faker import Faker
 
 from fakeai.utils.tokens import calculate_token_count
 
+# (label, literal, pattern) rules checked in order; the first match wins.
+# Every match of a pattern contains its literal, so a plain substring test
+# rules out most rules before the regex engine runs at all.
+_PROMPT_TYPE_RULES = tuple(
+    (label, literal, re.compile(pattern))
+    for label, literal, pattern in (
+        ("greeting", "hello", r"\bhello\b"),
+        ("greeting", "hi", r"\bhi\b"),
+        ("greeting", "hey", r"\bhey\b"),
+        ("greeting", "greetings", r"\bgreetings\b"),
+        ("greeting", "good ", r"\bgood (morning|afternoon|evening)\b"),
+        ("coding", "code", r"\bcode\b"),
+        ("coding", "function", r"\bfunction\b"),
+        ("coding", "class", r"\bclass\b"),
+        ("coding", "python", r"\bpython\b"),
+        ("coding", "javascript", r"\bjavascript\b"),
+        ("coding", "typescript", r"\btypescript\b"),
+        ("coding", "java", r"\bjava\b"),
+        ("coding", "c++", r"\bc\+\+\b"),
+        ("coding", "ruby", r"\bruby\b"),
+        ("coding", "rust", r"\brust\b"),
+        ("coding", "go", r"\bgo\b"),
+        ("coding", "program", r"\bprogram\b"),
+        ("coding", "algorithm", r"\balgorithm\b"),
+        ("question", "what", r"\bwhat\b"),
+        ("question", "who", r"\bwho\b"),
+        ("question", "when", r"\bwhen\b"),
+        ("question", "where", r"\bwhere\b"),
+        ("question", "why", r"\bwhy\b"),
+        ("question", "how", r"\bhow\b"),
+        ("question", "can you", r"\bcan you\b"),
+        ("question", "could you", r"\bcould you\b"),
+    )
+)
+
+_CODING_LANGUAGE_RULES = tuple(
+    (label, literal, re.compile(pattern))
+    for label, literal, pattern in (
+        ("python", "python", r"\bpython\b"),
+        ("javascript", "javascript", r"\bjavascript\b"),
+        ("javascript", "js", r"\bjs\b"),
+        ("typescript", "typescript", r"\btypescript\b"),
+        ("typescript", "ts", r"\bts\b"),
+        ("java", "java", r"\bjava\b"),
+        ("c++", "c++", r"\bc\+\+\b"),
+        ("c++", "cpp", r"\bcpp\b"),
+        ("rust", "rust", r"\brust\b"),
+        ("go", "go", r"\b(?:golang|go)\b"),
+        ("ruby", "ruby", r"\bruby\b"),
+        ("php", "php", r"\bphp\b"),
+        ("c#", "c#", r"\bc#\b"),
+        ("c#", "csharp", r"\bcsharp\b"),
+        ("swift", "swift", r"\bswift\b"),
+        ("kotlin", "kotlin", r"\bkotlin\b"),
+    )
+)
+
 
 class SimulatedGenerator:
     """Generator for simulated responses."""
@@ -104,52 +161,9 @@ class SimulatedGenerator:
 
     def _identify_prompt_type(self, prompt: str) -> str:
         """Identify the type of prompt."""
-        greeting_patterns = [
-            r"\bhello\b",
-            r"\bhi\b",
-            r"\bhey\b",
-            r"\bgreetings\b",
-            r"\bgood (morning|afternoon|evening)\b",
-        ]
-
-        question_patterns = [
-            r"\bwhat\b",
-            r"\bwho\b",
-            r"\bwhen\b",
-            r"\bwhere\b",
-            r"\bwhy\b",
-            r"\bhow\b",
-            r"\bcan you\b",
-            r"\bcould you\b",
-        ]
-
-        coding_patterns = [
-            r"\bcode\b",
-            r"\bfunction\b",
-            r"\bclass\b",
-            r"\bpython\b",
-            r"\bjavascript\b",
-            r"\btypescript\b",
-            r"\bjava\b",
-            r"\bc\+\+\b",
-            r"\bruby\b",
-            r"\brust\b",
-            r"\bgo\b",
-            r"\bprogram\b",
-            r"\balgorithm\b",
-        ]
-
-        for pattern in greeting_patterns:
-            if re.search(pattern, prompt):
-                return "greeting"
-
-        for pattern in coding_patterns:
-            if re.search(pattern, prompt):
-                return "coding"
-
-        for pattern in question_patterns:
-            if re.search(pattern, prompt):
-                return "question"
+        for prompt_type, literal, pattern in _PROMPT_TYPE_RULES:
+            if literal in prompt and pattern.search(prompt):
+                return prompt_type
 
         return "default"
 
@@ -218,23 +232,9 @@ class SimulatedGenerator:
 
     def _identify_coding_language(self, prompt: str) -> str:
         """Identify the coding language from the prompt."""
-        languages = {
-            "python": r"\bpython\b",
-            "javascript": r"\b(?:javascript|js)\b",
-            "typescript": r"\b(?:typescript|ts)\b",
-            "java": r"\bjava\b",
-            "c++": r"\b(?:c\+\+|cpp)\b",
-            "rust": r"\brust\b",
-            "go": r"\b(?:golang|go)\b",
-            "ruby": r"\bruby\b",
-            "php": r"\bphp\b",
-            "c#": r"\b(?:c#|csharp)\b",
-            "swift": r"\bswift\b",
-            "kotlin": r"\bkotlin\b",
-        }
-
-        for lang, pattern in languages.items():
-            if re.search(pattern, prompt.lower()):
+        prompt_lower = prompt.lower()
+        for lang, literal, pattern in _CODING_LANGUAGE_RULES:
+            if literal in prompt_lower and pattern.search(prompt_lower):
                 return lang
 
         # Default to Python if no language is specified
@@ -79,18 +79,26 @@ class MultiModalValidator:
             if len(parts) >= 2:
                 base_model = parts[1].split("/")[-1]
 
+        # Exact ids hit the set directly; the substring scan is only needed
+        # for dated/suffixed variants such as "gpt-4o-2024-08-06"
         if modality == "vision":
-            supported = any(vm in base_model for vm in self.VISION_MODELS)
+            supported = base_model in self.VISION_MODELS or any(
+                vm in base_model for vm in self.VISION_MODELS
+            )
             if not supported:
                 return False, f"Model '{model}' does not support vision/image inputs"
 
         elif modality == "audio":
-            supported = any(am in base_model for am in self.AUDIO_MODELS)
+            supported = base_model in self.AUDIO_MODELS or any(
+                am in base_model for am in self.AUDIO_MODELS
+            )
             if not supported:
                 return False, f"Model '{model}' does not support audio inputs"
 
         elif modality == "video":
-            supported = any(vm in base_model for vm in self.VIDEO_MODELS)
+            supported = base_model in self.VIDEO_MODELS or any(
+                vm in base_model for vm in self.VIDEO_MODELS
+            )
             if not supported:
                 return False, f"Model '{model}' does not support video inputs"
 
@@ -26,6 +26,8 @@ Usage:
     python RUN_ALL_TESTS.py --export results.json  # Export to JSON
     python RUN_ALL_TESTS.py --timeout 120   # Custom timeout (seconds)
     python RUN_ALL_TESTS.py --verbose       # Show detailed output
+    python RUN_ALL_TESTS.py --lf            # Rerun only last-failed tests
+    python RUN_ALL_TESTS.py --ff            # Run last-failed tests first
 """
 
 import argparse
@@ -38,7 +40,7 @@ import sys
 import time
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
@@ -68,7 +70,7 @@ class Colors:
         Colors.RESET = ''
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Individual test file result"""
     file_path: str
@@ -83,20 +85,17 @@ class TestResult:
     exit_code: int
     error_message: Optional[str] = None
     failure_patterns: List[str] = None
+    # Derived once from the counts, which never change after construction
+    total_tests: int = field(init=False)
+    pass_rate: float = field(init=False)
 
     def __post_init__(self):
         if self.failure_patterns is None:
             self.failure_patterns = []
-
-    @property
-    def total_tests(self) -> int:
-        return self.passed + self.failed + self.skipped + self.errors
-
-    @property
-    def pass_rate(self) -> float:
-        if self.total_tests == 0:
-            return 0.0
-        return (self.passed / self.total_tests) * 100
+        self.total_tests = self.passed + self.failed + self.skipped + self.errors
+        self.pass_rate = (
+            (self.passed / self.total_tests) * 100 if self.total_tests else 0.0
+        )
 
     @property
     def status_color(self) -> str:
@@ -113,30 +112,77 @@ class TestResult:
 class TestRunner:
     """Main test runner orchestrator"""
 
+    # Compiled once and shared by every parsed file's output
+    # Summary line: "1 passed, 2 failed, 3 skipped in 1.23s"
+    _SUMMARY_RE = re.compile(r'(\d+)\s+(passed|failed|skipped|error|warning)',
+                             re.IGNORECASE)
+    _FAILURE_PATTERNS = {
+        name: re.compile(regex) for name, regex in {
+            'import_error': r'ImportError|ModuleNotFoundError',
+            'attribute_error': r'AttributeError',
+            'assertion_error': r'AssertionError',
+            'type_error': r'TypeError',
+            'value_error': r'ValueError',
+            'connection_error': r'ConnectionError|ConnectionRefusedError',
+            'timeout': r'TimeoutError|asyncio\.TimeoutError',
+            'fixture_error': r'fixture .* not found',
+            'async_error': r'RuntimeError.*Event loop',
+            'deprecation': r'DeprecationWarning',
+        }.items()
+    }
+
     def __init__(self,
                  tests_dir: Path,
                  timeout: int = 60,
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 pytest_args: Optional[List[str]] = None):
         self.tests_dir = tests_dir
         self.timeout = timeout
         self.verbose = verbose
+        self.pytest_args = pytest_args or []
         self.results: List[TestResult] = []
         self.start_time: float = 0
         self.end_time: float = 0
+        self._test_files: Optional[List[Path]] = None
+        self._project_roots: Dict[Path, Path] = {}
 
     def find_test_files(self) -> List[Path]:
         """Find all test files recursively"""
-        test_files = []
-        for pattern in ['test_*.py', '*_test.py']:
-            test_files.extend(self.tests_dir.rglob(pattern))
+        if self._test_files is not None:
+            return self._test_files
 
-        # Exclude __pycache__ and special files
-        test_files = [
-            f for f in test_files
-            if '__pycache__' not in str(f) and f.name != '__init__.py'
-        ]
+        # One walk for both name patterns, pruning __pycache__ instead of
+        # descending into it and filtering afterwards
+        test_files = []
+        for dirpath, dirnames, filenames in os.walk(self.tests_dir):
+            dirnames[:] = [d for d in dirnames if d != '__pycache__']
+            for name in filenames:
+                if name.endswith('.py') and (
+                    name.startswith('test_') or name.endswith('_test.py')
+                ):
+                    test_files.append(Path(dirpath) / name)
+
+        self._test_files = sorted(test_files)
+        return self._test_files
+
+    def _find_project_root(self, test_dir: Path) -> Path:
+        """Find the nearest directory with pyproject.toml or setup.py"""
+        # Test files share a handful of directories, so probe each one once
+        # rather than repeating the upward stat walk for every file
+        if test_dir in self._project_roots:
+            return self._project_roots[test_dir]
+
+        project_root = test_dir
+        while project_root.parent != project_root:
+            if (project_root / 'pyproject.toml').exists() or (project_root / 'setup.py').exists():
+                break
+            project_root = project_root.parent
+        else:
+            # Fallback: use test file's parent
+            project_root = self.tests_dir.parent if (self.tests_dir.parent / 'pyproject.toml').exists() else self.tests_dir
 
-        return sorted(test_files)
+        self._project_roots[test_dir] = project_root
+        return project_root
 
     def run_single_test_file(self, test_file: Path) -> TestResult:
         """Run a single test file with timeout"""
@@ -151,14 +197,7 @@ class TestRunner:
         try:
             # Run pytest on single file with absolute path
             # Find project root (where pyproject.toml or setup.py exists)
-            project_root = test_file
-            while project_root.parent != project_root:
-                if (project_root / 'pyproject.toml').exists() or (project_root / 'setup.py').exists():
-                    break
-                project_root = project_root.parent
-            else:
-                # Fallback: use test file's parent
-                project_root = self.tests_dir.parent if (self.tests_dir.parent / 'pyproject.toml').exists() else self.tests_dir
+            project_root = self._find_project_root(test_file.parent)
 
             cmd = [
                 'pytest',
@@ -166,7 +205,8 @@ class TestRunner:
                 '-v',
                 '--tb=short',
                 '--color=no',
-                '-q'
+                '-q',
+                *self.pytest_args
             ]
 
             result = subprocess.run(
@@ -251,12 +291,9 @@ class TestRunner:
         """Parse pytest output for test counts"""
         passed = failed = skipped = errors = warnings = 0
 
-        # Look for summary line: "1 passed, 2 failed, 3 skipped in 1.23s"
-        summary_pattern = r'(\d+)\s+(passed|failed|skipped|error|warning)'
-        matches = re.findall(summary_pattern, output.lower())
-
-        for count, status in matches:
+        for count, status in self._SUMMARY_RE.findall(output):
             count = int(count)
+            status = status.lower()
             if 'passed' in status:
                 passed = count
             elif 'failed' in status:
@@ -293,22 +330,8 @@ class TestRunner:
         """Identify common failure patterns"""
         patterns = []
 
-        # Common patterns
-        pattern_checks = {
-            'import_error': r'ImportError|ModuleNotFoundError',
-            'attribute_error': r'AttributeError',
-            'assertion_error': r'AssertionError',
-            'type_error': r'TypeError',
-            'value_error': r'ValueError',
-            'connection_error': r'ConnectionError|ConnectionRefusedError',
-            'timeout': r'TimeoutError|asyncio\.TimeoutError',
-            'fixture_error': r'fixture .* not found',
-            'async_error': r'RuntimeError.*Event loop',
-            'deprecation': r'DeprecationWarning',
-        }
-
-        for pattern_name, pattern_regex in pattern_checks.items():
-            if re.search(pattern_regex, output):
+        for pattern_name, pattern_re in self._FAILURE_PATTERNS.items():
+            if pattern_re.search(output):
                 patterns.append(pattern_name)
 
         return patterns
@@ -319,22 +342,26 @@ class TestRunner:
 
         print(f"\n{Colors.BOLD}{Colors.BLUE}Running {total} test files sequentially...{Colors.RESET}\n")
 
+        # Compose the colored status labels once, after colors are configured
+        labels = {
+            'passed': f"{Colors.GREEN}✓ PASS{Colors.RESET}",
+            'failed': f"{Colors.RED}✗ FAIL{Colors.RESET}",
+            'timeout': f"{Colors.MAGENTA}⏱ TIMEOUT{Colors.RESET}",
+        }
+        error_label = f"{Colors.YELLOW}⚠ ERROR{Colors.RESET}"
+        # The total is fixed for the run, so bake it into the line template
+        progress = f"[{{}}/{total}] {{:<50}}"
+
         for i, test_file in enumerate(test_files, 1):
             # Progress indicator
-            print(f"[{i}/{total}] {test_file.name:<50}", end='', flush=True)
+            print(progress.format(i, test_file.name), end='', flush=True)
 
             result = self.run_single_test_file(test_file)
             self.results.append(result)
 
             # Status indicator
-            if result.status == 'passed':
-                print(f"{Colors.GREEN}✓ PASS{Colors.RESET} ({result.duration:.2f}s)")
-            elif result.status == 'failed':
-                print(f"{Colors.RED}✗ FAIL{Colors.RESET} ({result.duration:.2f}s)")
-            elif result.status == 'timeout':
-                print(f"{Colors.MAGENTA}⏱ TIMEOUT{Colors.RESET} ({result.duration:.2f}s)")
-            else:
-                print(f"{Colors.YELLOW}⚠ ERROR{Colors.RESET} ({result.duration:.2f}s)")
+            label = labels.get(result.status, error_label)
+            print(f"{label} ({result.duration:.2f}s)")
 
     def run_parallel(self, test_files: List[Path], workers: int = 4) -> None:
         """Run tests in parallel with thread pool"""
@@ -343,6 +370,12 @@ class TestRunner:
 
         print(f"\n{Colors.BOLD}{Colors.BLUE}Running {total} test files in parallel ({workers} workers)...{Colors.RESET}\n")
 
+        # Colored status marks, composed once per status from status_color
+        marks = {}
+        exception_mark = f"{Colors.RED}✗{Colors.RESET}"
+        # The total is fixed for the run, so bake it into the line template
+        progress = f"[{{}}/{total}] {{}} {{:<50}} "
+
         with ThreadPoolExecutor(max_workers=workers) as executor:
             # Submit all jobs
             future_to_file = {
@@ -360,15 +393,18 @@ class TestRunner:
                     self.results.append(result)
 
                     # Progress with status
-                    status_char = '✓' if result.status == 'passed' else '✗'
-                    status_color = result.status_color
+                    mark = marks.get(result.status)
+                    if mark is None:
+                        glyph = '✓' if result.status == 'passed' else '✗'
+                        mark = marks[result.status] = (
+                            f"{result.status_color}{glyph}{Colors.RESET}")
 
-                    print(f"[{completed}/{total}] {status_color}{status_char}{Colors.RESET} "
-                          f"{test_file.name:<50} ({result.duration:.2f}s)")
+                    print(progress.format(completed, mark, test_file.name)
+                          + f"({result.duration:.2f}s)")
 
                 except Exception as e:
-                    print(f"[{completed}/{total}] {Colors.RED}✗{Colors.RESET} "
-                          f"{test_file.name:<50} (exception: {e})")
+                    print(progress.format(completed, exception_mark, test_file.name)
+                          + f"(exception: {e})")
 
     def generate_report(self, filter_status: Optional[str] = None) -> str:
         """Generate beautiful formatted report"""
@@ -435,10 +471,14 @@ class TestRunner:
         status_priority = {'failed': 0, 'error': 1, 'timeout': 2, 'passed': 3}
         sorted_results = sorted(results, key=lambda r: (status_priority.get(r.status, 4), r.file_name))
 
-        # Table rows
+        # Table rows. The colored status cell depends only on the status, so
+        # compose each one the first time it is seen and reuse it
+        status_cells = {}
         for result in sorted_results:
-            status_text = result.status.upper()
-            status_colored = f"{result.status_color}{status_text:<12}{Colors.RESET}"
+            status_colored = status_cells.get(result.status)
+            if status_colored is None:
+                status_colored = status_cells[result.status] = (
+                    f"{result.status_color}{result.status.upper():<12}{Colors.RESET}")
 
             pass_rate = f"{result.pass_rate:.1f}%" if result.total_tests > 0 else "N/A"
 
@@ -470,9 +510,10 @@ class TestRunner:
 
             # Show failed file details
             lines.append(f"{Colors.BOLD}Failed Files Details:{Colors.RESET}")
+            failed_prefix = f"\n  {Colors.RED}✗ "
             for result in sorted_results:
                 if result.status in ('failed', 'error', 'timeout'):
-                    lines.append(f"\n  {Colors.RED}✗ {result.file_name}{Colors.RESET}")
+                    lines.append(failed_prefix + result.file_name + Colors.RESET)
                     lines.append(f"    Status: {result.status}")
                     lines.append(f"    Exit Code: {result.exit_code}")
                     if result.failure_patterns:
@@ -616,6 +657,22 @@ def main():
         help='Disable colored output'
     )
 
+    # pytest's cache (.pytest_cache under the project root) persists between
+    # runs, so these narrow a rerun to what failed last time
+    rerun_group = parser.add_mutually_exclusive_group()
+    rerun_group.add_argument(
+        '--lf', '--last-failed',
+        dest='last_failed',
+        action='store_true',
+        help='Only rerun tests that failed last time (files with no recorded failures run in full)'
+    )
+    rerun_group.add_argument(
+        '--ff', '--failed-first',
+        dest='failed_first',
+        action='store_true',
+        help='Run tests that failed last time first, then the rest'
+    )
+
     parser.add_argument(
         '--dir',
         type=Path,
@@ -625,8 +682,8 @@ def main():
 
     args = parser.parse_args()
 
-    # Disable colors if requested or not a TTY
-    if args.no_color or not sys.stdout.isatty():
+    # Disable colors if requested (flag or NO_COLOR) or not a TTY
+    if args.no_color or os.environ.get('NO_COLOR') or not sys.stdout.isatty():
         Colors.disable()
 
     # Determine tests directory
@@ -641,11 +698,18 @@ def main():
         print(f"{Colors.RED}Error: Tests directory not found: {tests_dir}{Colors.RESET}")
         sys.exit(1)
 
+    pytest_args = []
+    if args.last_failed:
+        pytest_args.append('--last-failed')
+    elif args.failed_first:
+        pytest_args.append('--failed-first')
+
     # Create runner
     runner = TestRunner(
         tests_dir=tests_dir,
         timeout=args.timeout,
-        verbose=args.verbose
+        verbose=args.verbose,
+        pytest_args=pytest_args
     )
 
     # Run tests
@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
 """Fast test matrix - runs each file with 10s timeout."""
 
+import os
 import subprocess
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 
+# Fix priority for a failing file, keyed by its error type
+FIX_PRIORITY = {
+    'IMPORT': 'EASY',
+    'TYPE': 'MEDIUM', 'ATTRIBUTE': 'MEDIUM', 'ASSERTION': 'MEDIUM',
+    'CONNECTION': 'HARD', 'TIMEOUT': 'HARD',
+}
+PROBLEM_STATUSES = frozenset({'FAIL', 'ERROR', 'TIMEOUT', 'EXCEPTION'})
+
 def test_file(test_file):
     """Test a single file with short timeout."""
     fname = test_file.name
@@ -95,9 +104,10 @@ def main():
 
     print(f"Testing {len(test_files)} files (10s timeout each)...\n")
 
-    # Test files in parallel
+    # Test files in parallel. Workers mostly wait on their pytest
+    # subprocess, so size the pool to the machine rather than a fixed 4.
     results = []
-    with ThreadPoolExecutor(max_workers=4) as executor:
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
         futures = {executor.submit(test_file, f): f for f in test_files}
 
         for future in as_completed(futures):
@@ -133,7 +143,7 @@ def main():
         f"  Skipped: {total_skipped}",
         "",
         f"  Files Passing: {sum(1 for r in results if r['status'] == 'PASS')}",
-        f"  Files Failing: {sum(1 for r in results if r['status'] in ['FAIL', 'ERROR'])}",
+        f"  Files Failing: {sum(1 for r in results if r['status'] in {'FAIL', 'ERROR'})}",
         f"  Files Timeout: {sum(1 for r in results if r['status'] == 'TIMEOUT')}",
         "\n" + "=" * 120,
         f"{'File':<45} {'Status':<12} {'Pass':<6} {'Fail':<6} {'Error':<6} {'Skip':<6} {'Type':<12} {'Difficulty':<12}",
@@ -141,18 +151,12 @@ def main():
     ]
 
     for r in results:
-        # Categorize difficulty
+        # Categorize difficulty from the same map as the fix-priority buckets
         difficulty = 'NONE'
-        if r['status'] == 'PASS' or r['status'] == 'SKIP':
-            difficulty = 'NONE'
-        elif r['error_type'] == 'IMPORT':
-            difficulty = 'EASY'
-        elif r['error_type'] in ['TYPE', 'ATTRIBUTE']:
-            difficulty = 'MEDIUM'
-        elif r['error_type'] in ['CONNECTION', 'TIMEOUT']:
-            difficulty = 'HARD'
-        elif r['failed'] > 0 or r['errors'] > 0:
-            difficulty = 'MEDIUM'
+        if r['status'] not in {'PASS', 'SKIP'}:
+            difficulty = FIX_PRIORITY.get(r['error_type'], 'NONE')
+            if difficulty == 'NONE' and (r['failed'] > 0 or r['errors'] > 0):
+                difficulty = 'MEDIUM'
 
         report_lines.append(
             f"{r['file']:<45} {r['status']:<12} {r['passed']:<6} {r['failed']:<6} "
@@ -167,7 +171,7 @@ def main():
     report_lines.append("=" * 120)
 
     for r in results:
-        if r['status'] in ['FAIL', 'ERROR', 'TIMEOUT', 'EXCEPTION']:
+        if r['status'] in PROBLEM_STATUSES:
             report_lines.append(f"\n{r['file']}:")
             report_lines.append(f"  Status: {r['status']}")
             report_lines.append(f"  Issues: {r['failed']} failed, {r['errors']} errors")
@@ -181,11 +185,14 @@ def main():
     report_lines.append("\nFIX PRIORITY BY DIFFICULTY:")
     report_lines.append("=" * 120)
 
-    for difficulty in ['EASY', 'MEDIUM', 'HARD']:
-        files = [r for r in results if r['status'] != 'PASS' and
-                 ((r['error_type'] == 'IMPORT' and difficulty == 'EASY') or
-                  (r['error_type'] in ['TYPE', 'ATTRIBUTE', 'ASSERTION'] and difficulty == 'MEDIUM') or
-                  (r['error_type'] in ['CONNECTION', 'TIMEOUT'] and difficulty == 'HARD'))]
+    # Bucket every non-passing file in one pass instead of rescanning per level
+    by_priority = {'EASY': [], 'MEDIUM': [], 'HARD': []}
+    for r in results:
+        priority = FIX_PRIORITY.get(r['error_type'])
+        if priority and r['status'] != 'PASS':
+            by_priority[priority].append(r)
+
+    for difficulty, files in by_priority.items():
         if files:
             report_lines.append(f"\n{difficulty} ({len(files)} files):")
             for r in files:
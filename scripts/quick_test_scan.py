@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Quick integration test scanner - runs all tests at once with detailed output."""
 
+import importlib.util
 import subprocess
 import re
 from pathlib import Path
@@ -14,9 +15,15 @@ def main():
     print("Running all integration tests with detailed output...")
     print("=" * 100)
 
+    cmd = ['pytest', 'tests/integration/', '-v', '--tb=short', '-x', '--maxfail=100']
+    # Spread files across workers when pytest-xdist is installed. loadfile keeps
+    # each file on one worker, so module-scoped fixtures are still set up once.
+    if importlib.util.find_spec('xdist') is not None:
+        cmd += ['-n', 'auto', '--dist=loadfile']
+
     # Run pytest with JSON report
     result = subprocess.run(
-        ['pytest', 'tests/integration/', '-v', '--tb=short', '-x', '--maxfail=100'],
+        cmd,
         capture_output=True,
         text=True,
         timeout=180
@@ -43,6 +43,7 @@ def main():
     print()
     print("  Performance Optimizations:")
     print("    • uvloop event loop (if installed)")
+    print("    • httptools HTTP parser (if installed)")
     print("    • HTTP/1.1 with keep-alive")
     print("    • Limit concurrency: 2000")
     print("    • Async I/O throughout")
@@ -56,8 +57,8 @@ def main():
         port=config.port,
         log_level="info",
         # Performance settings
-        loop="uvloop",  # Use uvloop if available
-        http="h11",  # HTTP protocol
+        loop="auto",  # uvloop when installed, else asyncio
+        http="auto",  # httptools (C parser) when installed, else h11
         limit_concurrency=2000,  # Max concurrent connections
         limit_max_requests=None,  # No request limit per worker
         timeout_keep_alive=5,  # Keep-alive timeout
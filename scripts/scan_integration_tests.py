@@ -4,15 +4,17 @@ Comprehensive Integration Test Scanner
 Runs each test file individually and generates a detailed failure matrix.
 """
 
+import os
 import subprocess
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from typing import List, Dict, Any
 import sys
 
-@dataclass
+@dataclass(slots=True)
 class TestFileResult:
     file_path: str
     file_name: str
@@ -107,8 +109,6 @@ def parse_pytest_output(output: str) -> Dict[str, Any]:
 
 def run_test_file(test_file: Path) -> TestFileResult:
     """Run a single test file and capture results."""
-    print(f"Testing: {test_file.name}...", end=" ", flush=True)
-
     try:
         result = subprocess.run(
             ['pytest', str(test_file), '-v', '--tb=short', '--no-header'],
@@ -134,11 +134,12 @@ def run_test_file(test_file: Path) -> TestFileResult:
             error_type=parsed['error_type']
         )
 
-        print(f"{test_result.status} ({test_result.passed}/{test_result.total})")
+        print(f"Testing: {test_file.name}... {test_result.status} "
+              f"({test_result.passed}/{test_result.total_tests})", flush=True)
         return test_result
 
     except subprocess.TimeoutExpired:
-        print("TIMEOUT")
+        print(f"Testing: {test_file.name}... TIMEOUT", flush=True)
         return TestFileResult(
             file_path=str(test_file),
             file_name=test_file.name,
@@ -153,7 +154,7 @@ def run_test_file(test_file: Path) -> TestFileResult:
             error_type="TIMEOUT"
         )
     except Exception as e:
-        print(f"EXCEPTION: {e}")
+        print(f"Testing: {test_file.name}... EXCEPTION: {e}", flush=True)
         return TestFileResult(
             file_path=str(test_file),
             file_name=test_file.name,
@@ -332,11 +333,10 @@ def main():
     print(f"\nFound {len(test_files)} integration test files")
     print("=" * 80)
 
-    # Run all tests
-    results = []
-    for test_file in test_files:
-        result = run_test_file(test_file)
-        results.append(result)
+    # Run all tests. Each file is its own pytest subprocess against the
+    # in-process ASGI app, so they can run side by side; map keeps file order.
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+        results = list(executor.map(run_test_file, test_files))
 
     print("=" * 80)
     print("\nGenerating report...")
@@ -365,30 +365,36 @@ def main():
     json_path.write_text(json.dumps(json_data, indent=2))
     print(f"JSON data saved to: {json_path.absolute()}")
 
-    # Print summary
-    print("\n" + "=" * 80)
-    print("SUMMARY")
-    print("=" * 80)
-    print(f"Total Test Files: {len(results)}")
-    print(f"Total Tests: {sum(r.total_tests for r in results)}")
-    print(f"Passed: {sum(r.passed for r in results)}")
-    print(f"Failed: {sum(r.failed for r in results)}")
-    print(f"Errors: {sum(r.errors for r in results)}")
-    print(f"Skipped: {sum(r.skipped for r in results)}")
-    print("=" * 80)
-
-    # Print console-friendly table
-    print("\nQuick View:")
-    print("-" * 100)
-    print(f"{'File':<40} {'Status':<12} {'Tests':<8} {'Pass':<6} {'Fail':<6} {'Error':<7} {'Type':<20}")
-    print("-" * 100)
+    # Build the summary and quick view as lines and emit them in a single
+    # write, the same way the markdown report is assembled
+    summary = json_data['summary']
+    lines = [
+        "",
+        "=" * 80,
+        "SUMMARY",
+        "=" * 80,
+        f"Total Test Files: {summary['total_files']}",
+        f"Total Tests: {summary['total_tests']}",
+        f"Passed: {summary['total_passed']}",
+        f"Failed: {summary['total_failed']}",
+        f"Errors: {summary['total_errors']}",
+        f"Skipped: {summary['total_skipped']}",
+        "=" * 80,
+        "",
+        "Quick View:",
+        "-" * 100,
+        f"{'File':<40} {'Status':<12} {'Tests':<8} {'Pass':<6} {'Fail':<6} {'Error':<7} {'Type':<20}",
+        "-" * 100,
+    ]
 
     for result in sorted(results, key=lambda r: (r.status != 'PASSED', r.failed + r.errors, r.file_name)):
         file_display = result.file_name[:38] + '..' if len(result.file_name) > 40 else result.file_name
-        print(f"{file_display:<40} {result.status:<12} {result.total_tests:<8} {result.passed:<6} "
-              f"{result.failed:<6} {result.errors:<7} {result.error_type[:18]:<20}")
+        lines.append(f"{file_display:<40} {result.status:<12} {result.total_tests:<8} {result.passed:<6} "
+                     f"{result.failed:<6} {result.errors:<7} {result.error_type[:18]:<20}")
 
-    print("-" * 100)
+    lines.append("-" * 100)
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
 
 if __name__ == '__main__':
     main()
@@ -30,7 +30,6 @@ import time
 from typing import Any
 
 import pytest
-import requests
 
 from fakeai.config import AppConfig
 from fakeai.config.kv_cache import KVCacheConfig
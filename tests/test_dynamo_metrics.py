@@ -0,0 +1,57 @@
+"""
+Tests for NVIDIA AI-Dynamo metrics collector.
+"""
+
+import time
+
+from fakeai.dynamo_metrics import DynamoMetricsCollector
+
+
+def _complete(collector, request_id, completion_time):
+    """Complete a request and pin its completion time."""
+    collector.start_request(request_id, "gpt-4", "/v1/chat/completions", 10)
+    collector.complete_request(request_id, output_tokens=5)
+    collector._completed_requests[-1].completion_time = completion_time
+
+
+def test_get_recent_requests_window():
+    """Only requests completed within the window are returned, oldest first."""
+    collector = DynamoMetricsCollector()
+    now = time.time()
+
+    _complete(collector, "old-1", now - 120)
+    _complete(collector, "old-2", now - 90)
+    _complete(collector, "new-1", now - 30)
+    _complete(collector, "new-2", now - 1)
+
+    recent = collector.get_recent_requests(60)
+
+    assert [r.request_id for r in recent] == ["new-1", "new-2"]
+
+
+def test_get_recent_requests_empty():
+    """No completed requests yields an empty list."""
+    collector = DynamoMetricsCollector()
+
+    assert collector.get_recent_requests(60) == []
+
+
+def test_get_stats_dict_reads_window_once(monkeypatch):
+    """All windowed sections of get_stats_dict share one window snapshot."""
+    collector = DynamoMetricsCollector()
+    _complete(collector, "req-1", time.time())
+
+    calls = []
+    original = collector.get_recent_requests
+
+    def counting(seconds=60):
+        calls.append(seconds)
+        return original(seconds)
+
+    monkeypatch.setattr(collector, "get_recent_requests", counting)
+
+    stats = collector.get_stats_dict()
+
+    assert calls == [60]
+    assert stats["throughput"]["requests_per_second"] == 1 / 60
+    assert stats["latency"] == collector.get_latency_stats(60)
@@ -138,6 +138,26 @@ class TestFileValidation:
                 purpose="fine-tune",
             )
 
+    async def test_validate_fine_tune_reports_source_line(self, file_manager):
+        """Should report the source line number, counting blank lines."""
+        content = b"""{"messages": [{"role": "user", "content": "Hello"}]}
+
+{"text": "missing messages"}"""
+
+        with pytest.raises(FileValidationError, match="Line 3: Missing 'messages'"):
+            await file_manager.upload_file(
+                file_content=content, filename="train.jsonl", purpose="fine-tune"
+            )
+
+    async def test_validate_fine_tune_invalid_utf8(self, file_manager):
+        """Should reject fine-tuning files that are not valid UTF-8."""
+        with pytest.raises(FileValidationError, match="not valid UTF-8"):
+            await file_manager.upload_file(
+                file_content=b'{"messages": "\xff"}',
+                filename="train.jsonl",
+                purpose="fine-tune",
+            )
+
     async def test_validate_fine_tune_invalid_message_structure(self, file_manager):
         """Should reject fine-tuning JSONL with invalid message structure."""
         invalid_content = b'{"messages": [{"invalid": "structure"}]}'
@@ -83,6 +83,32 @@ class TestFineTuningAPI:
             assert "status" in job
             assert "model" in job
 
+    def test_list_fine_tuning_jobs_after_cursor(self, client_no_auth):
+        """Pages should be newest first and resume after the cursor job."""
+        upload_response = client_no_auth.post("/v1/files")
+        training_file_id = upload_response.json()["id"]
+
+        created = [
+            client_no_auth.post(
+                "/v1/fine_tuning/jobs",
+                json={
+                    "training_file": training_file_id,
+                    "model": "openai/gpt-oss-20b",
+                },
+            ).json()["id"]
+            for _ in range(3)
+        ]
+
+        first = client_no_auth.get("/v1/fine_tuning/jobs", params={"limit": 2}).json()
+        assert [j["id"] for j in first["data"]] == created[::-1][:2]
+        assert first["has_more"] is True
+
+        second = client_no_auth.get(
+            "/v1/fine_tuning/jobs",
+            params={"limit": 2, "after": first["data"][-1]["id"]},
+        ).json()
+        assert second["data"][0]["id"] == created[0]
+
     def test_retrieve_fine_tuning_job(self, client_no_auth):
         """Should retrieve a specific fine-tuning job."""
         # Create a job
@@ -496,3 +522,40 @@ class TestFineTuningIntegration:
             assert "test" in job_data["fine_tuned_model"]
             assert job_data["trained_tokens"] is not None
             assert job_data["trained_tokens"] > 0
+
+
+class TestFineTuningSeed:
+    """Test seeded fine-tuning job processing."""
+
+    async def test_negative_seed_job_succeeds(self, service_no_auth, monkeypatch):
+        """A negative seed should be accepted and replay the same metrics."""
+        from fakeai import fakeai_service
+        from fakeai.models import FineTuningJobRequest
+
+        real_sleep = asyncio.sleep
+
+        async def no_delay(_delay):
+            await real_sleep(0)
+
+        monkeypatch.setattr(fakeai_service.asyncio, "sleep", no_delay)
+
+        training_file = await service_no_auth.upload_file()
+
+        async def checkpoint_metrics(seed):
+            job = await service_no_auth.create_fine_tuning_job(
+                FineTuningJobRequest(
+                    training_file=training_file.id,
+                    model="openai/gpt-oss-20b",
+                    seed=seed,
+                )
+            )
+            await service_no_auth.fine_tuning_tasks[job.id]
+
+            assert job.status == "succeeded"
+            checkpoints = service_no_auth.fine_tuning_checkpoints[job.id]
+            assert checkpoints
+            return [checkpoint.metrics for checkpoint in checkpoints]
+
+        first = await checkpoint_metrics(-7)
+        assert await checkpoint_metrics(-7) == first
+        assert await checkpoint_metrics(-8) != first
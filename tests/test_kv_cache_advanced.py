@@ -602,6 +602,31 @@ class TestAdaptiveRouter:
         assert "recent_distribution" in stats
         assert "config" in stats
 
+    def test_worker_stats_memoised_until_change(self, router_setup):
+        """Per-worker stats are reused until the worker completes a request."""
+        router, tree, manager = router_setup
+
+        tokens = [1, 2, 3, 4, 5, 6, 7, 8]
+        worker_id, _, _ = router.route_request(tokens)
+        router.complete_request(worker_id, tokens, 10, success=True, latency_ms=40.0)
+
+        worker = router.workers[worker_id]
+        worker.to_dict()
+        cached = worker._stats_cache
+        worker.to_dict()
+        assert worker._stats_cache is cached
+        assert router.get_stats()["workers"][worker_id]["total_requests"] == 1
+
+        # Callers get a copy, so changing it leaves the cache intact
+        worker.to_dict()["total_requests"] = 99
+        assert worker.to_dict()["total_requests"] == 1
+
+        router.complete_request(worker_id, tokens, 10, success=False)
+
+        assert worker._stats_cache is None
+        assert worker.to_dict()["success_rate"] == 50.0
+        assert router.get_stats()["workers"][worker_id]["total_requests"] == 2
+
 
 # ============================================================================
 # Cache Coordinator Tests
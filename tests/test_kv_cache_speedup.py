@@ -12,6 +12,7 @@ import pytest
 
 from fakeai.config import AppConfig
 from fakeai.fakeai_service import FakeAIService
+from fakeai.kv_cache import KVCacheMetrics
 from fakeai.models import ChatCompletionRequest, Message, Role
 
 
@@ -263,6 +264,23 @@ async def test_speedup_tracked_in_metrics():
     ), f"Expected baseline 1000ms, got {speedup_stats['avg_baseline_ttft_ms']}ms"
 
 
+def test_speedup_averages_track_last_1000_records():
+    """Test speedup averages cover only the retained records after eviction."""
+    metrics = KVCacheMetrics()
+    for _ in range(1000):
+        metrics.record_speedup("/v1/chat/completions", 1.0, 1.0, 0.0)
+    for _ in range(1000):
+        metrics.record_speedup("/v1/chat/completions", 2.0, 0.5, 1.0)
+
+    speedup_stats = metrics.get_stats()["speedup_stats"]
+
+    assert speedup_stats["total_speedup_records"] == 1000
+    assert speedup_stats["avg_baseline_ttft_ms"] == 2000.0
+    assert speedup_stats["avg_actual_ttft_ms"] == 500.0
+    assert speedup_stats["avg_speedup_ratio"] == 4.0
+    assert speedup_stats["avg_cache_hit_ratio"] == 100.0
+
+
 @pytest.mark.asyncio
 async def test_streaming_and_nonstreaming():
     """Test that both streaming and non-streaming benefit from cache (via routing)."""
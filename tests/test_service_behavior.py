@@ -608,3 +608,14 @@ class TestFileManagementBehavior:
             retrieved = await service_no_auth.get_file(file_id)
 
             assert retrieved.id == file_id
+
+    @pytest.mark.asyncio
+    async def test_file_index_tracks_upload_and_delete(self, service_no_auth):
+        """files_by_id should stay in step with the file list."""
+        uploaded = await service_no_auth.upload_file()
+        assert service_no_auth.files_by_id[uploaded.id] is uploaded
+
+        await service_no_auth.delete_file(uploaded.id)
+
+        assert uploaded.id not in service_no_auth.files_by_id
+        assert set(service_no_auth.files_by_id) == {f.id for f in service_no_auth.files}
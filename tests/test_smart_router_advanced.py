@@ -416,6 +416,18 @@ class TestWorkerHealth:
         assert health.is_healthy
         assert not health.is_degraded
 
+    def test_healthy_workers_follow_health_transitions(self, router):
+        """Test the healthy worker set is refreshed on health transitions."""
+        assert "worker-0" in router._get_healthy_workers()
+
+        for _ in range(10):
+            router.update_worker_health("worker-0", success=False, latency_ms=15000)
+        assert "worker-0" not in router._get_healthy_workers()
+
+        for _ in range(100):
+            router.update_worker_health("worker-0", success=True, latency_ms=50)
+        assert "worker-0" in router._get_healthy_workers()
+
     def test_health_average_latency(self, router):
         """Test health tracks average latency."""
         router.update_worker_health("worker-0", success=True, latency_ms=100)
@@ -43,6 +43,17 @@ class TestTokenTiming:
         assert timing.chunk_size_bytes == 5
         assert timing.sequence_number == 0
 
+    def test_token_timing_has_no_instance_dict(self):
+        """Test TokenTiming uses slots instead of a per-instance __dict__."""
+        timing = TokenTiming(
+            token="hello",
+            timestamp_ns=1000000000,
+            chunk_size_bytes=5,
+            sequence_number=0,
+        )
+
+        assert not hasattr(timing, "__dict__")
+
 
 class TestStreamLifecycle:
     """Test StreamLifecycle dataclass and methods."""
@@ -483,6 +494,82 @@ class TestStreamingMetricsTracker:
         assert stats["token_count"] == 2
         assert stats["ttft_ms"] is not None
 
+    def test_record_tokens_batch(self):
+        """Test recording a batch of tokens matches per-token recording."""
+        tracker = StreamingMetricsTracker()
+        tracker.start_stream("single", "gpt-4", 50)
+        tracker.start_stream("batch", "gpt-4", 50)
+
+        tokens = [("a", 1_000_000_000), ("b", 1_600_000_000), ("c", 1_650_000_000)]
+        for token, timestamp_ns in tokens:
+            tracker.record_token("single", token, timestamp_ns=timestamp_ns)
+        tracker.record_tokens("batch", tokens)
+
+        single = tracker.get_stream_stats("single")
+        batch = tracker.get_stream_stats("batch")
+        assert batch["token_count"] == 3
+        assert batch["stall_events"] == single["stall_events"] == 1
+
+    def test_max_tokens_per_stream_bounds_retention(self):
+        """Test that only the most recent token timings are retained."""
+        tracker = StreamingMetricsTracker(max_tokens_per_stream=4)
+        tracker.start_stream("test-123", "gpt-4", 50)
+
+        for i in range(10):
+            tracker.record_token(
+                "test-123", "tok", timestamp_ns=1_000_000_000 + i * 10_000_000
+            )
+        tracker.record_chunk_sent("test-123", 30)
+
+        stream = tracker._get_shard("test-123")[0]["test-123"]
+        assert len(stream.tokens) == 4
+        assert [t.sequence_number for t in stream.tokens] == [6, 7, 8, 9]
+
+        stats = tracker.get_stream_stats("test-123")
+        assert stats["token_count"] == 10
+        assert stats["tokens_per_second"] == pytest.approx(100.0)
+        assert stats["network_overhead_percent"] == 0.0
+
+    @pytest.mark.parametrize("window", [0, -1])
+    def test_max_tokens_per_stream_rejects_empty_window(self, window):
+        """Test that a token window smaller than one is rejected."""
+        with pytest.raises(ValueError, match="max_tokens_per_stream"):
+            StreamingMetricsTracker(max_tokens_per_stream=window)
+
+    def test_max_tokens_per_stream_window_of_one(self):
+        """Test that a single-token window keeps only the latest timing."""
+        tracker = StreamingMetricsTracker(max_tokens_per_stream=1)
+        tracker.start_stream("test-123", "gpt-4", 50)
+
+        for i in range(3):
+            tracker.record_token(
+                "test-123", "tok", timestamp_ns=1_000_000_000 + i * 10_000_000
+            )
+
+        stream = tracker._get_shard("test-123")[0]["test-123"]
+        assert [t.sequence_number for t in stream.tokens] == [2]
+        assert stream.dropped_tokens == 2
+        assert tracker.get_stream_stats("test-123")["token_count"] == 3
+
+    def test_disabled_tracker_records_nothing(self):
+        """Test that a disabled tracker ignores recording calls."""
+        tracker = StreamingMetricsTracker(enabled=False)
+
+        tracker.start_stream("test-123", "gpt-4", 50, client_id="client-1")
+        tracker.record_token("test-123", "hello")
+        tracker.record_chunk_sent("test-123", 100)
+        tracker.record_backpressure("test-123")
+        tracker.complete_stream("test-123", "stop")
+
+        assert tracker.get_active_stream_count() == 0
+        assert tracker.get_completed_stream_count() == 0
+        assert tracker.get_all_clients() == []
+
+        # Re-enabling resumes tracking
+        tracker.enabled = True
+        tracker.start_stream("test-456", "gpt-4", 50)
+        assert tracker.get_active_stream_count() == 1
+
     def test_record_chunk_sent(self):
         """Test recording network chunks."""
         tracker = StreamingMetricsTracker()
@@ -657,6 +744,49 @@ class TestStreamingMetricsTracker:
         # Check client metrics
         assert "client_metrics" in report
 
+    def test_quality_report_refreshes_after_changes(self):
+        """Test the cached quality report tracks new completions and active streams."""
+        tracker = StreamingMetricsTracker()
+
+        tracker.start_stream("done-1", model="gpt-4", prompt_tokens=50)
+        tracker.record_token("done-1", "token", timestamp_ns=1000000000)
+        tracker.complete_stream("done-1", "stop")
+
+        report = tracker.get_streaming_quality_report()
+        assert report["summary"]["total_streams"] == 1
+        assert report["summary"]["active_streams"] == 0
+
+        tracker.start_stream("active-1", model="gpt-4", prompt_tokens=50)
+        report = tracker.get_streaming_quality_report()
+        assert report["summary"]["total_streams"] == 1
+        assert report["summary"]["active_streams"] == 1
+
+        tracker.start_stream("done-2", model="gpt-4", prompt_tokens=50)
+        tracker.cancel_stream("done-2", error_message="client disconnected")
+        report = tracker.get_streaming_quality_report()
+        assert report["summary"]["total_streams"] == 2
+        assert report["summary"]["failed_streams"] == 1
+
+        tracker.record_timeout("client-1")
+        report = tracker.get_streaming_quality_report()
+        assert report["client_metrics"]["total_timeouts"] == 1
+
+    def test_quality_report_copies_are_independent(self):
+        """Test that mutating a returned report leaves the cached one intact."""
+        tracker = StreamingMetricsTracker()
+
+        tracker.start_stream("done-1", model="gpt-4", prompt_tokens=50)
+        tracker.record_token("done-1", "token", timestamp_ns=1000000000)
+        tracker.complete_stream("done-1", "stop")
+
+        report = tracker.get_streaming_quality_report()
+        report["summary"]["total_streams"] = 99
+        report["client_metrics"]["total_timeouts"] = 99
+
+        report = tracker.get_streaming_quality_report()
+        assert report["summary"]["total_streams"] == 1
+        assert report["client_metrics"]["total_timeouts"] == 0
+
     def test_correlations(self):
         """Test correlation calculations."""
         tracker = StreamingMetricsTracker()
@@ -705,6 +835,22 @@ class TestStreamingMetricsTracker:
         # Should only have 5 active streams
         assert tracker.get_active_stream_count() == 5
 
+    def test_max_active_streams_drops_oldest(self):
+        """Test that the oldest stream is dropped across shards."""
+        tracker = StreamingMetricsTracker(max_active_streams=5)
+
+        for i in range(10):
+            tracker.start_stream(
+                stream_id=f"test-{i}",
+                model="gpt-4",
+                prompt_tokens=50,
+            )
+
+        for i in range(5):
+            assert tracker.get_stream_stats(f"test-{i}") is None
+        for i in range(5, 10):
+            assert tracker.get_stream_stats(f"test-{i}")["status"] == "active"
+
     def test_max_completed_streams_limit(self):
         """Test that max completed streams limit is enforced."""
         tracker = StreamingMetricsTracker(max_completed_streams=3)
@@ -723,6 +869,67 @@ class TestStreamingMetricsTracker:
         # Should only keep last 3
         assert tracker.get_completed_stream_count() == 3
 
+    def test_get_stream_stats_history(self):
+        """Test looking up completed, failed and evicted streams."""
+        tracker = StreamingMetricsTracker(max_completed_streams=2)
+
+        for i in range(3):
+            stream_id = f"test-{i}"
+            tracker.start_stream(stream_id=stream_id, model="gpt-4", prompt_tokens=50)
+            tracker.complete_stream(stream_id, "stop")
+
+        tracker.start_stream(stream_id="failed-1", model="gpt-4", prompt_tokens=50)
+        tracker.cancel_stream("failed-1", error_message="boom")
+
+        assert tracker.get_stream_stats("test-0") is None
+        assert tracker.get_stream_stats("test-1")["status"] == "completed"
+        assert tracker.get_stream_stats("test-2")["status"] == "completed"
+        assert tracker.get_stream_stats("failed-1")["status"] == "failed"
+
+        tracker.clear_history()
+
+        assert tracker.get_stream_stats("test-2") is None
+
+    def test_finished_stream_stats_computed_once(self):
+        """Test that stats of a finished stream are cached on the lifecycle."""
+        tracker = StreamingMetricsTracker()
+        tracker.start_stream(stream_id="test-1", model="gpt-4", prompt_tokens=50)
+        tracker.record_token("test-1", "hello")
+        tracker.complete_stream("test-1", "stop")
+
+        tracker.get_streaming_quality_report()
+        stream = tracker._completed_streams[0]
+        assert stream.finished_stats is not None
+
+        stats = tracker.get_stream_stats("test-1")
+        assert stats == stream.finished_stats
+        assert stats is not stream.finished_stats
+
+    def test_recycled_stream_starts_clean(self):
+        """Test that a stream reusing an evicted lifecycle has no stale state."""
+        tracker = StreamingMetricsTracker(max_completed_streams=1)
+
+        for i in range(3):
+            stream_id = f"test-{i}"
+            tracker.start_stream(
+                stream_id=stream_id, model="gpt-4", prompt_tokens=50, temperature=0.5
+            )
+            tracker.record_token(stream_id, "token", timestamp_ns=1000000000)
+            tracker.record_chunk_sent(stream_id, 100)
+            tracker.complete_stream(stream_id, "stop")
+
+        tracker.start_stream(stream_id="fresh", model="gpt-3.5", prompt_tokens=10)
+
+        stats = tracker.get_stream_stats("fresh")
+        assert stats["status"] == "active"
+        assert stats["model"] == "gpt-3.5"
+        assert stats["prompt_tokens"] == 10
+        assert stats["token_count"] == 0
+        assert stats["chunks_sent"] == 0
+        assert stats["finish_reason"] is None
+        assert stats["temperature"] is None
+        assert tracker.get_stream_stats("test-2")["status"] == "completed"
+
     def test_clear_history(self):
         """Test clearing history."""
         tracker = StreamingMetricsTracker()